@@ -0,0 +1,15 @@
+"""
+Put the repository's examples/ and scripts/ directories on sys.path.
+
+The benchmarks run as plain scripts from benchmarks/, so they import this
+module before anything from `_shared` or the scripts (catalog, ...).
+"""
+
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+for directory in (ROOT_DIR / 'examples', ROOT_DIR / 'scripts'):
+    if str(directory) not in sys.path:
+        sys.path.insert(0, str(directory))
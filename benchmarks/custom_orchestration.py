@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark custom-orchestration's DagAgent against a SequentialAgent.
+
+The example's five launch-brief agents get fake models with different
+latencies, so the critical path is not simply the longest single node.
+Compared over three turns of one session:
+
+1. The first request: every node runs (DagAgent overlaps independent ones)
+2. Only the audience changes: nodes that don't depend on it are skipped
+3. The same request again: every node is skipped
+
+The SequentialAgent runs all nodes in dependency order on every turn.
+The script exits with status 1 if the DagAgent reruns the wrong nodes.
+
+Usage:
+    python benchmarks/custom_orchestration.py
+    python benchmarks/custom_orchestration.py --latency 0.5
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from typing import Any, Dict, List
+
+import _paths  # Puts examples/ and scripts/ on sys.path
+from catalog import ExampleCatalog
+from fake_llm import use_fake_model
+from run_examples import load_agent_module
+
+from google.adk.agents import BaseAgent, SequentialAgent
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+
+# Fake model time to first token per node, as a multiple of --latency
+NODE_LATENCY = {
+    "market_analyst": 2.0,
+    "audience_researcher": 1.0,
+    "positioning_writer": 1.0,
+    "pricing_analyst": 0.5,
+    "brief_writer": 1.5,
+}
+
+TURNS = [
+    ("First request", {"product": "A solar-powered hiking backpack that charges phones", "audience": "day hikers"}),
+    ("Audience changed", {"audience": "budget-conscious students"}),
+    ("Same request again", {"audience": "budget-conscious students"}),
+]
+
+# Nodes that must run on each turn; the rest must be skipped
+EXPECTED_RUNS = [
+    set(NODE_LATENCY),
+    {"audience_researcher", "positioning_writer", "brief_writer"},
+    set(),
+]
+
+
+def make_nodes(module, args) -> List[BaseAgent]:
+    nodes = module.make_nodes()
+    for node in nodes:
+        use_fake_model(node, latency=args.latency * NODE_LATENCY[node.name],
+                       tokens_per_second=args.tokens_per_second, output_tokens=args.output_tokens)
+    return nodes
+
+
+async def run_turns(agent: BaseAgent, initial_state: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Send TURNS as JSON messages in one session; returns wall time and DagAgent stats per turn"""
+    runner = InMemoryRunner(agent=agent, app_name='custom_orchestration_bench')
+    session = await runner.session_service.create_session(app_name=runner.app_name, user_id='bench',
+                                                          state=initial_state)
+    results = []
+    for _, values in TURNS:
+        message = types.Content(role='user', parts=[types.Part(text=json.dumps(values))])
+        start = time.perf_counter()
+        stats = None
+        async for event in runner.run_async(user_id='bench', session_id=session.id, new_message=message):
+            if event.actions and event.actions.state_delta.get('dag_stats'):
+                stats = event.actions.state_delta['dag_stats']
+        results.append({'wall': time.perf_counter() - start, 'stats': stats})
+    return results
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Benchmark dependency-graph vs. sequential orchestration')
+    parser.add_argument('--latency', type=float, default=0.2,
+                        help='Base fake model time to first token in seconds (default: 0.2)')
+    parser.add_argument('--tokens-per-second', type=float, default=400.0,
+                        help='Fake model output rate (default: 400)')
+    parser.add_argument('--output-tokens', type=int, default=40,
+                        help='Words per fake reply (default: 40)')
+    args = parser.parse_args()
+
+    module = load_agent_module(ExampleCatalog()['custom-orchestration'])
+    template = module.root_agent
+
+    # SequentialAgent has no JSON handling: give it the final inputs up front
+    nodes = {node.name: node for node in make_nodes(module, args)}
+    sequential = SequentialAgent(name='sequential', sub_agents=[nodes[name] for name in template.order])
+    sequential_results = asyncio.run(run_turns(sequential, {**TURNS[0][1], **TURNS[1][1]}))
+
+    dag = module.DagAgent(name=template.name, sub_agents=make_nodes(module, args),
+                          inputs=template.inputs, message_key=template.message_key)
+    dag_results = asyncio.run(run_turns(dag, {}))
+
+    print(f"{'Turn':<20} {'Sequential':>11} {'DagAgent':>9} {'Ran':>4} {'Skipped':>8}  Critical path")
+    failed = False
+    for (label, _), expected, seq, result in zip(TURNS, EXPECTED_RUNS, sequential_results, dag_results):
+        stats = result['stats']
+        ran = {name for name, node in stats['nodes'].items() if node['status'] == 'ran'}
+        path = ' → '.join(f"{name} ({stats['nodes'][name]['seconds']:.2f}s)" for name in stats['critical_path'])
+        print(f"{label:<20} {seq['wall']:>10.2f}s {result['wall']:>8.2f}s {stats['ran']:>4} {stats['skipped']:>8}  "
+              f"{path if stats['ran'] else '-'}")
+        if ran != expected:
+            print(f"   ❌ ran {sorted(ran)}, expected {sorted(expected)}")
+            failed = True
+
+    first = dag_results[0]['stats']
+    print(f"\nFirst turn timeline (bottleneck: {first['bottleneck']}):")
+    for name in template.order:
+        node = first['nodes'][name]
+        print(f"   {name:<20} {node['start']:>6.2f}s → {node['end']:>6.2f}s")
+
+    if failed:
+        return 1
+    print(f"\n✅ Three turns: {sum(r['wall'] for r in sequential_results):.2f}s sequential, "
+          f"{sum(r['wall'] for r in dag_results):.2f}s with DagAgent")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
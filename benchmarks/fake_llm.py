@@ -0,0 +1,248 @@
+"""
+Deterministic local stand-in for Gemini, for load-testing examples offline.
+
+FakeLlm is an ADK BaseLlm that sleeps for a configurable time to first
+token plus output_tokens / tokens_per_second, then answers with text
+derived from a hash of the prompt, so the same request always gets the
+same reply. When the request asks for structured output (an agent with
+`output_schema`), the reply is a JSON instance of that schema.
+
+Time spent inside the fake model is added to the `llm_time` counters of
+the calling context, so a harness can subtract it from a turn's latency
+to get the framework overhead.
+
+Usage:
+    from fake_llm import FakeLlm, use_fake_model, track_llm_time
+
+    use_fake_model(root_agent, latency=0.2, tokens_per_second=100)
+    with track_llm_time() as llm:
+        ...  # run a turn
+    print(llm.seconds, llm.calls)
+"""
+
+import asyncio
+import enum
+import hashlib
+import json
+import time
+import typing
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import UnionType
+from typing import Any, AsyncGenerator, Callable, Iterator, List, Optional, Tuple, Union
+
+import _paths  # Puts examples/ and scripts/ on sys.path
+
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse
+from google.genai import types
+from pydantic import BaseModel
+
+from _shared.common_tools import estimate_tokens
+
+
+# Words the fake replies are built from, picked by the prompt's hash
+VOCABULARY = (
+    "agent", "model", "session", "state", "tool", "event", "runner", "instruction",
+    "the", "a", "with", "for", "and", "to", "of", "in", "returns", "uses", "calls", "stores",
+)
+
+
+class LlmTime:
+    """Time and calls spent in fake models within one tracked context"""
+
+    def __init__(self):
+        self.calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.intervals: List[Tuple[float, float]] = []
+
+    @property
+    def seconds(self) -> float:
+        """Wall time with at least one model call in flight (overlapping calls count once)"""
+        total, covered_until = 0.0, float('-inf')
+        for start, end in sorted(self.intervals):
+            if end > covered_until:
+                total += end - max(start, covered_until)
+                covered_until = end
+        return total
+
+
+_llm_time: ContextVar[Optional[LlmTime]] = ContextVar('llm_time', default=None)
+
+
+@contextmanager
+def track_llm_time() -> Iterator[LlmTime]:
+    """
+    Count fake model time for everything run in this context.
+
+    Agents that spawn tasks (e.g. ParallelAgent) copy the context, so their
+    calls land in the same counters.
+    """
+    counters = LlmTime()
+    token = _llm_time.set(counters)
+    try:
+        yield counters
+    finally:
+        _llm_time.reset(token)
+
+
+def sample_value(annotation: Any) -> Any:
+    """A deterministic value matching a type annotation (for pydantic output schemas)"""
+    origin = typing.get_origin(annotation)
+    args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+
+    if origin is typing.Literal:
+        return args[0]
+    if origin in (typing.Union, UnionType):
+        return sample_value(args[0]) if args else None
+    if origin in (list, tuple, set, frozenset):
+        return [sample_value(args[0])] if args else []
+    if origin is dict:
+        return {}
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return {name: sample_value(field.annotation) for name, field in annotation.model_fields.items()}
+        if issubclass(annotation, enum.Enum):
+            return next(iter(annotation)).value
+        if issubclass(annotation, bool):
+            return True
+        if issubclass(annotation, int):
+            return 1
+        if issubclass(annotation, float):
+            return 0.5
+        if issubclass(annotation, str):
+            return "fake"
+    return None
+
+
+def _request_text(llm_request: LlmRequest) -> str:
+    """System instruction plus every text part of the conversation"""
+    pieces = []
+    config = llm_request.config
+    if config is not None and isinstance(config.system_instruction, str):
+        pieces.append(config.system_instruction)
+    for content in llm_request.contents or []:
+        for part in content.parts or []:
+            if part.text:
+                pieces.append(part.text)
+    return '\n'.join(pieces)
+
+
+class FakeLlm(BaseLlm):
+    """
+    A model that answers locally after a simulated generation delay.
+
+    Attributes:
+        latency: Seconds before the first token
+        tokens_per_second: Output generation rate
+        output_tokens: Words in each plain-text reply
+        respond: Optional callable(llm_request) returning the reply text, or
+            a types.Content for replies such as function calls
+    """
+
+    model: str = "fake-llm"
+    latency: float = 0.05
+    tokens_per_second: float = 200.0
+    output_tokens: int = 64
+    respond: Optional[Callable[[LlmRequest], Union[str, types.Content]]] = None
+
+    @classmethod
+    def supported_models(cls) -> List[str]:
+        return [r"fake-.*"]
+
+    def reply_text(self, llm_request: LlmRequest, prompt: str) -> Union[str, types.Content]:
+        """The reply for a request: scripted, a schema instance, or hashed words"""
+        if self.respond is not None:
+            return self.respond(llm_request)
+
+        schema = llm_request.config.response_schema if llm_request.config else None
+        if isinstance(schema, type) and issubclass(schema, BaseModel):
+            return json.dumps(sample_value(schema))
+
+        digest = hashlib.sha256(prompt.encode('utf-8')).digest()
+        return ' '.join(VOCABULARY[digest[i % len(digest)] % len(VOCABULARY)]
+                        for i in range(self.output_tokens))
+
+    async def generate_content_async(self, llm_request: LlmRequest,
+                                     stream: bool = False) -> AsyncGenerator[LlmResponse, None]:
+        start = time.perf_counter()
+        prompt = _request_text(llm_request)
+        reply = self.reply_text(llm_request, prompt)
+        if isinstance(reply, types.Content):
+            text, content = '', reply
+        else:
+            text, content = reply, types.Content(role='model', parts=[types.Part(text=reply)])
+        input_tokens = estimate_tokens(prompt)
+        output_tokens = max(1, estimate_tokens(text))
+        usage = types.GenerateContentResponseUsageMetadata(
+            prompt_token_count=input_tokens,
+            candidates_token_count=output_tokens,
+            total_token_count=input_tokens + output_tokens,
+        )
+
+        await asyncio.sleep(self.latency)
+        counters = _llm_time.get()
+
+        if stream and text:
+            words = text.split(' ')
+            chunk = max(1, len(words) // 4)
+            for i in range(0, len(words), chunk):
+                piece = ' '.join(words[i:i + chunk]) + (' ' if i + chunk < len(words) else '')
+                await asyncio.sleep(estimate_tokens(piece) / self.tokens_per_second)
+                yield LlmResponse(content=types.Content(role='model', parts=[types.Part(text=piece)]),
+                                  partial=True)
+        else:
+            await asyncio.sleep(output_tokens / self.tokens_per_second)
+
+        if counters is not None:
+            counters.intervals.append((start, time.perf_counter()))
+            counters.calls += 1
+            counters.input_tokens += input_tokens
+            counters.output_tokens += output_tokens
+
+        yield LlmResponse(
+            content=content,
+            usage_metadata=usage,
+            turn_complete=True,
+        )
+
+
+def walk_agents(agent: BaseAgent) -> Iterator[BaseAgent]:
+    """An agent, its sub-agents and agents wrapped in AgentTools, each once"""
+    seen = set()
+    stack = [agent]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        yield current
+        stack.extend(current.sub_agents)
+        for tool in getattr(current, 'tools', None) or []:
+            wrapped = getattr(tool, 'agent', None)
+            if isinstance(wrapped, BaseAgent):
+                stack.append(wrapped)
+
+
+def use_fake_model(agent: BaseAgent, **settings: Any) -> int:
+    """
+    Replace the model of every LLM agent in a tree with a FakeLlm.
+
+    Args:
+        agent: Root agent
+        **settings: FakeLlm fields (latency, tokens_per_second, output_tokens, respond)
+
+    Returns:
+        Number of agents whose model was replaced
+    """
+    replaced = 0
+    for current in walk_agents(agent):
+        if isinstance(current, LlmAgent):
+            # Keep the model name: built-in tools such as google_search check it
+            if isinstance(current.model, str) and current.model:
+                current.model = FakeLlm(model=current.model, **settings)
+            else:
+                current.model = FakeLlm(**settings)
+            replaced += 1
+    return replaced
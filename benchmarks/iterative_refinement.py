@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Benchmark iterative-refinement's RefinementLoopAgent against a fixed LoopAgent.
+
+Both loops use the example's writer and critic, driven by a scripted
+FakeLlm that converges at a known round: each revision changes fewer
+words than the one before (all of them, then 16, 6, 1, then none) while
+the critic's score levels off. Compared:
+
+- LoopAgent: writer + critic for a fixed max_iterations
+- RefinementLoopAgent: the example's stopping rules
+- RefinementLoopAgent again on the same task: critiques come from the memo
+- RefinementLoopAgent with a token budget that allows about two rounds
+
+The script checks that the adaptive loop stops at the scripted round and
+exits with status 1 if it doesn't.
+
+Usage:
+    python benchmarks/iterative_refinement.py
+    python benchmarks/iterative_refinement.py --latency 0.5 --max-iterations 8
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import sys
+import time
+from typing import Any, Dict, List
+
+import _paths  # Puts examples/ and scripts/ on sys.path
+from catalog import ExampleCatalog
+from fake_llm import track_llm_time, use_fake_model
+from run_examples import load_agent_module
+
+from google.adk.agents import BaseAgent, LoopAgent
+from google.adk.models import LlmRequest
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+
+TASK = "Explain to a new engineer why our service retries failed requests with exponential backoff."
+
+WORDS = ("retries", "spread", "load", "after", "a", "failure", "so", "the", "service", "recovers",
+         "instead", "of", "being", "flooded", "by", "every", "client", "at", "once", "waiting",
+         "longer", "each", "time", "gives", "it", "room", "jitter", "avoids", "synchronized", "bursts")
+DRAFT_WORDS = 48
+
+# Words each revision rewrites (the first N); from round 5 on, nothing changes
+EDITS = {1: DRAFT_WORDS, 2: 16, 3: 6, 4: 1}
+# Critic score per draft version
+SCORES = {1: 5.0, 2: 7.0, 3: 8.0, 4: 8.2}
+# min_change is 0.05: round 4's one-word revision is below it
+CONVERGES_AT = 4
+
+
+def scripted_draft(version: int) -> str:
+    """Draft `version`: word i is picked by the last revision that rewrote it"""
+    words = []
+    for i in range(DRAFT_WORDS):
+        edited = max((v for v in range(1, version + 1) if EDITS.get(v, 0) > i), default=1)
+        words.append(WORDS[(i + 7 * edited) % len(WORDS)])
+    return f"Draft v{version}: " + ' '.join(words)
+
+
+def _draft_version(llm_request: LlmRequest) -> int:
+    """The version of the draft in the request's instruction, or 0 if there is none"""
+    instruction = llm_request.config.system_instruction if llm_request.config else ''
+    match = re.search(r"Draft v(\d+):", str(instruction or ''))
+    return int(match.group(1)) if match else 0
+
+
+def fake_writer(llm_request: LlmRequest) -> str:
+    return scripted_draft(_draft_version(llm_request) + 1)
+
+
+def fake_critic(llm_request: LlmRequest) -> str:
+    version = _draft_version(llm_request)
+    score = SCORES.get(version, SCORES[max(SCORES)])
+    return json.dumps({"score": score, "feedback": f"Tighten the wording of draft {version}."})
+
+
+def make_agents(module, args) -> List[BaseAgent]:
+    settings = dict(latency=args.latency, tokens_per_second=args.tokens_per_second)
+    writer, critic = module.make_writer(), module.make_critic()
+    use_fake_model(writer, respond=fake_writer, **settings)
+    use_fake_model(critic, respond=fake_critic, **settings)
+    return [writer, critic]
+
+
+async def run(runner: InMemoryRunner, state: Dict[str, Any]) -> Dict[str, Any]:
+    """One turn with TASK in a new session; returns wall time, model usage and the final state"""
+    session = await runner.session_service.create_session(app_name=runner.app_name, user_id='bench', state=state)
+    message = types.Content(role='user', parts=[types.Part(text=TASK)])
+    start = time.perf_counter()
+    with track_llm_time() as llm:
+        async for _ in runner.run_async(user_id='bench', session_id=session.id, new_message=message):
+            pass
+    wall = time.perf_counter() - start
+    session = await runner.session_service.get_session(app_name=runner.app_name, user_id='bench',
+                                                       session_id=session.id)
+    return {'wall': wall, 'calls': llm.calls, 'tokens': llm.input_tokens + llm.output_tokens,
+            'state': session.state}
+
+
+def print_row(label: str, result: Dict[str, Any], rounds: int, stop_reason: str):
+    score = (result['state'].get('critique') or {}).get('score', 0.0)
+    stats = result['state'].get('refinement_stats')
+    if stats:
+        score = stats['final_score']
+    print(f"{label:<40} {rounds:>6} {result['calls']:>6} {result['tokens']:>7} "
+          f"{result['wall']:>7.2f}s {score:>6.1f}  {stop_reason}")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Benchmark adaptive vs. fixed refinement loops')
+    parser.add_argument('--max-iterations', type=int, default=5,
+                        help='Rounds for the fixed LoopAgent and the cap for the adaptive loop (default: 5)')
+    parser.add_argument('--latency', type=float, default=0.2,
+                        help='Fake model time to first token in seconds (default: 0.2)')
+    parser.add_argument('--tokens-per-second', type=float, default=400.0,
+                        help='Fake model output rate (default: 400)')
+    args = parser.parse_args()
+
+    module = load_agent_module(ExampleCatalog()['iterative-refinement'])
+    print(f"{'Loop':<40} {'Rounds':>6} {'Calls':>6} {'Tokens':>7} {'Time':>8} {'Score':>6}  Stop")
+
+    fixed = LoopAgent(name='fixed_loop', sub_agents=make_agents(module, args), max_iterations=args.max_iterations)
+    runner = InMemoryRunner(agent=fixed, app_name='iterative_refinement_bench')
+    baseline = asyncio.run(run(runner, {'task': TASK}))
+    print_row(f'LoopAgent, max_iterations={args.max_iterations}', baseline, args.max_iterations, 'max_iterations')
+
+    template = module.root_agent
+    settings = dict(min_change=template.min_change, min_improvement=template.min_improvement,
+                    target_score=template.target_score, max_iterations=args.max_iterations)
+    adaptive = module.RefinementLoopAgent(name=template.name, sub_agents=make_agents(module, args), **settings)
+    runner = InMemoryRunner(agent=adaptive, app_name='iterative_refinement_bench')
+
+    async def twice():
+        return await run(runner, {}), await run(runner, {})
+    first, repeat = asyncio.run(twice())
+    for label, result in (('RefinementLoopAgent', first), ('RefinementLoopAgent, same task again', repeat)):
+        stats = result['state']['refinement_stats']
+        print_row(label, result, stats['iterations'], stats['stop_reason'])
+
+    budget = first['state']['refinement_stats']['rounds'][0]['tokens'] * 2
+    budgeted = module.RefinementLoopAgent(name=template.name, sub_agents=make_agents(module, args),
+                                          token_budget=budget, **settings)
+    result = asyncio.run(run(InMemoryRunner(agent=budgeted, app_name='iterative_refinement_bench'), {}))
+    stats = result['state']['refinement_stats']
+    print_row(f'RefinementLoopAgent, {budget} token budget', result, stats['iterations'], stats['stop_reason'])
+
+    print("\nPer round (first adaptive run):")
+    for round_stats in first['state']['refinement_stats']['rounds']:
+        print(f"   round {round_stats['iteration']}: change {round_stats['change']:.3f}  "
+              f"score {round_stats['score']:.1f}  {round_stats['llm_calls']} calls  "
+              f"{round_stats['tokens']} tokens  {round_stats['seconds']:.2f}s"
+              f"{'  (critique from memo)' if round_stats['critic_cached'] else ''}")
+
+    stats, repeat_stats = first['state']['refinement_stats'], repeat['state']['refinement_stats']
+    if stats['iterations'] != CONVERGES_AT or stats['stop_reason'] != 'converged':
+        print(f"\n❌ Expected to converge at round {CONVERGES_AT}, "
+              f"stopped at round {stats['iterations']} ({stats['stop_reason']})")
+        return 1
+    if repeat_stats['critic_calls'] != 0:
+        print(f"\n❌ Repeated task called the critic {repeat_stats['critic_calls']} times")
+        return 1
+    print(f"\n✅ Converged at round {CONVERGES_AT} as scripted: {baseline['calls']} → {first['calls']} model calls, "
+          f"{baseline['wall']:.2f}s → {first['wall']:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
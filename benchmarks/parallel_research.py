@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark parallel-research's FanOutAgent against a SequentialAgent.
+
+For a growing number of research branches N, one turn is run through
+InMemoryRunner with every model replaced by FakeLlm, and the wall time of
+three orchestrations is compared:
+
+- SequentialAgent: branches one after another (grows linearly with N)
+- FanOutAgent: all branches concurrently (about one branch's time)
+- FanOutAgent with quorum N-1 while one branch is 10x slower than the
+  rest: the straggler is cancelled instead of setting the wall time
+
+Usage:
+    python benchmarks/parallel_research.py
+    python benchmarks/parallel_research.py --branches 2 4 8 16 32 --max-concurrency 8
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from typing import Optional
+
+import _paths  # Puts examples/ and scripts/ on sys.path
+from catalog import ExampleCatalog
+from fake_llm import use_fake_model
+from run_examples import load_agent_module
+
+from google.adk.agents import BaseAgent, SequentialAgent
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+
+async def run_turn(agent: BaseAgent) -> tuple:
+    """One turn through a fresh runner; returns (seconds, final session state)"""
+    runner = InMemoryRunner(agent=agent, app_name='parallel_research_bench')
+    session = await runner.session_service.create_session(app_name=runner.app_name, user_id='bench')
+    message = types.Content(role='user', parts=[types.Part(text='What is the state of solid-state batteries?')])
+
+    start = time.perf_counter()
+    async for _ in runner.run_async(user_id='bench', session_id=session.id, new_message=message):
+        pass
+    elapsed = time.perf_counter() - start
+
+    session = await runner.session_service.get_session(app_name=runner.app_name, user_id='bench',
+                                                       session_id=session.id)
+    return elapsed, session.state
+
+
+def build(module, kind: str, branches: int, args, quorum: Optional[int] = None) -> BaseAgent:
+    """A fresh orchestrator over `branches` fake research agents"""
+    researchers = [module.make_researcher(f"angle{i}", f"angle {i}") for i in range(branches)]
+    for researcher in researchers:
+        use_fake_model(researcher, latency=args.latency, output_tokens=args.output_tokens,
+                       tokens_per_second=args.tokens_per_second)
+    if quorum:
+        # One straggler, 10x slower than the rest
+        use_fake_model(researchers[-1], latency=args.latency * 10, output_tokens=args.output_tokens,
+                       tokens_per_second=args.tokens_per_second)
+
+    if kind == 'sequential':
+        return SequentialAgent(name='sequential_research', sub_agents=researchers)
+    return module.FanOutAgent(name='research_team', sub_agents=researchers,
+                              max_concurrency=args.max_concurrency or branches,
+                              branch_timeout=60.0, quorum=quorum, status_key='research_status')
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Benchmark fan-out vs. sequential research branches')
+    parser.add_argument('--branches', type=int, nargs='+', default=[2, 4, 8, 16],
+                        help='Branch counts to measure (default: 2 4 8 16)')
+    parser.add_argument('--max-concurrency', type=int,
+                        help='FanOutAgent concurrency limit (default: all branches at once)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs per measurement; the median is reported (default: 3)')
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help='Fake model time to first token in seconds (default: 0.05)')
+    parser.add_argument('--tokens-per-second', type=float, default=400.0,
+                        help='Fake model output rate (default: 400)')
+    parser.add_argument('--output-tokens', type=int, default=32,
+                        help='Words per fake reply (default: 32)')
+    args = parser.parse_args()
+
+    module = load_agent_module(ExampleCatalog()['parallel-research'])
+
+    print(f"{'Branches':>8} {'Sequential':>12} {'Fan-out':>10} {'Speedup':>8} {'Quorum N-1':>11}  (ms)")
+    print("-" * 60)
+    for branches in args.branches:
+        timings = {}
+        for kind, quorum in (('sequential', None), ('fan_out', None), ('quorum', max(1, branches - 1))):
+            runs = []
+            for _ in range(args.repeat):
+                agent = build(module, 'sequential' if kind == 'sequential' else 'fan_out', branches, args,
+                              quorum if kind == 'quorum' else None)
+                elapsed, state = asyncio.run(run_turn(agent))
+                runs.append(elapsed)
+            timings[kind] = statistics.median(runs) * 1000
+
+            if kind != 'sequential':
+                written = sum(1 for i in range(branches) if state.get(f"research_angle{i}"))
+                expected = branches - 1 if kind == 'quorum' and branches > 1 else branches
+                if written < expected:
+                    print(f"❌ {kind}: only {written}/{branches} branches wrote their output to state")
+                    return 1
+
+        print(f"{branches:>8} {timings['sequential']:>12.1f} {timings['fan_out']:>10.1f} "
+              f"{timings['sequential'] / timings['fan_out']:>7.1f}x {timings['quorum']:>11.1f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark process-pipeline's PipelineAgent against sequential chaining.
+
+A batch of synthetic documents goes through extract → classify →
+summarize with every model replaced by FakeLlm. The stages get different
+latencies (extraction is slowest) so the bottleneck shows up in the
+per-stage counters. Compared:
+
+- Sequential: a SequentialAgent of the three stages, one document per turn
+- Pipelined, 1 worker per stage: stages overlap, nothing else changes
+- Pipelined, the example's stage_concurrency
+
+Usage:
+    python benchmarks/process_pipeline.py
+    python benchmarks/process_pipeline.py --items 500 --queue-size 16
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from typing import Any, Dict, List
+
+import _paths  # Puts examples/ and scripts/ on sys.path
+from catalog import ExampleCatalog
+from fake_llm import use_fake_model
+from run_examples import load_agent_module
+
+from google.adk.agents import BaseAgent, RunConfig, SequentialAgent
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+
+# Fake model time to first token per stage, as a multiple of --latency
+STAGE_LATENCY = {"extractor": 2.0, "classifier": 0.5, "summarizer": 1.0}
+
+WORDS = ("invoice", "contract", "payment", "due", "customer", "renewal", "ticket", "outage",
+         "quarter", "revenue", "signed", "amount", "Acme", "Globex", "March", "EUR")
+
+
+def synthetic_documents(count: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    return [' '.join(rng.choice(WORDS) for _ in range(rng.randint(40, 120))) for _ in range(count)]
+
+
+def make_stages(module, args) -> List[BaseAgent]:
+    stages = module.make_stages()
+    for stage in stages:
+        use_fake_model(stage, latency=args.latency * STAGE_LATENCY[stage.name],
+                       tokens_per_second=args.tokens_per_second, output_tokens=args.output_tokens)
+    return stages
+
+
+async def run(agent: BaseAgent, messages: List[str], state: Dict[str, Any], llm_calls: int) -> Dict[str, Any]:
+    """Send each message as a turn of one session; returns the final state and wall time"""
+    runner = InMemoryRunner(agent=agent, app_name='process_pipeline_bench')
+    session = await runner.session_service.create_session(app_name=runner.app_name, user_id='bench', state=state)
+    run_config = RunConfig(max_llm_calls=llm_calls)
+
+    start = time.perf_counter()
+    for text in messages:
+        message = types.Content(role='user', parts=[types.Part(text=text)])
+        async for _ in runner.run_async(user_id='bench', session_id=session.id, new_message=message,
+                                        run_config=run_config):
+            pass
+    wall = time.perf_counter() - start
+
+    session = await runner.session_service.get_session(app_name=runner.app_name, user_id='bench',
+                                                       session_id=session.id)
+    return {'wall': wall, 'state': session.state}
+
+
+async def run_sequential(module, documents: List[str], args) -> float:
+    """The plain approach: one SequentialAgent turn per document, in a fresh session each"""
+    start = time.perf_counter()
+    for document in documents:
+        agent = SequentialAgent(name='sequential_pipeline', sub_agents=make_stages(module, args))
+        await run(agent, [document], {}, llm_calls=10)
+    return time.perf_counter() - start
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Benchmark pipelined vs. sequential stage processing')
+    parser.add_argument('--items', type=int, default=100,
+                        help='Documents in the batch (default: 100)')
+    parser.add_argument('--queue-size', type=int, default=8,
+                        help='Capacity of each stage queue (default: 8)')
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help='Base fake model time to first token in seconds (default: 0.05)')
+    parser.add_argument('--tokens-per-second', type=float, default=1000.0,
+                        help='Fake model output rate (default: 1000)')
+    parser.add_argument('--output-tokens', type=int, default=16,
+                        help='Words per fake reply (default: 16)')
+    args = parser.parse_args()
+
+    module = load_agent_module(ExampleCatalog()['process-pipeline'])
+    documents = synthetic_documents(args.items)
+    llm_calls = args.items * len(STAGE_LATENCY) + 10
+
+    sequential = asyncio.run(run_sequential(module, documents, args))
+    print(f"{'Sequential (SequentialAgent per item)':<42} {sequential:>8.2f}s  "
+          f"{args.items / sequential:>7.1f} items/s")
+
+    configs = {
+        'Pipelined, 1 worker per stage': {},
+        'Pipelined, example concurrency': module.root_agent.stage_concurrency,
+    }
+    for label, concurrency in configs.items():
+        agent = module.PipelineAgent(name='process_pipeline', sub_agents=make_stages(module, args),
+                                     stage_concurrency=concurrency, queue_size=args.queue_size)
+        result = asyncio.run(run(agent, ['Process the batch'], {'items': documents}, llm_calls))
+        stats = result['state']['pipeline_stats']
+        if stats['failed'] or len(result['state']['pipeline_results']) != args.items:
+            print(f"❌ {label}: {stats['failed']} items failed")
+            return 1
+
+        print(f"{label:<42} {result['wall']:>8.2f}s  {args.items / result['wall']:>7.1f} items/s  "
+              f"({sequential / result['wall']:.1f}x)")
+        for name, counters in stats['stages'].items():
+            print(f"   {name:<12} {counters['concurrency']} workers  {counters['items_per_second']:>7.1f} items/s  "
+                  f"p95 {counters['p95_ms']:>6.1f} ms  utilization {counters['utilization']:>4.0%}  "
+                  f"blocked {counters['blocked_seconds']:.2f}s")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
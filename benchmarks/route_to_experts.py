@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Benchmark route-to-experts' FastRouterAgent against LLM-only routing.
+
+Every model is replaced by FakeLlm. The fake coordinator reads the
+customer's message and answers with a transfer_to_agent call to the
+labeled expert, so both setups reach the same specialist and only the
+routing differs. Traffic is a skewed (Zipf-like) mix of labeled support
+messages, one new session per turn, several turns in flight at once.
+Compared:
+
+- LLM routing: the coordinator agent alone; every turn makes a routing call
+- Fast router: FastRouterAgent in front of the same coordinator
+
+Reported: mean turn time, routing time per method, the share of turns
+that skipped the routing LLM call, and how often the local classifier
+agreed with the labels.
+
+Usage:
+    python benchmarks/route_to_experts.py
+    python benchmarks/route_to_experts.py --turns 1000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import _paths  # Puts examples/ and scripts/ on sys.path
+from catalog import ExampleCatalog
+from fake_llm import FakeLlm, use_fake_model
+from run_examples import load_agent_module, percentile
+
+from google.adk.agents import BaseAgent
+from google.adk.models import LlmRequest
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+
+# Support messages and the expert that should handle them (None: the coordinator answers itself)
+QUERIES: Dict[str, Optional[str]] = {
+    "I was charged twice for my subscription this month": "billing_expert",
+    "Can I get a refund for last month's invoice?": "billing_expert",
+    "How do I update my credit card?": "billing_expert",
+    "What does the pro plan cost?": "billing_expert",
+    "I want to cancel my subscription": "billing_expert",
+    "Why is my bill higher than usual?": "billing_expert",
+    "Please send me a receipt for my payment": "billing_expert",
+    "The app crashes when I open settings": "tech_support_expert",
+    "I get a 500 error when calling the API": "tech_support_expert",
+    "The dashboard is really slow to load": "tech_support_expert",
+    "Installation fails on Windows 11": "tech_support_expert",
+    "The export button doesn't work": "tech_support_expert",
+    "Our webhook integration stopped receiving events": "tech_support_expert",
+    "Sync is stuck at 50%": "tech_support_expert",
+    "I forgot my password": "account_expert",
+    "I can't sign in to my account": "account_expert",
+    "How do I turn on two-factor authentication?": "account_expert",
+    "My account is locked after too many attempts": "account_expert",
+    "I think my account was hacked": "account_expert",
+    "How do I change the email on my profile?": "account_expert",
+    "I'm not receiving the verification code": "account_expert",
+    "Where is my order?": "shipping_expert",
+    "My package hasn't arrived yet": "shipping_expert",
+    "Can I change the delivery address for my order?": "shipping_expert",
+    "How do I return a damaged item?": "shipping_expert",
+    "The tracking number doesn't show any updates": "shipping_expert",
+    "I'd like to exchange these shoes for a bigger size": "shipping_expert",
+    "The courier left my parcel at the wrong house": "shipping_expert",
+    "Something is wrong with my order payment and I can't log in": "billing_expert",
+    "Hi there!": None,
+    "I have a question": None,
+    "Thanks, that fixed it": None,
+}
+
+
+def traffic(turns: int, skew: float, seed: int = 0) -> List[str]:
+    """Messages drawn with Zipf-like weights: a few intents make up most of the traffic"""
+    rng = random.Random(seed)
+    messages = list(QUERIES)
+    rng.shuffle(messages)
+    weights = [1 / (rank + 1) ** skew for rank in range(len(messages))]
+    return rng.choices(messages, weights=weights, k=turns)
+
+
+def fake_coordinator(llm_request: LlmRequest):
+    """Transfers to the labeled expert, like a well-behaved routing model"""
+    text = ''
+    for content in reversed(llm_request.contents):
+        if content.role == 'user' and content.parts and content.parts[0].text:
+            text = content.parts[0].text
+            break
+    expert = QUERIES.get(text)
+    if expert is None:
+        return "Happy to help! Is your question about billing, a technical problem, your account or an order?"
+    call = types.FunctionCall(name='transfer_to_agent', args={'agent_name': expert})
+    return types.Content(role='model', parts=[types.Part(function_call=call)])
+
+
+def build(module, fast: bool, args) -> BaseAgent:
+    settings = dict(latency=args.latency, tokens_per_second=args.tokens_per_second,
+                    output_tokens=args.output_tokens)
+    experts = module.make_experts()
+    for expert in experts:
+        use_fake_model(expert, **settings)
+    coordinator = module.make_coordinator(experts)
+    # Only the coordinator routes; use_fake_model would also give the experts this reply
+    coordinator.model = FakeLlm(model=coordinator.model, respond=fake_coordinator, **settings)
+    if not fast:
+        return coordinator
+    template = module.root_agent
+    return module.FastRouterAgent(name=template.name, sub_agents=[coordinator],
+                                  routing_keywords=template.routing_keywords, threshold=template.threshold)
+
+
+async def run(agent: BaseAgent, messages: List[str], concurrency: int) -> Dict[str, Any]:
+    """Send each message as the first turn of a new session, `concurrency` at a time"""
+    runner = InMemoryRunner(agent=agent, app_name='route_to_experts_bench')
+    semaphore = asyncio.Semaphore(concurrency)
+    turns: List[Dict[str, Any]] = []
+
+    async def turn(text: str):
+        async with semaphore:
+            session = await runner.session_service.create_session(app_name=runner.app_name, user_id='bench')
+            message = types.Content(role='user', parts=[types.Part(text=text)])
+            start = time.perf_counter()
+            record = {'text': text, 'expert': None, 'method': 'llm', 'routing_ms': None}
+            async for event in runner.run_async(user_id='bench', session_id=session.id, new_message=message):
+                if event.actions and event.actions.transfer_to_agent and record['routing_ms'] is None:
+                    # The coordinator's transfer: routing is over
+                    record.update(expert=event.actions.transfer_to_agent,
+                                  routing_ms=(time.perf_counter() - start) * 1000)
+                if event.actions and event.actions.state_delta.get('route'):
+                    record.update(event.actions.state_delta['route'])  # FastRouterAgent's own numbers
+            record['turn_ms'] = (time.perf_counter() - start) * 1000
+            turns.append(record)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(turn(text) for text in messages))
+    return {'wall': time.perf_counter() - start, 'turns': turns}
+
+
+def report(label: str, result: Dict[str, Any]):
+    turns = result['turns']
+    turn_ms = sorted(t['turn_ms'] for t in turns)
+    skipped = sum(1 for t in turns if t['method'] != 'llm')
+    print(f"\n{label}")
+    print(f"   turns {len(turns)} in {result['wall']:.2f}s, turn mean {sum(turn_ms) / len(turn_ms):.1f} ms, "
+          f"p95 {percentile(turn_ms, 95):.1f} ms")
+    print(f"   skipped the routing LLM call: {skipped}/{len(turns)} ({skipped / len(turns):.0%})")
+    for method in ('keywords', 'llm'):
+        routing = sorted(t['routing_ms'] for t in turns if t['method'] == method and t['routing_ms'] is not None)
+        if routing:
+            print(f"   {method:<9} {len(routing):>5} turns  routing p50 {percentile(routing, 50):>8.3f} ms  "
+                  f"p95 {percentile(routing, 95):>8.3f} ms")
+
+    local = [t for t in turns if t['method'] == 'keywords']
+    if local:
+        correct = sum(1 for t in local if t['expert'] == QUERIES[t['text']])
+        print(f"   local classifier agreed with the labels on {correct}/{len(local)} turns")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Benchmark local fast routing vs. LLM routing')
+    parser.add_argument('--turns', type=int, default=300,
+                        help='Turns to send, each in a new session (default: 300)')
+    parser.add_argument('--concurrency', type=int, default=20,
+                        help='Turns in flight at once (default: 20)')
+    parser.add_argument('--skew', type=float, default=1.1,
+                        help='Zipf exponent of the message mix (default: 1.1)')
+    parser.add_argument('--latency', type=float, default=0.3,
+                        help='Fake model time to first token in seconds (default: 0.3)')
+    parser.add_argument('--tokens-per-second', type=float, default=200.0,
+                        help='Fake model output rate (default: 200)')
+    parser.add_argument('--output-tokens', type=int, default=40,
+                        help='Words per fake reply (default: 40)')
+    args = parser.parse_args()
+
+    module = load_agent_module(ExampleCatalog()['route-to-experts'])
+    messages = traffic(args.turns, args.skew)
+    print(f"📊 {args.turns} turns over {len(set(messages))} distinct messages, {args.concurrency} at a time")
+
+    baseline = asyncio.run(run(build(module, fast=False, args=args), messages, args.concurrency))
+    report('LLM routing (coordinator only)', baseline)
+    fast = asyncio.run(run(build(module, fast=True, args=args), messages, args.concurrency))
+    report('Fast router (FastRouterAgent)', fast)
+
+    def mean_turn(result):
+        return sum(t['turn_ms'] for t in result['turns']) / len(result['turns'])
+    print(f"\n✅ Mean turn time {mean_turn(baseline):.0f} ms → {mean_turn(fast):.0f} ms "
+          f"({mean_turn(baseline) / mean_turn(fast):.2f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
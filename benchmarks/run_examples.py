@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Load-test the runnable examples against a local fake LLM.
+
+Each example's root_agent is loaded (agent.py, or root_agent.yaml), every
+LLM agent in it gets a FakeLlm instead of Gemini, and an ADK InMemoryRunner
+drives N concurrent sessions for a number of turns each, using the
+example's `example_queries` as user messages. Reported per example:
+
+- throughput in turns per second
+- p50/p95/p99 turn latency
+- framework overhead per turn: turn latency minus time inside the model
+
+Results are written as JSON (by default benchmarks/results/<commit>.json)
+so runs can be compared between commits with --compare.
+
+The fake model never calls tools, so tool latency isn't measured.
+
+Usage:
+    python benchmarks/run_examples.py
+    python benchmarks/run_examples.py --sessions 50 --turns 5 --latency 0.2
+    python benchmarks/run_examples.py --examples first-agent structure-output
+    python benchmarks/run_examples.py --compare benchmarks/results/abc1234.json
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import math
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from _paths import ROOT_DIR
+from catalog import Example, ExampleCatalog
+from fake_llm import track_llm_time, use_fake_model
+
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+
+RESULTS_VERSION = 1
+
+DEFAULT_QUERIES = ["Hello! What can you do?"]
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """p50/p95/p99/mean/max of a list of seconds, in milliseconds"""
+    ordered = sorted(values)
+    return {
+        'p50': round(percentile(ordered, 50) * 1000, 2),
+        'p95': round(percentile(ordered, 95) * 1000, 2),
+        'p99': round(percentile(ordered, 99) * 1000, 2),
+        'mean': round(sum(ordered) / len(ordered) * 1000, 2) if ordered else 0.0,
+        'max': round(ordered[-1] * 1000, 2) if ordered else 0.0,
+    }
+
+
+def load_agent_module(example: Example):
+    """Import an example's agent.py as a submodule of its package, so relative imports work"""
+    package = f"bench_{example.name.replace('-', '_')}"
+    spec = importlib.util.spec_from_file_location(package, example.path / '__init__.py',
+                                                  submodule_search_locations=[str(example.path)])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[package] = module
+    spec.loader.exec_module(module)
+    # Some examples' __init__.py only has a docstring
+    return importlib.import_module(f"{package}.agent")
+
+
+def load_root_agent(example: Example):
+    """
+    Import an example's root_agent the way `adk web` does.
+
+    YAML-only examples are built with ADK's config loader.
+    """
+    if not example.has('agent.py') and example.has('root_agent.yaml'):
+        from google.adk.agents.config_agent_utils import from_config
+        return from_config(str(example.path / 'root_agent.yaml'))
+
+    return load_agent_module(example).root_agent
+
+
+async def run_session(runner: InMemoryRunner, user_id: str, queries: List[str], turns: int,
+                      samples: List[Dict[str, float]], errors: List[str]):
+    """One session: `turns` sequential turns, each timed end to end"""
+    session = await runner.session_service.create_session(app_name=runner.app_name, user_id=user_id)
+
+    for turn in range(turns):
+        message = types.Content(role='user', parts=[types.Part(text=queries[turn % len(queries)])])
+        start = time.perf_counter()
+        try:
+            with track_llm_time() as llm:
+                async for _ in runner.run_async(user_id=user_id, session_id=session.id, new_message=message):
+                    pass
+        except Exception as e:
+            errors.append(f"{type(e).__name__}: {e}")
+            continue
+        elapsed = time.perf_counter() - start
+        samples.append({
+            'latency': elapsed,
+            'overhead': elapsed - llm.seconds,
+            'llm_calls': llm.calls,
+            'input_tokens': llm.input_tokens,
+            'output_tokens': llm.output_tokens,
+        })
+
+
+async def benchmark_example(example: Example, args) -> Dict[str, Any]:
+    """Run the configured load against one example"""
+    root_agent = load_root_agent(example)
+    fake_agents = use_fake_model(root_agent, latency=args.latency,
+                                 tokens_per_second=args.tokens_per_second,
+                                 output_tokens=args.output_tokens)
+    runner = InMemoryRunner(agent=root_agent, app_name=example.name)
+    queries = (example.try_metadata() or {}).get('example_queries') or DEFAULT_QUERIES
+
+    # Warm-up turn so imports and first-call setup aren't measured
+    await run_session(runner, 'warmup', queries, 1, [], [])
+
+    samples: List[Dict[str, float]] = []
+    errors: List[str] = []
+    start = time.perf_counter()
+    await asyncio.gather(*(run_session(runner, f"user-{i}", queries, args.turns, samples, errors)
+                           for i in range(args.sessions)))
+    wall = time.perf_counter() - start
+
+    return {
+        'agents_faked': fake_agents,
+        'turns': len(samples),
+        'errors': len(errors),
+        'first_error': errors[0] if errors else None,
+        'wall_s': round(wall, 3),
+        'throughput_tps': round(len(samples) / wall, 2) if wall else 0.0,
+        'llm_calls_per_turn': round(sum(s['llm_calls'] for s in samples) / len(samples), 2) if samples else 0.0,
+        'tokens_per_turn': round(sum(s['input_tokens'] + s['output_tokens'] for s in samples) / len(samples), 1)
+                           if samples else 0.0,
+        'latency_ms': summarize([s['latency'] for s in samples]),
+        'overhead_ms': summarize([s['overhead'] for s in samples]),
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(previous: Dict[str, Any], current: Dict[str, Any]):
+    """Print throughput and latency changes against an earlier results file"""
+    print(f"\n📊 Compared with {previous.get('commit') or 'previous run'}:")
+    for name, result in current['examples'].items():
+        before = previous.get('examples', {}).get(name)
+        if not before or 'latency_ms' not in before or 'latency_ms' not in result:
+            continue
+
+        def change(new, old):
+            return f"{(new - old) / old:+.1%}" if old else "n/a"
+
+        print(f"  {name:<24} throughput {change(result['throughput_tps'], before['throughput_tps']):>8}  "
+              f"p95 {change(result['latency_ms']['p95'], before['latency_ms']['p95']):>8}  "
+              f"overhead p50 {change(result['overhead_ms']['p50'], before['overhead_ms']['p50']):>8}")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Load-test examples against a local fake LLM')
+    parser.add_argument('--examples', nargs='+', metavar='NAME',
+                        help='Examples to run (default: every ready example)')
+    parser.add_argument('--sessions', type=int, default=20,
+                        help='Concurrent sessions per example (default: 20)')
+    parser.add_argument('--turns', type=int, default=5,
+                        help='Turns per session (default: 5)')
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help='Fake model time to first token in seconds (default: 0.05)')
+    parser.add_argument('--tokens-per-second', type=float, default=200.0,
+                        help='Fake model output rate (default: 200)')
+    parser.add_argument('--output-tokens', type=int, default=64,
+                        help='Words per fake reply (default: 64)')
+    parser.add_argument('--output', type=Path,
+                        help='Results file (default: benchmarks/results/<commit>.json)')
+    parser.add_argument('--compare', type=Path, metavar='RESULTS',
+                        help='Earlier results file to compare against')
+    args = parser.parse_args()
+
+    catalog = ExampleCatalog()
+    if args.examples:
+        unknown = [name for name in args.examples if name not in catalog]
+        if unknown:
+            print(f"❌ Unknown examples: {', '.join(unknown)}")
+            return 1
+        examples = [catalog[name] for name in args.examples]
+    else:
+        examples = catalog.by_status.get('ready', [])
+
+    commit = git_commit()
+    results = {
+        'version': RESULTS_VERSION,
+        'commit': commit,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'python': platform.python_version(),
+        'config': {key: getattr(args, key) for key in
+                   ('sessions', 'turns', 'latency', 'tokens_per_second', 'output_tokens')},
+        'examples': {},
+    }
+
+    print(f"🏃 {len(examples)} examples, {args.sessions} sessions × {args.turns} turns, "
+          f"fake model {args.latency * 1000:.0f} ms + {args.tokens_per_second:.0f} tok/s\n")
+    print(f"{'Example':<24} {'Turns/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'Overhead':>9}  (ms)")
+    print("-" * 76)
+
+    for example in examples:
+        try:
+            result = asyncio.run(benchmark_example(example, args))
+        except Exception as e:
+            results['examples'][example.name] = {'skipped': f"{type(e).__name__}: {e}"}
+            print(f"{example.name:<24} ⚠️  skipped: {type(e).__name__}: {e}")
+            continue
+
+        results['examples'][example.name] = result
+        latency, overhead = result['latency_ms'], result['overhead_ms']
+        errors = f"  ❌ {result['errors']} errors: {result['first_error']}" if result['errors'] else ""
+        print(f"{example.name:<24} {result['throughput_tps']:>8.1f} {latency['p50']:>8.1f} "
+              f"{latency['p95']:>8.1f} {latency['p99']:>8.1f} {overhead['p50']:>9.2f}{errors}")
+
+    output = args.output or BENCHMARKS_DIR / 'results' / f"{commit or 'results'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2) + '\n', encoding='utf-8')
+    print(f"\n💾 Results written to {output}")
+
+    if args.compare:
+        compare(json.loads(args.compare.read_text(encoding='utf-8')), results)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
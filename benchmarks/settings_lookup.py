@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark config lookups: Settings vs. the per-call environment functions.
+
+Compares lookups per second for the model/temperature/max_tokens config of
+an example through the old path (get_env_var → os.getenv plus float()/int()
+on every call) and through the memoized Settings object, single-threaded
+and from a thread pool.
+
+Usage:
+    python benchmarks/settings_lookup.py
+    python benchmarks/settings_lookup.py --iterations 500000 --threads 8
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+import _paths  # Puts examples/ and scripts/ on sys.path
+from _shared.common_tools import Settings, get_env_var
+
+
+EXAMPLE_NAME = 'configure-model'
+
+
+def env_lookup(example_name: str) -> Dict[str, Any]:
+    """The pre-Settings load_example_config(): every value re-read and re-parsed"""
+    config = {
+        "name": example_name,
+        "model": get_env_var("DEFAULT_MODEL", "gemini-2.5-flash"),
+        "temperature": float(get_env_var("DEFAULT_TEMPERATURE", "0.7")),
+        "max_tokens": int(get_env_var("MAX_OUTPUT_TOKENS", "2048")),
+    }
+    example_model = get_env_var(f"{example_name.upper()}_MODEL")
+    if example_model:
+        config["model"] = example_model
+    return config
+
+
+def lookups_per_second(lookup: Callable[[], Any], iterations: int, threads: int) -> float:
+    """Run `iterations` lookups split across `threads` and return the rate"""
+    per_thread = iterations // threads
+
+    def work():
+        for _ in range(per_thread):
+            lookup()
+
+    start = time.perf_counter()
+    if threads == 1:
+        work()
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            for future in [executor.submit(work) for _ in range(threads)]:
+                future.result()
+    return per_thread * threads / (time.perf_counter() - start)
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Benchmark config lookups per second')
+    parser.add_argument('--iterations', type=int, default=200_000,
+                        help='Lookups per measurement (default: 200000)')
+    parser.add_argument('--threads', type=int, default=4,
+                        help='Threads for the concurrent measurement (default: 4)')
+    args = parser.parse_args()
+
+    settings = Settings()
+    cases = {
+        'get_env_var + float()/int()': lambda: env_lookup(EXAMPLE_NAME),
+        'Settings.for_example()': lambda: settings.for_example(EXAMPLE_NAME),
+        'Settings.temperature': lambda: settings.temperature,
+    }
+
+    print(f"{'Lookup':<30} {'1 thread':>14} {f'{args.threads} threads':>14}")
+    print("-" * 60)
+    baseline = None
+    for label, lookup in cases.items():
+        single = lookups_per_second(lookup, args.iterations, 1)
+        threaded = lookups_per_second(lookup, args.iterations, args.threads)
+        baseline = baseline or single
+        print(f"{label:<30} {single:>12,.0f}/s {threaded:>12,.0f}/s  ({single / baseline:.1f}x)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
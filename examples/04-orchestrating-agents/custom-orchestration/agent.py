@@ -1,26 +1,362 @@
 """
-Custom Orchestration
+Custom Orchestration - When I need dynamic planning, I need custom orchestration logic.
 
-JTBD: When I need dynamic planning, I need custom orchestration logic
+A launch brief is built by several specialist agents, some of which need
+another's output first. Sequential runs make the user wait for every
+step in turn; a fixed ParallelAgent can't express "positioning needs the
+market analysis and the persona".
 
-Status: COMING_SOON
-Priority: high
-Sprint: 2
+DagAgent is a custom orchestrator (a BaseAgent subclass) that runs its
+sub-agents as a dependency graph:
+- Each node declares the state keys it reads; the node whose `output_key`
+  writes a key is its upstream dependency
+- The graph is checked and topologically sorted once, at construction
+- A node starts as soon as its dependencies are done, so independent
+  nodes run concurrently
+- A node whose inputs hash the same as in the previous turn is skipped,
+  and its earlier output is reused
+- Each turn's critical path (the chain of nodes that bounded the wall
+  time) is stored in session state with per-node timings
 
-TODO: Implement this example
-1. Review the metadata.json for requirements
-2. Check the ADK sample: {source_sample}
-3. Implement the agent following ADK best practices
-4. Test with `adk web`
-5. Update README.md with usage instructions
+Based on the custom_agent sample.
 """
 
-# TODO: Import necessary ADK components
-# from google.adk import Agent, LLMAgent
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, Dict, List
 
-# TODO: Define your agent
-# root_agent = LLMAgent(
-#     name="custom_orchestration",
-#     model="gemini-2.5-flash",
-#     instructions="TODO: Add agent instructions"
-# )
+from google.adk import Agent
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.genai import types
+from pydantic import PrivateAttr
+
+logger = logging.getLogger(__name__)
+
+MODEL = "gemini-2.5-flash"
+
+
+class DagAgent(BaseAgent):
+    """
+    Runs its sub-agents as a dependency graph built from the state keys
+    they read and write.
+
+    Keys no node writes are inputs to the graph. They come from state, or
+    from the user's message: a JSON object is merged into state key by
+    key, any other text is stored under `message_key`. Sub-agents should
+    read everything from state (e.g. `include_contents='none'`), so the
+    hash of their inputs covers what they see.
+
+    Attributes:
+        inputs: State keys each node reads, by sub-agent name
+        max_concurrency: Nodes allowed to run at the same time
+        message_key: State key for a plain-text user message
+        hashes_key: State key for each node's input hash from the last run
+        stats_key: State key for this turn's timings and critical path
+    """
+
+    inputs: Dict[str, List[str]] = {}
+    max_concurrency: int = 8
+    message_key: str = "request"
+    hashes_key: str = "dag_input_hashes"
+    stats_key: str = "dag_stats"
+
+    _nodes: Dict[str, BaseAgent] = PrivateAttr()
+    _upstream: Dict[str, List[str]] = PrivateAttr()
+    _order: List[str] = PrivateAttr()
+
+    def model_post_init(self, context) -> None:
+        super().model_post_init(context)
+        self._nodes = {agent.name: agent for agent in self.sub_agents}
+        unknown = set(self.inputs) - set(self._nodes)
+        if unknown:
+            raise ValueError(f"inputs names unknown sub-agents: {sorted(unknown)}")
+
+        producers: Dict[str, str] = {}
+        for name, agent in self._nodes.items():
+            key = getattr(agent, 'output_key', None)
+            if not key:
+                continue
+            if key in producers:
+                raise ValueError(f"'{key}' is written by both {producers[key]} and {name}")
+            producers[key] = name
+        self._upstream = {
+            name: sorted({producers[key] for key in self.inputs.get(name, []) if key in producers})
+            for name in self._nodes
+        }
+
+        # Kahn's algorithm; sub-agent order breaks ties
+        remaining = {name: len(upstream) for name, upstream in self._upstream.items()}
+        ready = [name for name in self._nodes if not remaining[name]]
+        self._order = []
+        while ready:
+            name = ready.pop(0)
+            self._order.append(name)
+            for downstream in self._nodes:
+                if name in self._upstream[downstream]:
+                    remaining[downstream] -= 1
+                    if not remaining[downstream]:
+                        ready.append(downstream)
+        if len(self._order) < len(self._nodes):
+            cycle = sorted(set(self._nodes) - set(self._order))
+            raise ValueError(f"Dependency cycle between {cycle}")
+
+    @property
+    def order(self) -> List[str]:
+        """Node names in a valid execution order"""
+        return list(self._order)
+
+    def _branch_context(self, ctx: InvocationContext, node: BaseAgent) -> InvocationContext:
+        """A copy of the context on its own branch, so nodes don't see each other's events"""
+        branch_ctx = ctx.model_copy()
+        suffix = f"{self.name}.{node.name}"
+        branch_ctx.branch = f"{ctx.branch}.{suffix}" if ctx.branch else suffix
+        return branch_ctx
+
+    def _input_hash(self, state: Dict[str, Any], name: str) -> str:
+        """Hash of a node's input values and its instruction"""
+        node = self._nodes[name]
+        instruction = node.instruction if isinstance(getattr(node, 'instruction', None), str) else ''
+        values = {key: state.get(key) for key in self.inputs.get(name, [])}
+        payload = json.dumps([instruction, values], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _message_delta(self, ctx: InvocationContext) -> Dict[str, Any]:
+        text = ''.join(part.text or '' for part in (ctx.user_content.parts if ctx.user_content else []))
+        text = text.strip()
+        if text.startswith('{'):
+            try:
+                values = json.loads(text)
+            except json.JSONDecodeError:
+                values = None
+            if isinstance(values, dict):
+                return values
+        return {self.message_key: text} if text else {}
+
+    def _critical_path(self, timings: Dict[str, Dict[str, Any]]) -> List[str]:
+        """
+        The chain of nodes that set the wall time: from the node that
+        finished last, repeatedly step to the dependency that finished last.
+        """
+        finished = [name for name in self._order if timings[name]["end"] is not None]
+        if not finished:
+            return []
+        path = [max(finished, key=lambda name: timings[name]["end"])]
+        while True:
+            upstream = [name for name in self._upstream[path[-1]] if timings[name]["end"] is not None]
+            if not upstream:
+                break
+            path.append(max(upstream, key=lambda name: timings[name]["end"]))
+        return path[::-1]
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        delta = self._message_delta(ctx)
+        if delta:
+            yield Event(invocation_id=ctx.invocation_id, author=self.name, branch=ctx.branch,
+                        actions=EventActions(state_delta=delta))
+
+        previous_hashes = dict(ctx.session.state.get(self.hashes_key) or {})
+        hashes: Dict[str, str] = {}
+        timings: Dict[str, Dict[str, Any]] = {
+            name: {"status": "pending", "start": None, "end": None, "seconds": 0.0} for name in self._order
+        }
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        queue: asyncio.Queue = asyncio.Queue()
+        start = time.perf_counter()
+
+        async def run_node(name: str):
+            node, status = self._nodes[name], "error"
+            try:
+                async with semaphore:
+                    # Upstream nodes are done, so their outputs are in state now
+                    hashes[name] = self._input_hash(ctx.session.state, name)
+                    timings[name]["start"] = time.perf_counter() - start
+                    output_key = getattr(node, 'output_key', None)
+                    if (hashes[name] == previous_hashes.get(name)
+                            and (not output_key or ctx.session.state.get(output_key) is not None)):
+                        status = "skipped"
+                        return
+                    async with aclosing(node.run_async(self._branch_context(ctx, node))) as events:
+                        async for event in events:
+                            # Wait until the runner has stored the event (and its
+                            # state delta) before the node continues
+                            processed = asyncio.Event()
+                            await queue.put((event, processed))
+                            await processed.wait()
+                    status = "ran"
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Node %s failed: %s", name, e)
+                hashes.pop(name, None)
+            finally:
+                timings[name]["end"] = time.perf_counter() - start
+                queue.put_nowait((name, status))
+
+        tasks: Dict[str, asyncio.Task] = {}
+
+        def start_ready():
+            for name in self._order:
+                if name in tasks or timings[name]["status"] != "pending":
+                    continue
+                upstream = [timings[dep]["status"] for dep in self._upstream[name]]
+                if any(status in ("error", "blocked") for status in upstream):
+                    timings[name]["status"] = "blocked"
+                elif all(status in ("ran", "skipped") for status in upstream):
+                    tasks[name] = asyncio.create_task(run_node(name))
+
+        try:
+            start_ready()
+            while any(timing["status"] == "pending" for timing in timings.values()):
+                item, detail = await queue.get()
+                if isinstance(item, Event):
+                    yield item
+                    detail.set()
+                    continue
+                timings[item]["status"] = detail
+                start_ready()
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+        wall = time.perf_counter() - start
+
+        for timing in timings.values():
+            if timing["status"] in ("ran", "error"):
+                timing["seconds"] = round(timing["end"] - timing["start"], 3)
+            for field in ("start", "end"):
+                if timing[field] is not None:
+                    timing[field] = round(timing[field], 3)
+
+        path = self._critical_path(timings)
+        bottleneck = max(path, key=lambda name: timings[name]["seconds"]) if path else None
+        counts = {status: sum(1 for t in timings.values() if t["status"] == status)
+                  for status in ("ran", "skipped", "error", "blocked")}
+        summary = (f"Ran {counts['ran']}, skipped {counts['skipped']} unchanged"
+                   f"{', ' + str(counts['error']) + ' failed' if counts['error'] else ''}"
+                   f"{', ' + str(counts['blocked']) + ' blocked' if counts['blocked'] else ''}"
+                   f" of {len(timings)} nodes in {wall:.1f}s. Critical path: {' → '.join(path) or 'none'}.")
+
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(role='model', parts=[types.Part(text=summary)]),
+            actions=EventActions(state_delta={
+                # A failed node keeps its old hash, which doesn't match its new inputs
+                self.hashes_key: {**previous_hashes, **hashes},
+                self.stats_key: {
+                    "wall_seconds": round(wall, 3),
+                    **counts,
+                    "critical_path": path,
+                    "critical_path_seconds": round(sum(timings[name]["seconds"] for name in path), 3),
+                    "bottleneck": bottleneck,
+                    "nodes": timings,
+                },
+            }),
+        )
+
+
+def make_nodes() -> List[Agent]:
+    """The launch-brief agents (new instances on every call)"""
+    market_analyst = Agent(
+        model=MODEL,
+        name="market_analyst",
+        description="Sizes the market and names competitors",
+        instruction="""You are a market analyst. The product:
+        {product}
+
+        In at most 6 bullet points: the market it competes in, its rough size and growth,
+        the 3 closest competitors and what they charge.""",
+        include_contents='none',
+        output_key="market",
+    )
+
+    audience_researcher = Agent(
+        model=MODEL,
+        name="audience_researcher",
+        description="Describes the target customer",
+        instruction="""You are a user researcher. The product:
+        {product}
+
+        Intended audience (if empty, pick the most likely one): {audience?}
+
+        Describe one persona in at most 6 bullet points: who they are, the job they need done,
+        their main frustration with today's options and what makes them buy.""",
+        include_contents='none',
+        output_key="persona",
+    )
+
+    positioning_writer = Agent(
+        model=MODEL,
+        name="positioning_writer",
+        description="Writes the positioning statement",
+        instruction="""You write product positioning.
+
+        Market analysis:
+        {market}
+
+        Target persona:
+        {persona}
+
+        Write a positioning statement (for / who / our product / unlike) and three key messages.""",
+        include_contents='none',
+        output_key="positioning",
+    )
+
+    pricing_analyst = Agent(
+        model=MODEL,
+        name="pricing_analyst",
+        description="Recommends a price",
+        instruction="""You are a pricing analyst. Market analysis:
+        {market}
+
+        Recommend a price and pricing model in 3-4 sentences, relative to the competitors.""",
+        include_contents='none',
+        output_key="pricing",
+    )
+
+    brief_writer = Agent(
+        model=MODEL,
+        name="brief_writer",
+        description="Combines everything into the launch brief",
+        instruction="""You write launch briefs for the leadership team.
+
+        Positioning:
+        {positioning}
+
+        Pricing:
+        {pricing}
+
+        Write a one-page launch brief: summary, positioning, key messages, price, and the
+        three biggest launch risks.""",
+        include_contents='none',
+        output_key="launch_brief",
+    )
+    return [market_analyst, audience_researcher, positioning_writer, pricing_analyst, brief_writer]
+
+
+# What each node reads; the graph follows from which node writes each key:
+#   market_analyst ──┬──▶ pricing_analyst ────┐
+#                    └──▶ positioning_writer ─┴──▶ brief_writer
+#   audience_researcher ─┘
+LAUNCH_INPUTS = {
+    "market_analyst": ["product"],
+    "audience_researcher": ["product", "audience"],
+    "positioning_writer": ["market", "persona"],
+    "pricing_analyst": ["market"],
+    "brief_writer": ["positioning", "pricing"],
+}
+
+root_agent = DagAgent(
+    name="custom_orchestration",
+    description="Builds a product launch brief with a dependency graph of specialist agents",
+    sub_agents=make_nodes(),
+    inputs=LAUNCH_INPUTS,
+    message_key="product",
+)
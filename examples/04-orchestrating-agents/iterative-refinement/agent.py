@@ -1,26 +1,257 @@
 """
-Iterative Refinement
+Iterative Refinement - When I want a critique agent reviewing output, I need loop patterns.
 
-JTBD: When I want a critique agent reviewing output, I need loop patterns
+A writer drafts, a critic scores and gives feedback, the writer revises.
+A LoopAgent with a fixed max_iterations keeps paying for both calls long
+after the draft has stopped getting better.
 
-Status: COMING_SOON
-Priority: critical
-Sprint: 1
+RefinementLoopAgent is a custom loop (a BaseAgent subclass) that watches
+the loop converge and stops as soon as more rounds aren't worth it:
+- Draft-to-draft change is measured with difflib; a revision that barely
+  changes the draft ends the loop without another critique
+- The critic's score must reach `target_score` or keep improving by at
+  least `min_improvement` per round
+- Optional token and time budgets stop the loop before a round that
+  would not fit
+- Critiques are memoized by (task, draft), so an identical draft is never
+  sent to the critic twice
+- Per-round change, score, tokens, model calls and seconds are stored in
+  session state
 
-TODO: Implement this example
-1. Review the metadata.json for requirements
-2. Check the ADK sample: {source_sample}
-3. Implement the agent following ADK best practices
-4. Test with `adk web`
-5. Update README.md with usage instructions
+Based on the loop_agent sample.
 """
 
-# TODO: Import necessary ADK components
-# from google.adk import Agent, LLMAgent
+import difflib
+import hashlib
+import time
+from collections import OrderedDict
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
-# TODO: Define your agent
-# root_agent = LLMAgent(
-#     name="iterative_refinement",
-#     model="gemini-2.5-flash",
-#     instructions="TODO: Add agent instructions"
-# )
+from google.adk import Agent
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.genai import types
+from pydantic import BaseModel, Field, PrivateAttr
+
+MODEL = "gemini-2.5-flash"
+
+
+class Critique(BaseModel):
+    """The critic's verdict on one draft"""
+    score: float = Field(description="Overall quality from 0 (unusable) to 10 (publish as is)")
+    feedback: str = Field(description="The most important changes to make, or 'none'")
+
+
+def change_ratio(previous: str, current: str) -> float:
+    """How much a draft changed: 0.0 for identical text, 1.0 for nothing in common"""
+    return 1.0 - difflib.SequenceMatcher(None, previous, current, autojunk=False).ratio()
+
+
+class RefinementLoopAgent(BaseAgent):
+    """
+    Alternates a writer and a critic (its two sub-agents, in that order)
+    until the draft converges, the critic is satisfied, or a budget runs out.
+
+    The user's message is stored in `state[task_key]` at the start of each
+    turn, and the previous turn's draft and critique are cleared, so the
+    writer's instruction can use `{task}`, `{draft?}` and `{critique?}`.
+    The loop ends with an event holding the final draft: the last one if
+    the loop converged, otherwise the highest-scoring one.
+
+    Attributes:
+        max_iterations: Upper bound on writer rounds
+        min_change: Stop when a revision changes less than this (difflib ratio)
+        min_improvement: Stop when the score improves by less than this
+        target_score: Stop when the score reaches this
+        token_budget: Total tokens for the turn, or None for no limit
+        time_budget: Seconds for the turn, or None for no limit
+        cache_size: Number of critiques to remember
+        stats_key: State key for the per-round metrics
+    """
+
+    max_iterations: int = 5
+    min_change: float = 0.05
+    min_improvement: float = 0.5
+    target_score: float = 9.0
+    token_budget: Optional[int] = None
+    time_budget: Optional[float] = None
+    cache_size: int = 256
+    task_key: str = "task"
+    draft_key: str = "draft"
+    critique_key: str = "critique"
+    stats_key: str = "refinement_stats"
+
+    _critiques: OrderedDict = PrivateAttr(default_factory=OrderedDict)
+
+    @property
+    def writer(self) -> BaseAgent:
+        return self.sub_agents[0]
+
+    @property
+    def critic(self) -> BaseAgent:
+        return self.sub_agents[1]
+
+    def _state_event(self, ctx: InvocationContext, delta: Dict[str, Any],
+                     content: Optional[types.Content] = None) -> Event:
+        return Event(invocation_id=ctx.invocation_id, author=self.name, branch=ctx.branch,
+                     content=content, actions=EventActions(state_delta=delta))
+
+    async def _run_counted(self, agent: BaseAgent, ctx: InvocationContext,
+                           usage: Dict[str, int]) -> AsyncGenerator[Event, None]:
+        """Run a sub-agent, adding its model calls and tokens to `usage`"""
+        async with aclosing(agent.run_async(ctx)) as events:
+            async for event in events:
+                if event.usage_metadata and not event.partial:
+                    usage["tokens"] += event.usage_metadata.total_token_count or 0
+                    usage["llm_calls"] += 1
+                yield event
+
+    def _stop_reason(self, rounds: List[Dict[str, Any]], change: float, tokens: int,
+                     elapsed: float) -> Optional[str]:
+        """Why the loop should stop after the latest round, or None to keep going"""
+        latest = rounds[-1]
+        if change < self.min_change:
+            return "converged"
+        if latest["score"] >= self.target_score:
+            return "target_score"
+        if len(rounds) > 1 and latest["score"] - rounds[-2]["score"] < self.min_improvement:
+            return "no_improvement"
+        if len(rounds) >= self.max_iterations:
+            return "max_iterations"
+        # Budgets: stop if another round like the last one wouldn't fit
+        if self.token_budget is not None and tokens + latest["tokens"] > self.token_budget:
+            return "token_budget"
+        if self.time_budget is not None and elapsed + latest["seconds"] > self.time_budget:
+            return "time_budget"
+        return None
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        task = ''.join(part.text or '' for part in (ctx.user_content.parts if ctx.user_content else []))
+        yield self._state_event(ctx, {self.task_key: task, self.draft_key: "", self.critique_key: ""})
+
+        rounds: List[Dict[str, Any]] = []
+        drafts: List[str] = []
+        tokens, critic_calls, cache_hits = 0, 0, 0
+        start = time.perf_counter()
+        stop_reason = None
+
+        while stop_reason is None:
+            round_start = time.perf_counter()
+            usage = {"tokens": 0, "llm_calls": 0}
+
+            async for event in self._run_counted(self.writer, ctx, usage):
+                yield event
+
+            draft = str(ctx.session.state.get(self.draft_key) or '')
+            change = change_ratio(drafts[-1], draft) if drafts else 1.0
+            drafts.append(draft)
+            score = rounds[-1]["score"] if rounds else 0.0
+            cached = False
+
+            if change >= self.min_change:
+                key = hashlib.sha256(f"{task}\0{draft}".encode('utf-8')).hexdigest()
+                critique = self._critiques.get(key)
+                if critique is not None:
+                    cached = True
+                    cache_hits += 1
+                    self._critiques.move_to_end(key)
+                    yield self._state_event(ctx, {self.critique_key: critique})
+                else:
+                    critic_calls += 1
+                    async for event in self._run_counted(self.critic, ctx, usage):
+                        yield event
+                    critique = ctx.session.state.get(self.critique_key)
+                    if isinstance(critique, dict):
+                        self._critiques[key] = critique
+                        while len(self._critiques) > self.cache_size:
+                            self._critiques.popitem(last=False)
+                if isinstance(critique, dict):
+                    score = float(critique.get("score", 0.0))
+
+            tokens += usage["tokens"]
+            rounds.append({
+                "iteration": len(rounds) + 1,
+                "change": round(change, 3),
+                "score": score,
+                "critic_cached": cached,
+                **usage,
+                "seconds": round(time.perf_counter() - round_start, 3),
+            })
+            stop_reason = self._stop_reason(rounds, change, tokens, time.perf_counter() - start)
+
+        if stop_reason == "converged":
+            final = drafts[-1]
+        else:
+            # Latest wins ties, so a revision that kept its score is preferred
+            best = max(range(len(rounds)), key=lambda i: (rounds[i]["score"], i))
+            final = drafts[best]
+
+        stats = {
+            "iterations": len(rounds),
+            "stop_reason": stop_reason,
+            "final_score": max((r["score"] for r in rounds), default=0.0),
+            "tokens": tokens,
+            "llm_calls": sum(r["llm_calls"] for r in rounds),
+            "critic_calls": critic_calls,
+            "critic_cache_hits": cache_hits,
+            "seconds": round(time.perf_counter() - start, 3),
+            "rounds": rounds,
+        }
+        yield self._state_event(ctx, {self.draft_key: final, self.stats_key: stats},
+                                content=types.Content(role='model', parts=[types.Part(text=final)]))
+
+
+def make_writer() -> Agent:
+    """The drafting agent (a new instance on every call)"""
+    return Agent(
+        model=MODEL,
+        name="writer",
+        description="Writes and revises the draft",
+        instruction="""You write short, clear pieces for this request:
+        {task}
+
+        Your current draft (empty on the first round):
+        {draft?}
+
+        A reviewer's critique of it (empty on the first round):
+        {critique?}
+
+        Write the complete new draft, fixing what the critique points out and keeping what works.
+        Output only the draft.""",
+        include_contents='none',
+        output_key="draft",
+    )
+
+
+def make_critic() -> Agent:
+    """The reviewing agent (a new instance on every call)"""
+    return Agent(
+        model=MODEL,
+        name="critic",
+        description="Scores the draft and says what to improve",
+        instruction="""You are a demanding editor. The request was:
+        {task}
+
+        The draft:
+        {draft}
+
+        Score it from 0 to 10 for how well it fulfils the request: accuracy, clarity, structure
+        and concision. A 9 or 10 means it can be published as is. In feedback, give the two or
+        three changes that would raise the score most, or 'none'.""",
+        include_contents='none',
+        output_schema=Critique,
+        output_key="critique",
+    )
+
+
+root_agent = RefinementLoopAgent(
+    name="iterative_refinement",
+    description="Drafts, critiques and revises until the draft stops improving",
+    sub_agents=[make_writer(), make_critic()],
+    max_iterations=5,
+    min_change=0.05,
+    min_improvement=0.5,
+    target_score=9.0,
+)
@@ -1,26 +1,187 @@
 """
-Parallel Research
+Parallel Research - When I need concurrent execution, I need parallel agents.
 
-JTBD: When I need concurrent execution, I need parallel agents
+Several research agents look at the same question from different angles
+at the same time, and a synthesizer combines whatever they found.
 
-Status: COMING_SOON
-Priority: critical
-Sprint: 1
+FanOutAgent is a custom orchestrator (a BaseAgent subclass) that improves
+on running branches one after another:
+- At most `max_concurrency` branches run at once
+- Each branch gets `branch_timeout` seconds; a slow branch doesn't block the rest
+- Events are forwarded as each branch produces them, not after the slowest one
+- Once `quorum` branches have finished, the stragglers are cancelled
+- Each branch writes its answer to session state through its `output_key`,
+  and the status of every branch is stored under `status_key`
 
-TODO: Implement this example
-1. Review the metadata.json for requirements
-2. Check the ADK sample: {source_sample}
-3. Implement the agent following ADK best practices
-4. Test with `adk web`
-5. Update README.md with usage instructions
+Based on the parallel_functions sample and ADK's ParallelAgent.
 """
 
-# TODO: Import necessary ADK components
-# from google.adk import Agent, LLMAgent
+import asyncio
+import logging
+import time
+from contextlib import aclosing
+from typing import AsyncGenerator, Dict, List, Optional
 
-# TODO: Define your agent
-# root_agent = LLMAgent(
-#     name="parallel_research",
-#     model="gemini-2.5-flash",
-#     instructions="TODO: Add agent instructions"
-# )
+from google.adk import Agent
+from google.adk.agents import BaseAgent, SequentialAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+
+logger = logging.getLogger(__name__)
+
+MODEL = "gemini-2.5-flash"
+
+# The angles the question is researched from, one agent each
+RESEARCH_ANGLES = {
+    "technology": "the underlying technology, how it works and its technical limits",
+    "market": "market size, adoption, pricing and the main companies involved",
+    "risks": "risks, criticism, regulation and open problems",
+    "outlook": "recent developments and where things are heading in the next few years",
+}
+
+
+class FanOutAgent(BaseAgent):
+    """
+    Runs its sub-agents concurrently with a concurrency limit, per-branch
+    timeout and optional quorum.
+
+    Every sub-agent's `output_key` is cleared at the start of a turn, so a
+    branch that times out or is cancelled leaves no answer from an
+    earlier turn behind.
+
+    Attributes:
+        max_concurrency: Branches allowed to run at the same time
+        branch_timeout: Seconds each branch may run (waiting for a slot doesn't count)
+        quorum: Stop once this many branches have succeeded (None waits for all)
+        status_key: State key for the per-branch status summary
+    """
+
+    max_concurrency: int = 4
+    branch_timeout: float = 60.0
+    quorum: Optional[int] = None
+    status_key: str = "fan_out_status"
+
+    def _branch_context(self, ctx: InvocationContext, sub_agent: BaseAgent) -> InvocationContext:
+        """A copy of the context on its own branch, so branches don't see each other's events"""
+        branch_ctx = ctx.model_copy()
+        suffix = f"{self.name}.{sub_agent.name}"
+        branch_ctx.branch = f"{ctx.branch}.{suffix}" if ctx.branch else suffix
+        return branch_ctx
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        queue: asyncio.Queue = asyncio.Queue()
+        statuses: Dict[str, Dict[str, object]] = {}
+
+        # None renders as empty in {key?} placeholders, like a missing key
+        stale = {sub_agent.output_key: None for sub_agent in self.sub_agents
+                 if getattr(sub_agent, 'output_key', None)}
+        if stale:
+            yield Event(invocation_id=ctx.invocation_id, author=self.name, branch=ctx.branch,
+                        actions=EventActions(state_delta=stale))
+
+        async def run_branch(sub_agent: BaseAgent):
+            status, start = "cancelled", None
+            try:
+                async with semaphore:
+                    start = time.perf_counter()
+                    async with asyncio.timeout(self.branch_timeout):
+                        # aclosing: a cancelled branch closes its generator here, in its own context
+                        async with aclosing(sub_agent.run_async(self._branch_context(ctx, sub_agent))) as events:
+                            async for event in events:
+                                # Wait until the runner has stored the event (and its
+                                # state delta) before the branch continues
+                                processed = asyncio.Event()
+                                await queue.put((event, processed))
+                                await processed.wait()
+                status = "ok"
+            except TimeoutError:
+                status = "timeout"
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Branch %s failed: %s", sub_agent.name, e)
+                status = "error"
+            finally:
+                seconds = round(time.perf_counter() - start, 3) if start else 0.0
+                queue.put_nowait((sub_agent.name, {"status": status, "seconds": seconds}))
+
+        tasks = [asyncio.create_task(run_branch(sub_agent)) for sub_agent in self.sub_agents]
+        succeeded = 0
+        try:
+            while len(statuses) < len(tasks):
+                item, detail = await queue.get()
+                if isinstance(item, Event):
+                    yield item
+                    detail.set()
+                    continue
+
+                statuses[item] = detail
+                if detail["status"] == "ok":
+                    succeeded += 1
+                    if self.quorum and succeeded == self.quorum:
+                        for task in tasks:
+                            task.cancel()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=EventActions(state_delta={self.status_key: statuses}),
+        )
+
+
+def make_researcher(angle: str, focus: str) -> Agent:
+    """A research agent for one angle, answering into state['research_<angle>']"""
+    return Agent(
+        model=MODEL,
+        name=f"{angle}_researcher",
+        description=f"Researches {focus}",
+        instruction=f"""You are a research analyst focusing on {focus}.
+
+        Research the user's question from this angle only.
+        Give 3-5 concise findings as bullet points, most important first.
+        Say so when you are unsure or the information may be out of date.""",
+        output_key=f"research_{angle}",
+    )
+
+
+def make_synthesizer(angles: List[str]) -> Agent:
+    """Combines whichever research results made it into state"""
+    # {key?} renders as empty when a branch timed out or was cancelled
+    findings = "\n\n".join(f"{angle.upper()}:\n{{research_{angle}?}}" for angle in angles)
+    return Agent(
+        model=MODEL,
+        name="research_synthesizer",
+        instruction=f"""You combine research from several analysts into one answer.
+
+        Findings per angle (an empty section means that analyst didn't finish in time):
+
+        {findings}
+
+        Write a short brief that answers the user's question:
+        1. A two-sentence summary
+        2. Key findings grouped by theme, noting where analysts agree or disagree
+        3. Gaps: angles with no findings, so the user knows what is missing""",
+    )
+
+
+research_team = FanOutAgent(
+    name="research_team",
+    description="Researches a question from several angles at once",
+    sub_agents=[make_researcher(angle, focus) for angle, focus in RESEARCH_ANGLES.items()],
+    max_concurrency=4,
+    branch_timeout=60.0,
+    quorum=3,  # Good enough once three of four angles are in
+    status_key="research_status",
+)
+
+root_agent = SequentialAgent(
+    name="parallel_research",
+    description="Researches a question from several angles in parallel and synthesizes the results",
+    sub_agents=[research_team, make_synthesizer(list(RESEARCH_ANGLES))],
+)
@@ -1,26 +1,281 @@
 """
-Process Pipeline
+Process Pipeline - When my workflow is always the same, I need sequential processing.
 
-JTBD: When my workflow is always the same, I need sequential processing
+Every document goes through the same stages in the same order:
+extract → classify → summarize. A SequentialAgent does that for one
+document; for a batch it leaves every stage idle while the others run.
 
-Status: COMING_SOON
-Priority: critical
-Sprint: 1
+PipelineAgent is a custom orchestrator (a BaseAgent subclass) that keeps
+each item's stages in order but overlaps items, like an assembly line:
+- Each stage has its own workers, fed by a bounded asyncio.Queue, so item
+  k+1 is extracted while item k is being classified
+- A full queue blocks the stage before it (backpressure), so a slow stage
+  never piles up unbounded work
+- `stage_concurrency` sets how many items each stage works on at once
+- Per-stage counters (throughput, latency, utilization, time blocked) are
+  stored in session state, so you can see which stage to scale
 
-TODO: Implement this example
-1. Review the metadata.json for requirements
-2. Check the ADK sample: {source_sample}
-3. Implement the agent following ADK best practices
-4. Test with `adk web`
-5. Update README.md with usage instructions
+Based on the simple_sequential_agent sample.
 """
 
-# TODO: Import necessary ADK components
-# from google.adk import Agent, LLMAgent
+import asyncio
+import logging
+import time
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
-# TODO: Define your agent
-# root_agent = LLMAgent(
-#     name="process_pipeline",
-#     model="gemini-2.5-flash",
-#     instructions="TODO: Add agent instructions"
-# )
+from google.adk import Agent
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.adk.sessions import Session
+from google.genai import types
+
+logger = logging.getLogger(__name__)
+
+MODEL = "gemini-2.5-flash"
+
+# Marks the end of the stream of items on a queue
+_DONE = object()
+
+
+def _percentile(sorted_values: List[float], p: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(p / 100 * len(sorted_values)))]
+
+
+class StageStats:
+    """Counters for one pipeline stage"""
+
+    def __init__(self, name: str, concurrency: int):
+        self.name = name
+        self.concurrency = concurrency
+        self.processed = 0
+        self.failed = 0
+        self.busy = 0.0          # Seconds spent running the stage agent, summed over workers
+        self.blocked = 0.0       # Seconds spent waiting for room in the next queue
+        self.latencies: List[float] = []
+        self.first_start: Optional[float] = None
+        self.last_end: Optional[float] = None
+
+    def record(self, start: float, end: float, ok: bool):
+        self.first_start = start if self.first_start is None else min(self.first_start, start)
+        self.last_end = end if self.last_end is None else max(self.last_end, end)
+        self.busy += end - start
+        self.latencies.append(end - start)
+        if ok:
+            self.processed += 1
+        else:
+            self.failed += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """JSON-friendly counters: items/s while active, latency percentiles in ms, utilization"""
+        active = (self.last_end - self.first_start) if self.first_start is not None else 0.0
+        latencies = sorted(self.latencies)
+        return {
+            "concurrency": self.concurrency,
+            "processed": self.processed,
+            "failed": self.failed,
+            "items_per_second": round(self.processed / active, 2) if active else 0.0,
+            "p50_ms": round(_percentile(latencies, 50) * 1000, 1),
+            "p95_ms": round(_percentile(latencies, 95) * 1000, 1),
+            "utilization": round(self.busy / (active * self.concurrency), 2) if active else 0.0,
+            "blocked_seconds": round(self.blocked, 3),
+        }
+
+
+class PipelineAgent(BaseAgent):
+    """
+    Streams a batch of items through its sub-agents (the stages) with one
+    bounded queue per stage.
+
+    Items are read from `state[items_key]` (a list of strings) or, if that
+    is empty, from the user's message, one item per blank-line-separated
+    paragraph. A batch in state takes precedence over the message and is
+    consumed: the key is cleared at the start of the turn, so later turns
+    process their own messages. Each stage runs on an isolated session per item whose state
+    holds `item` and the `output_key` values of the earlier stages, so a
+    stage's instruction can use `{item}` and e.g. `{extracted}`.
+
+    Attributes:
+        stage_concurrency: Workers per stage, by stage name (default 1)
+        queue_size: Capacity of each stage's input queue
+        items_key: State key to read the batch from
+        results_key: State key for the per-item results
+        stats_key: State key for the per-stage counters
+    """
+
+    stage_concurrency: Dict[str, int] = {}
+    queue_size: int = 8
+    items_key: str = "items"
+    results_key: str = "pipeline_results"
+    stats_key: str = "pipeline_stats"
+
+    def _message_items(self, ctx: InvocationContext) -> List[str]:
+        text = ''.join(part.text or '' for part in (ctx.user_content.parts if ctx.user_content else []))
+        return [paragraph.strip() for paragraph in text.split('\n\n') if paragraph.strip()]
+
+    async def _run_stage(self, ctx: InvocationContext, stage: BaseAgent, index: int,
+                         record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run one stage agent on one item, in a throwaway session.
+
+        The item's events stay out of the user's session (a batch would
+        flood it); only the state the stage wrote is kept.
+        """
+        content = types.Content(role='user', parts=[types.Part(text=record["item"])])
+        session = Session(id=f"{ctx.session.id}-item-{index}", app_name=ctx.session.app_name,
+                          user_id=ctx.session.user_id, state=dict(record))
+        session.events.append(Event(invocation_id=ctx.invocation_id, author='user', content=content))
+        branch = f"{self.name}.{stage.name}"
+        item_ctx = ctx.model_copy(update={
+            "session": session,
+            "user_content": content,
+            "branch": f"{ctx.branch}.{branch}" if ctx.branch else branch,
+        })
+
+        async with aclosing(stage.run_async(item_ctx)) as events:
+            async for event in events:
+                if event.partial:
+                    continue
+                session.events.append(event)
+                if event.actions and event.actions.state_delta:
+                    session.state.update(event.actions.state_delta)
+        return {key: value for key, value in session.state.items() if not key.startswith('temp:')}
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        batch = ctx.session.state.get(self.items_key)
+        if batch:
+            items = [str(item) for item in batch]
+            # Consume the batch, so the next turn doesn't process it again
+            yield Event(invocation_id=ctx.invocation_id, author=self.name, branch=ctx.branch,
+                        actions=EventActions(state_delta={self.items_key: None}))
+        else:
+            items = self._message_items(ctx)
+        stages = list(self.sub_agents)
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in stages]
+        done: asyncio.Queue = asyncio.Queue()
+        stats = [StageStats(stage.name, max(1, self.stage_concurrency.get(stage.name, 1))) for stage in stages]
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+
+        async def worker(position: int):
+            stage, inbox, counters = stages[position], queues[position], stats[position]
+            outbox = queues[position + 1] if position + 1 < len(stages) else done
+            while True:
+                entry = await inbox.get()
+                if entry is _DONE:
+                    await inbox.put(_DONE)  # Let this stage's other workers see it too
+                    return
+                index, record = entry
+                start = time.perf_counter()
+                try:
+                    record = await self._run_stage(ctx, stage, index, record)
+                except Exception as e:
+                    counters.record(start, time.perf_counter(), ok=False)
+                    logger.warning("Item %d failed in %s: %s", index, stage.name, e)
+                    results[index] = {**record, "error": f"{stage.name}: {e}"}
+                    continue
+                counters.record(start, time.perf_counter(), ok=True)
+
+                blocked_since = time.perf_counter()
+                await outbox.put((index, record))  # Blocks while the next stage is full
+                counters.blocked += time.perf_counter() - blocked_since
+
+        async def run_stage_workers(position: int):
+            await asyncio.gather(*(worker(position) for _ in range(stats[position].concurrency)))
+            outbox = queues[position + 1] if position + 1 < len(stages) else done
+            await outbox.put(_DONE)
+
+        async def feed():
+            for index, item in enumerate(items):
+                await queues[0].put((index, {"item": item}))
+            await queues[0].put(_DONE)
+
+        start = time.perf_counter()
+        tasks = [asyncio.create_task(feed())]
+        tasks += [asyncio.create_task(run_stage_workers(position)) for position in range(len(stages))]
+        try:
+            while (entry := await done.get()) is not _DONE:
+                index, record = entry
+                results[index] = record
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        wall = time.perf_counter() - start
+
+        stage_stats = {counters.name: counters.summary() for counters in stats}
+        failed = sum(1 for result in results if result is None or "error" in result)
+        bottleneck = max(stage_stats, key=lambda name: stage_stats[name]["utilization"]) if stage_stats else None
+        lines = [f"Processed {len(items) - failed}/{len(items)} items in {wall:.1f}s "
+                 f"({len(items) / wall if wall else 0:.1f} items/s)."]
+        lines += [f"- {name}: {counters['items_per_second']} items/s, p95 {counters['p95_ms']} ms, "
+                  f"utilization {counters['utilization']:.0%} with {counters['concurrency']} workers"
+                  for name, counters in stage_stats.items()]
+        if bottleneck:
+            lines.append(f"Busiest stage: {bottleneck}. Results are in state['{self.results_key}'].")
+
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(role='model', parts=[types.Part(text='\n'.join(lines))]),
+            actions=EventActions(state_delta={
+                self.results_key: results,
+                self.stats_key: {"items": len(items), "failed": failed,
+                                 "wall_seconds": round(wall, 3), "stages": stage_stats},
+            }),
+        )
+
+
+def make_stages() -> List[Agent]:
+    """The extract → classify → summarize stage agents (new instances on every call)"""
+    extractor = Agent(
+        model=MODEL,
+        name="extractor",
+        description="Pulls the key facts out of a document",
+        instruction="""You extract the key facts from a document.
+
+        List the people, organizations, dates, amounts and decisions it mentions,
+        one per line as `type: value`. Don't interpret or summarize.""",
+        output_key="extracted",
+    )
+
+    classifier = Agent(
+        model=MODEL,
+        name="classifier",
+        description="Labels a document with one category",
+        instruction="""You classify documents.
+
+        Facts extracted from the document:
+        {extracted}
+
+        Answer with exactly one label: invoice, contract, support_ticket, report or other.""",
+        output_key="category",
+    )
+
+    summarizer = Agent(
+        model=MODEL,
+        name="summarizer",
+        description="Writes a one-sentence summary",
+        instruction="""You summarize documents in one sentence of at most 25 words.
+
+        The document is a {category}. Its key facts:
+        {extracted}
+
+        Mention the most important fact first.""",
+        output_key="summary",
+    )
+    return [extractor, classifier, summarizer]
+
+
+root_agent = PipelineAgent(
+    name="process_pipeline",
+    description="Extracts, classifies and summarizes a batch of documents as a pipeline",
+    sub_agents=make_stages(),
+    # Classification is short; extraction and summaries take longer, so they get more workers
+    stage_concurrency={"extractor": 4, "classifier": 2, "summarizer": 4},
+    queue_size=8,
+)
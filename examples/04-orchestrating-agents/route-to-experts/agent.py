@@ -1,26 +1,257 @@
 """
-Route To Experts
+Route To Experts - When I need multiple agents collaborating, I need specialist routing.
 
-JTBD: When I need multiple agents collaborating, I need specialist routing
+A coordinator LLM agent hands each message to the right specialist with
+ADK's agent transfer. That works, but every turn pays a full model round
+trip just to pick a specialist, even for "I was charged twice".
 
-Status: COMING_SOON
-Priority: critical
-Sprint: 1
+FastRouterAgent puts a cheap local classifier in front of the coordinator:
+- At construction, a TF-IDF index is built from each expert's description,
+  instruction and optional routing keywords (no embeddings, no model call)
+- A message whose best expert wins by at least `threshold` goes straight
+  to that expert
+- Anything less clear-cut falls back to the coordinator's LLM delegation
+- Each turn's route and the session's share of turns that skipped the LLM
+  are stored in session state
 
-TODO: Implement this example
-1. Review the metadata.json for requirements
-2. Check the ADK sample: {source_sample}
-3. Implement the agent following ADK best practices
-4. Test with `adk web`
-5. Update README.md with usage instructions
+Based on the multi_agent_llm_config sample.
 """
 
-# TODO: Import necessary ADK components
-# from google.adk import Agent, LLMAgent
+import math
+import re
+import time
+from typing import AsyncGenerator, Dict, List, Optional, Tuple
 
-# TODO: Define your agent
-# root_agent = LLMAgent(
-#     name="route_to_experts",
-#     model="gemini-2.5-flash",
-#     instructions="TODO: Add agent instructions"
-# )
+from google.adk import Agent
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from pydantic import PrivateAttr
+
+MODEL = "gemini-2.5-flash"
+
+# Words too common to say anything about the topic
+STOPWORDS = frozenset("""
+    a an and are as at be been but by can could do does for from has have how i if in into is it its
+    me my of on or our please should so that the their them then there these they this to up us was
+    we were what when where which who why will with would you your yours help need want get about
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase content words, with a plural 's' stripped"""
+    words = re.findall(r"[a-z0-9]+", text.lower())
+    return [word[:-1] if len(word) > 3 and word.endswith('s') and not word.endswith('ss') else word
+            for word in words if word not in STOPWORDS and len(word) > 1]
+
+
+class KeywordRouter:
+    """
+    TF-IDF scoring of a message against each expert's own text.
+
+    Built once from the experts; classify() is a dictionary walk over the
+    message's words, so it takes microseconds.
+    """
+
+    def __init__(self, documents: Dict[str, str]):
+        """
+        Args:
+            documents: Expert name → text describing what it handles
+        """
+        self.names = list(documents)
+        token_lists = {name: tokenize(text) for name, text in documents.items()}
+
+        document_frequency: Dict[str, int] = {}
+        for tokens in token_lists.values():
+            for token in set(tokens):
+                document_frequency[token] = document_frequency.get(token, 0) + 1
+        count = len(documents)
+        self.idf = {token: math.log((1 + count) / (1 + df)) + 1 for token, df in document_frequency.items()}
+
+        # Postings: token → [(expert, normalized weight)]
+        self.postings: Dict[str, List[Tuple[str, float]]] = {}
+        for name, tokens in token_lists.items():
+            weights: Dict[str, float] = {}
+            for token in tokens:
+                weights[token] = weights.get(token, 0.0) + self.idf[token]
+            norm = math.sqrt(sum(weight * weight for weight in weights.values())) or 1.0
+            for token, weight in weights.items():
+                self.postings.setdefault(token, []).append((name, weight / norm))
+
+    def classify(self, text: str) -> Tuple[Optional[str], float]:
+        """
+        Best expert for a message and the confidence: its cosine score
+        minus the runner-up's. Returns (None, 0.0) if no word matches.
+        """
+        query: Dict[str, float] = {}
+        for token in tokenize(text):
+            if token in self.idf:
+                query[token] = query.get(token, 0.0) + self.idf[token]
+        norm = math.sqrt(sum(weight * weight for weight in query.values()))
+        if not norm:
+            return None, 0.0
+
+        scores = dict.fromkeys(self.names, 0.0)
+        for token, weight in query.items():
+            for name, expert_weight in self.postings[token]:
+                scores[name] += weight / norm * expert_weight
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+        return ranked[0][0], ranked[0][1] - runner_up
+
+
+class FastRouterAgent(BaseAgent):
+    """
+    Routes each turn to an expert with a local classifier, falling back to
+    an LLM coordinator when the classifier isn't confident.
+
+    The only sub-agent is the coordinator; its sub-agents are the experts.
+
+    Attributes:
+        threshold: Minimum confidence (score margin) to skip the LLM
+        routing_keywords: Extra words per expert name, added to its description
+        route_key: State key for this turn's routing decision
+        stats_key: State key for the session's routing counters
+    """
+
+    threshold: float = 0.12
+    routing_keywords: Dict[str, List[str]] = {}
+    route_key: str = "route"
+    stats_key: str = "routing_stats"
+
+    _router: KeywordRouter = PrivateAttr()
+    _experts: Dict[str, BaseAgent] = PrivateAttr()
+
+    def model_post_init(self, context) -> None:
+        super().model_post_init(context)
+        self._experts = {expert.name: expert for expert in self.coordinator.sub_agents}
+        documents = {}
+        for name, expert in self._experts.items():
+            instruction = expert.instruction if isinstance(getattr(expert, 'instruction', None), str) else ''
+            documents[name] = ' '.join([expert.description, instruction, *self.routing_keywords.get(name, [])])
+        self._router = KeywordRouter(documents)
+
+    @property
+    def coordinator(self) -> BaseAgent:
+        return self.sub_agents[0]
+
+    def route(self, text: str) -> Tuple[Optional[str], str, float]:
+        """
+        Local routing decision for a message: (expert or None, method, confidence).
+
+        method is "keywords", or "llm" when the coordinator has to decide.
+        """
+        expert, confidence = self._router.classify(text)
+        if expert is not None and confidence >= self.threshold:
+            return expert, "keywords", confidence
+        return None, "llm", confidence
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        text = ''.join(part.text or '' for part in (ctx.user_content.parts if ctx.user_content else []))
+        start = time.perf_counter()
+        expert_name, method, confidence = self.route(text)
+        routing_ms = (time.perf_counter() - start) * 1000
+
+        if expert_name is not None:
+            async for event in self._experts[expert_name].run_async(ctx):
+                yield event
+        else:
+            async for event in self.coordinator.run_async(ctx):
+                if expert_name is None and event.author in self._experts:
+                    # The coordinator transferred; that's the route, and how long it took
+                    expert_name = event.author
+                    routing_ms = (time.perf_counter() - start) * 1000
+                yield event
+            if expert_name is None:
+                # The coordinator answered itself (e.g. a clarifying question)
+                routing_ms = (time.perf_counter() - start) * 1000
+
+        stats = dict(ctx.session.state.get(self.stats_key) or {"turns": 0, "skipped_llm": 0})
+        stats["turns"] += 1
+        stats["skipped_llm"] += method != "llm"
+        stats["skip_rate"] = round(stats["skipped_llm"] / stats["turns"], 3)
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=EventActions(state_delta={
+                self.route_key: {"expert": expert_name, "method": method,
+                                 "confidence": round(confidence, 3), "routing_ms": round(routing_ms, 3)},
+                self.stats_key: stats,
+            }),
+        )
+
+
+EXPERTS = {
+    "billing_expert": (
+        "Handles billing: invoices, charges, refunds, payment methods, subscriptions and pricing plans",
+        """You are a billing specialist.
+        Help with invoices, unexpected or duplicate charges, refunds, payment methods,
+        subscription upgrades, downgrades and cancellations.
+        Explain amounts clearly and say which steps the customer must take themselves.""",
+    ),
+    "tech_support_expert": (
+        "Handles technical problems: errors, crashes, bugs, installation, performance and integrations",
+        """You are a technical support engineer.
+        Troubleshoot errors, crashes, bugs, slow performance, installation and API integration problems.
+        Ask for error messages, versions and steps to reproduce when they are missing,
+        then give numbered troubleshooting steps.""",
+    ),
+    "account_expert": (
+        "Handles accounts: login, password reset, two-factor authentication, profile, email and security",
+        """You are an account and security specialist.
+        Help with signing in, password resets, two-factor authentication, locked accounts,
+        changing email or profile details, and suspicious activity.
+        Never ask for a password or a full verification code.""",
+    ),
+    "shipping_expert": (
+        "Handles orders and delivery: shipping status, tracking, delays, returns, exchanges and addresses",
+        """You are an order and delivery specialist.
+        Help with order status, tracking numbers, late or lost packages, delivery addresses,
+        returns and exchanges. Give realistic time frames.""",
+    ),
+}
+
+# Words customers use that the experts' own descriptions don't
+ROUTING_KEYWORDS = {
+    "billing_expert": ["charged", "twice", "bill", "card", "receipt", "money", "price", "cost"],
+    "tech_support_expert": ["broken", "doesn", "work", "working", "stuck", "loading", "timeout", "sdk"],
+    "account_expert": ["sign", "locked", "username", "2fa", "hacked", "verification", "code"],
+    "shipping_expert": ["package", "arrived", "parcel", "courier", "where", "sent"],
+}
+
+
+def make_experts() -> List[Agent]:
+    """The specialist agents (new instances on every call)"""
+    return [
+        Agent(model=MODEL, name=name, description=description, instruction=instruction)
+        for name, (description, instruction) in EXPERTS.items()
+    ]
+
+
+def make_coordinator(experts: List[BaseAgent]) -> LlmAgent:
+    """The LLM fallback: picks an expert with ADK's agent transfer"""
+    return Agent(
+        model=MODEL,
+        name="coordinator",
+        description="Routes customer messages to the right specialist",
+        instruction="""You are the front desk of a customer support team.
+
+        Transfer every message to exactly one specialist:
+        - billing_expert: invoices, charges, refunds, payments, plans
+        - tech_support_expert: errors, bugs, crashes, performance, integrations
+        - account_expert: login, passwords, 2FA, profile, security
+        - shipping_expert: orders, tracking, delivery, returns
+
+        If the message is only a greeting or truly unclear, ask one short clarifying question instead.""",
+        sub_agents=experts,
+    )
+
+
+root_agent = FastRouterAgent(
+    name="route_to_experts",
+    description="Routes customer messages to specialists, using the LLM only when unsure",
+    sub_agents=[make_coordinator(make_experts())],
+    routing_keywords=ROUTING_KEYWORDS,
+    threshold=0.12,
+)
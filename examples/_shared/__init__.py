@@ -9,7 +9,12 @@ from .common_tools import (
     setup_logging,
     validate_api_key,
     format_response,
-    handle_error
+    format_response_async,
+    handle_error,
+    with_retry,
+    Settings,
+    get_settings,
+    log_context,
 )
 
 __all__ = [
@@ -17,5 +22,10 @@ __all__ = [
     'setup_logging',
     'validate_api_key',
     'format_response',
-    'handle_error'
+    'format_response_async',
+    'handle_error',
+    'with_retry',
+    'Settings',
+    'get_settings',
+    'log_context',
 ]
\ No newline at end of file
@@ -6,9 +6,27 @@ different examples to reduce code duplication and ensure consistency.
 """
 
 import os
+import re
+import copy
 import sys
+import json
+import time
+import errno
+import random
+import asyncio
+import inspect
+import reprlib
+import itertools
+import queue
+import atexit
 import logging
-from typing import Optional, Any, Dict
+import logging.handlers
+import threading
+import contextvars
+from contextlib import contextmanager
+from pathlib import Path
+from types import MappingProxyType
+from typing import Optional, Any, Dict, Mapping, Callable, Tuple, Union, Iterator, List
 from functools import wraps
 
 
@@ -38,27 +56,227 @@ def get_env_var(var_name: str, default: Optional[str] = None, required: bool = F
     return value
 
 
-def setup_logging(name: str = "adk_example", level: str = "INFO") -> logging.Logger:
+# Logger for the shared tools themselves
+logger = logging.getLogger(__name__)
+
+# Request/session ids attached to every log record emitted in the current context
+_log_context: contextvars.ContextVar[Dict[str, str]] = contextvars.ContextVar('adk_log_context', default={})
+
+# Queue listeners started by setup_logging(queued=True), by logger name
+_queue_listeners: Dict[str, logging.handlers.QueueListener] = {}
+
+
+@contextmanager
+def log_context(**ids: str) -> Iterator[None]:
+    """
+    Attach ids (e.g. request_id, session_id) to log records in this context.
+
+    Uses a context variable, so concurrent asyncio tasks and threads each
+    keep their own ids.
+
+    Example:
+        with log_context(request_id=request.id, session_id=session.id):
+            logger.info("Tool called")
+    """
+    token = _log_context.set({**_log_context.get(), **ids})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+class _ContextFilter(logging.Filter):
+    """Copy the current log_context() ids onto each record (runs in the caller's thread)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        for key, value in _log_context.get().items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format records as one JSON object per line.
+
+    Includes timestamp, level, logger, message, request_id/session_id (from
+    log_context() or `extra=`) and the exception, if any.
+    """
+
+    CONTEXT_FIELDS = ('request_id', 'session_id')
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record, '%Y-%m-%dT%H:%M:%S') + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for field in self.CONTEXT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler with a drop or backpressure policy for a full queue.
+
+    'drop' never blocks the caller; 'block' waits up to `block_timeout`
+    seconds for space, then drops. Dropped records are counted and reported
+    by a warning record once the queue accepts records again.
+    """
+
+    def __init__(self, log_queue: queue.Queue, overflow: str, block_timeout: float):
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args now (they may not be thread-safe) but keep the traceback
+        # out of the message so the listener's formatter can place it
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if self.overflow == 'block':
+                self.queue.put(record, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+            return
+
+        if self.dropped:
+            with self._dropped_lock:
+                dropped, self.dropped = self.dropped, 0
+            if dropped:
+                notice = logging.LogRecord(record.name, logging.WARNING, __file__, 0,
+                                           "Log queue full: dropped %d records", (dropped,), None)
+                try:
+                    self.queue.put_nowait(self.prepare(notice))
+                except queue.Full:
+                    with self._dropped_lock:
+                        self.dropped += dropped
+
+
+class _BatchingStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that buffers formatted records and writes them in batches.
+
+    Runs on the QueueListener thread. The buffer is written with a single
+    write + flush when it reaches `batch_size` or the queue has drained.
+    """
+
+    def __init__(self, stream, log_queue: queue.Queue, batch_size: int):
+        super().__init__(stream)
+        self.log_queue = log_queue
+        self.batch_size = batch_size
+        self.buffer: List[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.buffer.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+            return
+        if len(self.buffer) >= self.batch_size or self.log_queue.empty():
+            self.flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            if self.buffer and self.stream:
+                self.stream.write(self.terminator.join(self.buffer) + self.terminator)
+                self.buffer.clear()
+            super().flush()
+
+
+class _DrainingQueueListener(logging.handlers.QueueListener):
+    """QueueListener whose stop() waits for space in a full queue and can be called twice"""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            super().stop()
+            # Write whatever the batching handler still buffers
+            for handler in self.handlers:
+                handler.flush()
+
+
+def setup_logging(name: str = "adk_example", level: str = "INFO", queued: bool = False,
+                  json_format: bool = False, queue_size: int = 10000, overflow: str = "drop",
+                  batch_size: int = 64, block_timeout: float = 0.1) -> logging.Logger:
     """
     Set up a configured logger for an example.
 
+    With `queued=True`, log calls only put the record on a bounded queue;
+    formatting and stdout writes happen on a background QueueListener
+    thread in batches, so a slow terminal or pipe never stalls an agent's
+    event loop. The listener is stopped (and the queue drained) at exit.
+
     Args:
         name: Logger name
         level: Logging level (DEBUG, INFO, WARNING, ERROR)
+        queued: Route records through a QueueHandler/QueueListener pair
+        json_format: Emit one JSON object per line, with request/session ids
+        queue_size: Maximum records waiting in the queue (queued only)
+        overflow: 'drop' new records when the queue is full, or 'block' the
+            caller for up to `block_timeout` seconds first (queued only)
+        batch_size: Maximum records per stdout write (queued only)
+        block_timeout: Seconds to wait for queue space with overflow='block'
 
     Returns:
         Configured logger instance
+
+    Raises:
+        ValueError: If overflow is not 'drop' or 'block'
     """
+    if overflow not in ('drop', 'block'):
+        raise ValueError(f"overflow must be 'drop' or 'block', got {overflow!r}")
+
     logger = logging.getLogger(name)
 
     # Only add handler if logger doesn't have one
     if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        handler.setFormatter(formatter)
+        if json_format:
+            formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                datefmt='%Y-%m-%d %H:%M:%S'
+            )
+
+        if queued:
+            log_queue = queue.Queue(maxsize=queue_size)
+            handler = _BoundedQueueHandler(log_queue, overflow, block_timeout)
+            writer = _BatchingStreamHandler(sys.stdout, log_queue, batch_size)
+            writer.setFormatter(formatter)
+
+            listener = _DrainingQueueListener(log_queue, writer)
+            listener.start()
+            atexit.register(listener.stop)
+            _queue_listeners[name] = listener
+        else:
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(formatter)
+
+        handler.addFilter(_ContextFilter())
         logger.addHandler(handler)
 
     logger.setLevel(getattr(logging, level.upper()))
@@ -91,33 +309,181 @@ def validate_api_key(api_key: Optional[str], provider: str = "Google") -> bool:
     return True
 
 
-def format_response(response: Any, max_length: int = 500) -> str:
+def summarize_payload(payload: Any, max_keys: int = 10) -> str:
+    """
+    Describe a structured payload by shape instead of content.
+
+    Args:
+        payload: A dict, list, tuple or set
+        max_keys: Maximum dict keys to name
+
+    Returns:
+        A summary such as "dict with 12 keys: id, name, ..." or
+        "list of 120 items (dict×118, str×2)"
+    """
+    if isinstance(payload, dict):
+        keys = [str(key) for _, key in zip(range(max_keys), payload)]
+        more = ", ..." if len(payload) > max_keys else ""
+        return f"dict with {len(payload)} keys: {', '.join(keys)}{more}"
+
+    type_counts: Dict[str, int] = {}
+    for _, item in zip(range(1000), payload):
+        type_counts[type(item).__name__] = type_counts.get(type(item).__name__, 0) + 1
+    kinds = ', '.join(f"{name}×{count}" for name, count in type_counts.items())
+    return f"{type(payload).__name__} of {len(payload)} items" + (f" ({kinds})" if kinds else "")
+
+
+def _event_text(event: Any) -> Optional[str]:
+    """Text parts of an ADK event (or genai Content), or None for anything else"""
+    content = getattr(event, 'content', event)
+    parts = getattr(content, 'parts', None)
+    if not isinstance(parts, (list, tuple)):
+        return None
+    return ''.join(part.text for part in parts if isinstance(getattr(part, 'text', None), str))
+
+
+class _InsertionOrderRepr(reprlib.Repr):
+    """reprlib.Repr that keeps dict order (the stock one sorts every key first)"""
+
+    def repr_dict(self, x: dict, level: int) -> str:
+        if not x:
+            return '{}'
+        if level <= 0:
+            return '{...}'
+        pieces = [f"{self.repr1(key, level - 1)}: {self.repr1(value, level - 1)}"
+                  for key, value in itertools.islice(x.items(), self.maxdict)]
+        if len(x) > self.maxdict:
+            pieces.append('...')
+        return '{%s}' % ', '.join(pieces)
+
+
+def _bounded_text(value: Any, limit: int, summarize: bool) -> str:
+    """Text of one value, building at most about `limit` characters for containers"""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value[:limit * 4]).decode('utf-8', errors='replace')
+
+    text = _event_text(value)
+    if text is not None:
+        return text
+
+    if isinstance(value, (dict, list, tuple, set, frozenset)):
+        if summarize:
+            return summarize_payload(value)
+        # reprlib elides beyond its limits, so a huge payload is never fully rendered
+        bounded = _InsertionOrderRepr()
+        bounded.maxlevel = 6
+        bounded.maxstring = bounded.maxother = limit + 1
+        bounded.maxdict = bounded.maxlist = bounded.maxtuple = bounded.maxset = bounded.maxfrozenset = max(limit // 8, 6)
+        return bounded.repr(value)
+
+    return str(value)
+
+
+def _is_stream(response: Any) -> bool:
+    """True for iterators/generators and for lists of ADK events"""
+    if isinstance(response, (str, bytes, bytearray, dict)):
+        return False
+    if hasattr(response, '__next__'):
+        return True
+    return isinstance(response, (list, tuple)) and bool(response) and _event_text(response[0]) is not None
+
+
+def _join_limited(pieces: List[str], size: int, max_length: int) -> str:
+    text = ''.join(pieces)
+    if size > max_length:
+        return f"{text[:max_length]}... (truncated)"
+    return text
+
+
+def format_response(response: Any, max_length: int = 500, summarize: bool = False) -> str:
     """
     Format an agent response for display.
 
+    Accepts plain values, ADK events, and iterators of chunks or events
+    (e.g. a Runner event stream). Chunks are consumed only until
+    `max_length` characters are collected, so the rest of a stream is
+    never pulled and a large payload is never stringified in full.
+
     Args:
         response: The response to format
         max_length: Maximum length before truncation
+        summarize: Describe dicts/lists by shape (counts, keys) instead of content
 
     Returns:
         Formatted string representation
+
+    Raises:
+        TypeError: For async iterators; use format_response_async()
     """
     if response is None:
         return "No response received"
 
-    response_str = str(response)
+    if hasattr(response, '__aiter__'):
+        raise TypeError("format_response() got an async iterator; use 'await format_response_async(...)'")
 
-    if len(response_str) > max_length:
-        return f"{response_str[:max_length]}... (truncated)"
+    if not _is_stream(response):
+        text = _bounded_text(response, max_length, summarize)
+        return _join_limited([text], len(text), max_length)
 
-    return response_str
+    pieces: List[str] = []
+    size = 0
+    for chunk in response:
+        piece = _bounded_text(chunk, max_length - size, summarize)
+        pieces.append(piece)
+        size += len(piece)
+        if size > max_length:
+            break
+
+    if not pieces:
+        return "No response received"
+    return _join_limited(pieces, size, max_length)
+
+
+async def format_response_async(response: Any, max_length: int = 500, summarize: bool = False) -> str:
+    """
+    Format an async stream of chunks or ADK events (e.g. Runner.run_async()).
+
+    Stops iterating, and closes the stream, once `max_length` characters
+    have been collected. Other inputs are handled like format_response().
+
+    Args:
+        response: Async iterator, or anything format_response() accepts
+        max_length: Maximum length before truncation
+        summarize: Describe dicts/lists by shape (counts, keys) instead of content
+
+    Returns:
+        Formatted string representation
+    """
+    if not hasattr(response, '__aiter__'):
+        return format_response(response, max_length, summarize)
+
+    pieces: List[str] = []
+    size = 0
+    try:
+        async for chunk in response:
+            piece = _bounded_text(chunk, max_length - size, summarize)
+            pieces.append(piece)
+            size += len(piece)
+            if size > max_length:
+                break
+    finally:
+        if size > max_length and hasattr(response, 'aclose'):
+            await response.aclose()
+
+    if not pieces:
+        return "No response received"
+    return _join_limited(pieces, size, max_length)
 
 
 def handle_error(func):
     """
     Decorator for handling common errors in examples.
 
-    Provides user-friendly error messages for common issues.
+    Provides user-friendly error messages for common issues. Exits the
+    process on error, so it suits command-line examples; for agent servers
+    and async tools use with_retry() instead.
     """
     @wraps(func)
     def wrapper(*args, **kwargs):
@@ -143,29 +509,430 @@ def handle_error(func):
     return wrapper
 
 
+# HTTP status codes worth retrying: timeouts, rate limits, server overload
+TRANSIENT_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+# Substrings of error messages from model/API clients that mean "try again"
+TRANSIENT_MESSAGES = ('rate limit', 'resource_exhausted', 'unavailable', 'deadline exceeded',
+                      'temporarily', 'try again', 'overloaded', 'connection reset')
+
+TRANSIENT_ERRNOS = {errno.ECONNRESET, errno.ECONNREFUSED, errno.ECONNABORTED, errno.ETIMEDOUT,
+                    errno.EHOSTUNREACH, errno.ENETUNREACH, errno.EPIPE}
+
+
+def classify_error(error: BaseException) -> str:
+    """
+    Classify an exception as 'transient' (worth retrying) or 'permanent'.
+
+    Transient: timeouts, connection errors, network OS errors, HTTP 408/429/5xx
+    (read from a `status_code`, `status` or `code` attribute) and API errors
+    whose message mentions rate limits or unavailability. Everything else,
+    notably configuration errors (ValueError, ImportError, KeyError,
+    auth failures), is permanent.
+
+    Args:
+        error: The exception to classify
+
+    Returns:
+        'transient' or 'permanent'
+    """
+    if isinstance(error, (TimeoutError, asyncio.TimeoutError, ConnectionError)):
+        return "transient"
+    if isinstance(error, OSError) and error.errno in TRANSIENT_ERRNOS:
+        return "transient"
+    if isinstance(error, (ImportError, ValueError, KeyError, TypeError, AttributeError, PermissionError)):
+        return "permanent"
+
+    for attribute in ('status_code', 'status', 'code'):
+        status = getattr(error, attribute, None)
+        if isinstance(status, int):
+            return "transient" if status in TRANSIENT_STATUS_CODES else "permanent"
+
+    message = str(error).lower()
+    if any(fragment in message for fragment in TRANSIENT_MESSAGES):
+        return "transient"
+    return "permanent"
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """
+    Full-jitter exponential backoff: uniform in [0, min(max_delay, base_delay * 2**attempt)].
+
+    Args:
+        attempt: Zero-based number of the retry
+        base_delay: Delay cap of the first retry, in seconds
+        max_delay: Upper bound for any delay, in seconds
+
+    Returns:
+        Seconds to wait before the retry
+    """
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+def with_retry(max_attempts: int = 3, base_delay: float = 0.5, max_delay: float = 8.0,
+               deadline: Optional[float] = 30.0,
+               classify: Callable[[BaseException], str] = classify_error):
+    """
+    Decorator that retries transient errors; works on sync and async functions.
+
+    Unlike handle_error, it never exits the process: permanent errors are
+    raised immediately and transient ones are retried with jittered
+    exponential backoff until `max_attempts` or the per-call `deadline` is
+    reached, after which the last error is raised (with a note saying how
+    many attempts were made). For async functions each attempt is also
+    cancelled when the deadline passes; sync attempts can't be interrupted,
+    so the deadline only limits further retries.
+
+    The wrapper exposes `wrapper.stats`, a dict with calls, successes,
+    failures, retries, total_latency_ms and last_latency_ms.
+
+    Args:
+        max_attempts: Attempts per call, including the first
+        base_delay: Backoff delay cap of the first retry, in seconds
+        max_delay: Upper bound for a single backoff delay, in seconds
+        deadline: Seconds a call may take including retries (None for no limit)
+        classify: Function mapping an exception to 'transient' or 'permanent'
+
+    Example:
+        @with_retry(max_attempts=4, deadline=10)
+        async def search_web(query: str) -> dict:
+            ...
+    """
+    if max_attempts < 1:
+        raise ValueError(f"max_attempts must be at least 1, got {max_attempts}")
+
+    def decorator(func):
+        stats = {"calls": 0, "successes": 0, "failures": 0, "retries": 0,
+                 "total_latency_ms": 0.0, "last_latency_ms": 0.0}
+        stats_lock = threading.Lock()
+
+        def record(start: float, retries: int, succeeded: bool):
+            latency_ms = (time.perf_counter() - start) * 1000
+            with stats_lock:
+                stats["calls"] += 1
+                stats["successes" if succeeded else "failures"] += 1
+                stats["retries"] += retries
+                stats["total_latency_ms"] += latency_ms
+                stats["last_latency_ms"] = latency_ms
+
+        def next_delay(error: BaseException, attempt: int, start: float) -> Optional[float]:
+            """Seconds to wait before retrying, or None to give up"""
+            if classify(error) != "transient" or attempt + 1 >= max_attempts:
+                return None
+            delay = backoff_delay(attempt, base_delay, max_delay)
+            if deadline is not None and time.perf_counter() - start + delay >= deadline:
+                return None
+            return delay
+
+        def give_up(error: BaseException, attempts: int) -> BaseException:
+            error.add_note(f"{func.__qualname__} failed after {attempts} attempt(s) "
+                           f"({classify(error)} error)")
+            return error
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                for attempt in range(max_attempts):
+                    try:
+                        if deadline is None:
+                            result = await func(*args, **kwargs)
+                        else:
+                            remaining = deadline - (time.perf_counter() - start)
+                            result = await asyncio.wait_for(func(*args, **kwargs), max(remaining, 0))
+                    except Exception as e:
+                        delay = next_delay(e, attempt, start)
+                        if delay is None:
+                            record(start, attempt, False)
+                            raise give_up(e, attempt + 1)
+                        logger.warning("%s: transient error (%s), retry %d in %.2fs",
+                                       func.__qualname__, e, attempt + 1, delay)
+                        await asyncio.sleep(delay)
+                    else:
+                        record(start, attempt, True)
+                        return result
+        else:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                for attempt in range(max_attempts):
+                    try:
+                        result = func(*args, **kwargs)
+                    except Exception as e:
+                        delay = next_delay(e, attempt, start)
+                        if delay is None:
+                            record(start, attempt, False)
+                            raise give_up(e, attempt + 1)
+                        logger.warning("%s: transient error (%s), retry %d in %.2fs",
+                                       func.__qualname__, e, attempt + 1, delay)
+                        time.sleep(delay)
+                    else:
+                        record(start, attempt, True)
+                        return result
+
+        wrapper.stats = stats
+        return wrapper
+
+    return decorator
+
+
+def parse_env_file(path: Union[str, Path]) -> Dict[str, str]:
+    """
+    Parse a .env file into a dictionary.
+
+    Supports `KEY=value`, an optional `export ` prefix, single or double
+    quoted values, blank lines and `#` comments (also after unquoted values).
+
+    Args:
+        path: Path to the .env file
+
+    Returns:
+        Mapping of variable names to raw string values
+    """
+    values = {}
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if line.startswith('export '):
+                line = line[len('export '):].lstrip()
+
+            key, sep, value = line.partition('=')
+            if not sep:
+                continue
+            key, value = key.strip(), value.strip()
+
+            quote = value[:1]
+            if len(value) >= 2 and quote in ('"', "'") and value[-1] == quote:
+                value = value[1:-1]
+                if quote == '"':
+                    value = value.replace('\\n', '\n')
+            else:
+                value = value.split(' #', 1)[0].rstrip()
+
+            values[key] = value
+
+    return values
+
+
+def find_env_file(start: Optional[Union[str, Path]] = None) -> Optional[Path]:
+    """
+    Find the nearest .env file, searching upward from `start`.
+
+    Args:
+        start: Directory to start from (defaults to the working directory)
+
+    Returns:
+        Path to the .env file, or None if there is none
+    """
+    directory = Path(start or os.getcwd()).resolve()
+    for candidate in (directory, *directory.parents):
+        env_file = candidate / '.env'
+        if env_file.is_file():
+            return env_file
+    return None
+
+
+# Typed settings: attribute name -> (environment variable, type, default)
+SETTINGS_FIELDS: Dict[str, Tuple[str, Callable[[str], Any], Any]] = {
+    "model": ("DEFAULT_MODEL", str, "gemini-2.5-flash"),
+    "temperature": ("DEFAULT_TEMPERATURE", float, 0.7),
+    "max_tokens": ("MAX_OUTPUT_TOKENS", int, 2048),
+}
+
+
+class _SettingsState:
+    """One immutable parse of .env + environment, plus its per-example cache"""
+
+    def __init__(self, raw: Dict[str, str], typed: Dict[str, Any]):
+        self.raw = MappingProxyType(raw)
+        self.typed = typed
+        self.examples: Dict[str, Mapping[str, Any]] = {}
+
+
+class Settings:
+    """
+    Typed configuration parsed once from a .env file and the environment.
+
+    Values are read and coerced when the object is created (or reload() is
+    called), not on every lookup. Real environment variables take
+    precedence over the .env file. Per-example configs are built once and
+    memoized.
+
+    Lookups are lock-free reads of an immutable snapshot, so a Settings
+    object can be shared by many threads or tasks. reload() builds a new
+    snapshot and swaps it in with a single assignment; readers see either
+    the old or the new configuration, never a mix.
+
+    Example:
+        settings = get_settings()
+        config = settings.for_example("configure_model")
+        root_agent = Agent(model=config["model"], ...)
+    """
+
+    def __init__(self, env_file: Optional[Union[str, Path]] = None,
+                 environ: Optional[Mapping[str, str]] = None):
+        """
+        Args:
+            env_file: .env file to read (defaults to the nearest one found
+                upward from the working directory; missing is fine)
+            environ: Environment mapping (defaults to os.environ)
+        """
+        self._env_file = Path(env_file) if env_file else None
+        self._environ = environ
+        self._lock = threading.Lock()
+        self._state = self._load()
+
+    def _load(self) -> _SettingsState:
+        env_file = self._env_file or find_env_file()
+        raw = parse_env_file(env_file) if env_file and env_file.is_file() else {}
+        raw.update(os.environ if self._environ is None else self._environ)
+
+        typed = {}
+        for attribute, (var_name, coerce, default) in SETTINGS_FIELDS.items():
+            value = raw.get(var_name)
+            if value is None or value == '':
+                typed[attribute] = default
+                continue
+            try:
+                typed[attribute] = coerce(value)
+            except ValueError:
+                raise ValueError(
+                    f"Environment variable '{var_name}' must be {coerce.__name__}, got {value!r}. "
+                    f"Please fix it in your .env file."
+                ) from None
+
+        if not 0.0 <= typed["temperature"] <= 2.0:
+            raise ValueError(f"DEFAULT_TEMPERATURE must be between 0.0 and 2.0, got {typed['temperature']}")
+        if typed["max_tokens"] <= 0:
+            raise ValueError(f"MAX_OUTPUT_TOKENS must be positive, got {typed['max_tokens']}")
+
+        return _SettingsState(raw, typed)
+
+    def reload(self) -> None:
+        """Re-read the .env file and environment, discarding memoized configs"""
+        state = self._load()
+        with self._lock:
+            self._state = state
+
+    def get(self, var_name: str, default: Optional[str] = None, required: bool = False) -> Optional[str]:
+        """
+        Look up a raw variable from the parsed .env file and environment.
+
+        Args:
+            var_name: Name of the variable
+            default: Default value if not found
+            required: If True, raises error when not found and no default
+
+        Returns:
+            The variable value or default
+
+        Raises:
+            ValueError: If required and not found
+        """
+        value = self._state.raw.get(var_name, default)
+        if required and value is None:
+            raise ValueError(
+                f"Required environment variable '{var_name}' not found. "
+                f"Please set it in your .env file."
+            )
+        return value
+
+    @property
+    def model(self) -> str:
+        return self._state.typed["model"]
+
+    @property
+    def temperature(self) -> float:
+        return self._state.typed["temperature"]
+
+    @property
+    def max_tokens(self) -> int:
+        return self._state.typed["max_tokens"]
+
+    def for_example(self, example_name: str) -> Mapping[str, Any]:
+        """
+        Configuration for one example, with its `{EXAMPLE}_MODEL` override applied.
+
+        The override is looked up as `{example_name.upper()}_MODEL` and, for
+        names with dashes, as the shell-safe `ROUTE_TO_EXPERTS_MODEL` form.
+
+        Args:
+            example_name: Name of the example
+
+        Returns:
+            Read-only configuration mapping, shared between callers
+        """
+        state = self._state
+        config = state.examples.get(example_name)
+        if config is not None:
+            return config
+
+        with self._lock:
+            config = state.examples.get(example_name)
+            if config is None:
+                values = {"name": example_name, **state.typed}
+                for key in (f"{example_name.upper()}_MODEL",
+                            re.sub(r'[^A-Z0-9]', '_', example_name.upper()) + "_MODEL"):
+                    if state.raw.get(key):
+                        values["model"] = state.raw[key]
+                        break
+                config = MappingProxyType(values)
+                state.examples[example_name] = config
+        return config
+
+
+_settings: Optional[Settings] = None
+_settings_lock = threading.Lock()
+
+
+def get_settings() -> Settings:
+    """
+    Get the process-wide Settings, creating it on first use.
+
+    Returns:
+        The shared Settings instance
+    """
+    global _settings
+    if _settings is None:
+        with _settings_lock:
+            if _settings is None:
+                _settings = Settings()
+    return _settings
+
+
 def load_example_config(example_name: str) -> Dict[str, Any]:
     """
     Load configuration for a specific example.
 
+    Reads the shared Settings, so .env and the environment are parsed once
+    per process; call get_settings().reload() to pick up changes.
+
     Args:
         example_name: Name of the example
 
     Returns:
         Configuration dictionary
     """
-    config = {
-        "name": example_name,
-        "model": get_env_var("DEFAULT_MODEL", "gemini-2.5-flash"),
-        "temperature": float(get_env_var("DEFAULT_TEMPERATURE", "0.7")),
-        "max_tokens": int(get_env_var("MAX_OUTPUT_TOKENS", "2048")),
-    }
+    return dict(get_settings().for_example(example_name))
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count of a prompt, at about 4 characters per token.
 
-    # Load example-specific overrides if they exist
-    example_model = get_env_var(f"{example_name.upper()}_MODEL")
-    if example_model:
-        config["model"] = example_model
+    Good enough to compare prompts and watch them grow; use the model's
+    count_tokens API when an exact number matters.
 
-    return config
+    Args:
+        text: Prompt text
+
+    Returns:
+        Estimated number of tokens
+    """
+    return (len(text) + 3) // 4
 
 
 # Common prompt templates that can be reused
@@ -195,4 +962,4 @@ def get_prompt_template(template_name: str) -> str:
     return PROMPT_TEMPLATES.get(
         template_name,
         PROMPT_TEMPLATES["helpful_assistant"]
-    )
\ No newline at end of file
+    )
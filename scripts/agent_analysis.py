@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Static analysis of example agent.py files.
+
+Parses an agent module with `ast` and reports every agent it constructs,
+without importing google-adk or executing any example code. Used by
+validate_examples.py.
+
+Usage:
+    python scripts/agent_analysis.py examples/01-getting-started/configure-model/agent.py
+"""
+
+import ast
+import json
+import sys
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+
+# ADK classes whose constructor calls we treat as agents
+AGENT_CLASSES = {
+    'Agent', 'LlmAgent', 'LLMAgent', 'BaseAgent',
+    'SequentialAgent', 'ParallelAgent', 'LoopAgent',
+    'RemoteA2aAgent',
+}
+
+# Agent classes that talk to a model directly (workflow agents don't)
+MODEL_AGENT_CLASSES = {'Agent', 'LlmAgent', 'LLMAgent'}
+
+# Constructor keyword arguments extracted for each agent
+AGENT_KWARGS = ['model', 'name', 'tools', 'output_schema', 'generate_content_config', 'sub_agents']
+
+
+def _call_name(node: ast.AST) -> Optional[str]:
+    """Return the bare name of a call target (`Agent` for both `Agent()` and `adk.Agent()`)"""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _collect_agent_classes(tree: ast.Module) -> Dict[str, str]:
+    """
+    Map every local name that refers to an agent class to its ADK base class.
+
+    Covers direct imports, `import ... as` aliases and classes defined in the
+    module that subclass an agent class (custom orchestrators).
+    """
+    classes = {name: name for name in AGENT_CLASSES}
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom):
+            for alias in node.names:
+                if alias.name in AGENT_CLASSES and alias.asname:
+                    classes[alias.asname] = alias.name
+
+    # Subclasses can chain (class A(BaseAgent), class B(A)), so iterate to a fixed point
+    class_defs = [node for node in ast.walk(tree) if isinstance(node, ast.ClassDef)]
+    changed = True
+    while changed:
+        changed = False
+        for class_def in class_defs:
+            if class_def.name in classes:
+                continue
+            for base in class_def.bases:
+                base_name = _call_name(base)
+                if base_name in classes:
+                    classes[class_def.name] = classes[base_name]
+                    changed = True
+                    break
+
+    return classes
+
+
+def _collect_constants(tree: ast.Module) -> Dict[str, Any]:
+    """Module-level `NAME = <literal>` assignments, for resolving `model=MODEL`"""
+    constants = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    constants[target.id] = node.value.value
+        elif (isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name)
+              and isinstance(node.value, ast.Constant)):
+            constants[node.target.id] = node.value.value
+    return constants
+
+
+def _describe_value(node: ast.AST, constants: Dict[str, Any]) -> Any:
+    """Turn a keyword value into a JSON-friendly description"""
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.Name) and node.id in constants:
+        return constants[node.id]
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return [_describe_value(element, constants) for element in node.elts]
+    return ast.unparse(node)
+
+
+def analyze_agent_source(source: str, filename: str = 'agent.py') -> Dict[str, Any]:
+    """
+    Statically analyze the source of an agent module.
+
+    Returns:
+        {
+            'agents': [{'variable', 'class', 'base_class', 'line', 'model',
+                        'name', 'tools', 'output_schema', ...}, ...],
+            'root_agent': the agent dict bound to root_agent, or None,
+            'root_agent_bound': True if root_agent is assigned or imported,
+        }
+
+    Raises:
+        SyntaxError: If the source does not parse
+    """
+    tree = ast.parse(source, filename=filename)
+    classes = _collect_agent_classes(tree)
+    constants = _collect_constants(tree)
+
+    # Remember which variable each call is assigned to
+    call_targets = {}
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Assign, ast.AnnAssign)) and isinstance(node.value, ast.Call):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                if isinstance(target, ast.Name):
+                    call_targets[id(node.value)] = target.id
+
+    agents = []
+    agents_by_call = {}
+    agents_by_variable = {}
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        class_name = _call_name(node.func)
+        if class_name not in classes:
+            continue
+
+        agent = {
+            'variable': call_targets.get(id(node)),
+            'class': class_name,
+            'base_class': classes[class_name],
+            'line': node.lineno,
+        }
+        for keyword in node.keywords:
+            if keyword.arg in AGENT_KWARGS:
+                agent[keyword.arg] = _describe_value(keyword.value, constants)
+
+        agents.append(agent)
+        agents_by_call[id(node)] = agent
+        if agent['variable']:
+            agents_by_variable[agent['variable']] = agent
+
+    agents.sort(key=lambda agent: agent['line'])
+
+    # Find how root_agent is bound at module level
+    root_agent = None
+    root_agent_bound = False
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets, value = node.targets, node.value
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets, value = [node.target], node.value
+        elif isinstance(node, ast.ImportFrom):
+            if any((alias.asname or alias.name) == 'root_agent' for alias in node.names):
+                root_agent_bound = True
+            continue
+        else:
+            continue
+
+        if not any(isinstance(target, ast.Name) and target.id == 'root_agent' for target in targets):
+            continue
+
+        root_agent_bound = True
+        if isinstance(value, ast.Call):
+            root_agent = agents_by_call.get(id(value))
+        elif isinstance(value, ast.Name):
+            root_agent = agents_by_variable.get(value.id)
+
+    return {
+        'agents': agents,
+        'root_agent': root_agent,
+        'root_agent_bound': root_agent_bound,
+    }
+
+
+def analyze_agent_file(agent_file: Path) -> Dict[str, Any]:
+    """Read and statically analyze an agent.py file"""
+    with open(agent_file, 'r', encoding='utf-8', errors='ignore') as f:
+        source = f.read()
+    return analyze_agent_source(source, filename=str(agent_file))
+
+
+def model_agents(analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Agents in an analysis that call a model directly"""
+    return [agent for agent in analysis['agents'] if agent['base_class'] in MODEL_AGENT_CLASSES]
+
+
+def main():
+    """Print the analysis of each agent.py given on the command line as JSON"""
+    if len(sys.argv) < 2:
+        print("Usage: python scripts/agent_analysis.py <agent.py> [<agent.py> ...]")
+        return 1
+
+    report = {path: analyze_agent_file(Path(path)) for path in sys.argv[1:]}
+    print(json.dumps(report, indent=2, default=str))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Shared loader for the examples/ tree.
+
+ExampleCatalog scans examples/ once with os.scandir, recording every file
+and its stat result. File contents, parsed metadata and the static agent
+analysis are only read when first asked for and then memoized, so scripts
+that share a catalog (e.g. validate_examples.py --generate-site) read each
+file exactly once.
+
+Usage:
+    python scripts/catalog.py                   # summary of the catalog
+    python scripts/catalog.py --tag multi-agent # examples with a tag
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Callable, Dict, Any, Iterator, List, Optional
+
+from agent_analysis import analyze_agent_source
+
+
+EXAMPLES_DIR = Path(__file__).parent.parent / 'examples'
+
+# Category folder → display name
+CATEGORY_NAMES = {
+    '01-getting-started': 'Getting Started',
+    '02-connecting-llms': 'Connecting to LLMs',
+    '03-adding-capabilities': 'Adding Capabilities',
+    '04-orchestrating-agents': 'Orchestrating Agents',
+    '05-managing-context': 'Managing State & Context',
+    '06-going-production': 'Going to Production',
+    '07-advanced-patterns': 'Advanced Patterns'
+}
+
+# Directories inside an example that are build artifacts, not content
+IGNORED_DIRS = {'__pycache__'}
+IGNORED_SUFFIXES = ('.pyc', '.pyo')
+
+
+def category_to_name(category: str) -> str:
+    """Convert category folder name to display name"""
+    return CATEGORY_NAMES.get(category, category.replace('-', ' ').title())
+
+
+def _scan_files(directory: str, prefix: str = '') -> Dict[str, os.stat_result]:
+    """Stat every content file under an example directory, keyed by relative path"""
+    files = {}
+    with os.scandir(directory) as entries:
+        for entry in sorted(entries, key=lambda entry: entry.name):
+            if entry.is_dir():
+                if entry.name not in IGNORED_DIRS:
+                    files.update(_scan_files(entry.path, f"{prefix}{entry.name}/"))
+            elif not entry.name.endswith(IGNORED_SUFFIXES):
+                files[prefix + entry.name] = entry.stat()
+    return files
+
+
+class Example:
+    """
+    One example directory.
+
+    File contents and parsed results are loaded on first access and
+    memoized. A load that fails (missing file, bad JSON, syntax error) is
+    memoized too and re-raised on every access.
+    """
+
+    def __init__(self, path: Path, files: Optional[Dict[str, os.stat_result]] = None):
+        self.path = Path(path)
+        self.name = self.path.name
+        self.category = self.path.parent.name
+        self._files = files
+        self._memo: Dict[str, Any] = {}
+
+    def __repr__(self) -> str:
+        return f"Example({self.key!r})"
+
+    @property
+    def key(self) -> str:
+        """`category/name`, unique across the catalog"""
+        return f"{self.category}/{self.name}"
+
+    @property
+    def category_name(self) -> str:
+        return category_to_name(self.category)
+
+    @property
+    def files(self) -> Dict[str, os.stat_result]:
+        """Relative path → stat result of every content file in the example"""
+        if self._files is None:
+            self._files = _scan_files(str(self.path))
+        return self._files
+
+    def has(self, file_name: str) -> bool:
+        return file_name in self.files
+
+    def stat(self, file_name: str) -> Optional[os.stat_result]:
+        return self.files.get(file_name)
+
+    def _memoized(self, key: str, load: Callable[[], Any]) -> Any:
+        if key not in self._memo:
+            try:
+                self._memo[key] = (True, load())
+            except Exception as e:
+                self._memo[key] = (False, e)
+        ok, value = self._memo[key]
+        if not ok:
+            raise value
+        return value
+
+    def read_bytes(self, file_name: str) -> bytes:
+        """Raw contents of a file in the example"""
+        return self._memoized(f"bytes:{file_name}", lambda: (self.path / file_name).read_bytes())
+
+    def read_text(self, file_name: str) -> str:
+        """Contents of a file decoded as UTF-8, ignoring undecodable bytes"""
+        return self._memoized(f"text:{file_name}",
+                              lambda: self.read_bytes(file_name).decode('utf-8', errors='ignore'))
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """
+        Parsed metadata.json. Shared by every caller, so copy before mutating.
+
+        Raises:
+            FileNotFoundError: If the example has no metadata.json
+            json.JSONDecodeError: If it isn't valid JSON
+        """
+        return self._memoized('metadata', lambda: json.loads(self.read_bytes('metadata.json')))
+
+    def try_metadata(self) -> Optional[Dict[str, Any]]:
+        """Parsed metadata.json, or None if it is missing or invalid"""
+        try:
+            return self.metadata
+        except (OSError, ValueError):
+            return None
+
+    @property
+    def readme(self) -> str:
+        return self.read_text('README.md')
+
+    @property
+    def agent_source(self) -> str:
+        return self.read_text('agent.py')
+
+    @property
+    def agent_analysis(self) -> Dict[str, Any]:
+        """Static analysis of agent.py (see agent_analysis.py)"""
+        return self._memoized('agent_analysis',
+                              lambda: analyze_agent_source(self.agent_source, filename=str(self.path / 'agent.py')))
+
+    @property
+    def status(self) -> str:
+        metadata = self.try_metadata() or {}
+        return metadata.get('status', 'ready')
+
+
+class ExampleCatalog:
+    """
+    Every example under examples/, scanned once.
+
+    Examples are ordered by category folder, then name. Indexes by tag,
+    status and tech provider are built from metadata on first use.
+    """
+
+    def __init__(self, examples_dir: Path = EXAMPLES_DIR):
+        self.examples_dir = Path(examples_dir)
+        self.examples: List[Example] = []
+        self.by_category: Dict[str, List[Example]] = {}
+        self.by_name: Dict[str, Example] = {}
+        self._indexes: Dict[str, Dict[str, List[Example]]] = {}
+
+        with os.scandir(self.examples_dir) as category_entries:
+            categories = [entry for entry in category_entries
+                          if entry.is_dir() and not entry.name.startswith('_')]
+
+        for category in sorted(categories, key=lambda entry: entry.name):
+            with os.scandir(category.path) as example_entries:
+                example_dirs = sorted((entry for entry in example_entries if entry.is_dir()),
+                                      key=lambda entry: entry.name)
+
+            examples = self.by_category.setdefault(category.name, [])
+            for entry in example_dirs:
+                example = Example(Path(entry.path), _scan_files(entry.path))
+                examples.append(example)
+                self.examples.append(example)
+                # Names should be unique; generate_site.py reports duplicates
+                self.by_name.setdefault(example.name, example)
+
+    def __iter__(self) -> Iterator[Example]:
+        return iter(self.examples)
+
+    def __len__(self) -> int:
+        return len(self.examples)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.by_name
+
+    def __getitem__(self, name: str) -> Example:
+        return self.by_name[name]
+
+    @property
+    def categories(self) -> List[str]:
+        return list(self.by_category)
+
+    def _index(self, key: str, values: Callable[[Dict[str, Any]], List[str]]) -> Dict[str, List[Example]]:
+        """Build (once) an index from each metadata value to the examples having it"""
+        if key not in self._indexes:
+            index = {}
+            for example in self.examples:
+                metadata = example.try_metadata()
+                if metadata is None:
+                    continue
+                for value in dict.fromkeys(values(metadata)):
+                    index.setdefault(value, []).append(example)
+            self._indexes[key] = index
+        return self._indexes[key]
+
+    @property
+    def by_tag(self) -> Dict[str, List[Example]]:
+        return self._index('tag', lambda metadata: metadata.get('tags', []))
+
+    @property
+    def by_status(self) -> Dict[str, List[Example]]:
+        return self._index('status', lambda metadata: [metadata.get('status', 'ready')])
+
+    @property
+    def by_provider(self) -> Dict[str, List[Example]]:
+        return self._index('provider', lambda metadata: [
+            tech.get('provider') for tech in metadata.get('tech_stack', []) if isinstance(tech, dict)
+        ])
+
+
+def main():
+    """Print a summary of the catalog, or the examples matching a filter"""
+    parser = argparse.ArgumentParser(description='Inspect the examples catalog')
+    parser.add_argument('--tag', help='List examples with this tag')
+    parser.add_argument('--status', help='List examples with this status')
+    parser.add_argument('--provider', help='List examples using a tech provider (adk, gcp, third, oss)')
+    args = parser.parse_args()
+
+    catalog = ExampleCatalog()
+
+    if args.tag or args.status or args.provider:
+        matches = None
+        for index, value in ((catalog.by_tag, args.tag), (catalog.by_status, args.status),
+                             (catalog.by_provider, args.provider)):
+            if value:
+                found = {example.key for example in index.get(value, [])}
+                matches = found if matches is None else matches & found
+        for key in sorted(matches):
+            print(key)
+        return 0
+
+    print(f"📚 {len(catalog)} examples in {len(catalog.categories)} categories\n")
+    for category, examples in catalog.by_category.items():
+        print(f"  {category_to_name(category):<28} {len(examples):>3}")
+    print(f"\n  Status:    " + ', '.join(f"{status} {len(examples)}" for status, examples in catalog.by_status.items()))
+    print(f"  Providers: " + ', '.join(f"{provider} {len(examples)}" for provider, examples in sorted(catalog.by_provider.items())))
+    print(f"  Tags:      {len(catalog.by_tag)} distinct")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
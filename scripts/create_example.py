@@ -11,29 +11,28 @@ Usage:
         --name "route-to-experts" \\
         --jtbd "When handling diverse requests, I need specialist agents" \\
         --status "coming_soon"
+
+    # Scaffold many examples at once (all or nothing)
+    python scripts/create_example.py --from-manifest sprint3.yaml
 """
 
 import argparse
 import json
 import os
+import shutil
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
-
-
-# Category name mappings
-CATEGORY_NAMES = {
-    '01-getting-started': 'Getting Started',
-    '02-connecting-llms': 'Connecting to LLMs',
-    '03-adding-capabilities': 'Adding Capabilities',
-    '04-orchestrating-agents': 'Orchestrating Agents',
-    '05-managing-context': 'Managing State & Context',
-    '06-going-production': 'Going to Production',
-    '07-advanced-patterns': 'Advanced Patterns'
-}
+from typing import Dict, List, Any, Optional
+
+from catalog import CATEGORY_NAMES, ExampleCatalog
+from metadata_schema import allowed_values, format_errors, validate_metadata_document
+from migrate_metadata import migrate
+
 
 # Provider codes
-PROVIDERS = ['adk', 'gcp', 'third', 'oss']
+PROVIDERS = allowed_values('tech_stack', 'provider')
 
 # Common tech stack items by category (for quick selection)
 COMMON_TECH_STACKS = {
@@ -75,10 +74,8 @@ def create_metadata_template(args: argparse.Namespace) -> Dict[str, Any]:
         "jtbd": args.jtbd,
     }
 
-    # Add tech_stack if provided
-    if args.status == "coming_soon" or args.status == "planned":
-        # For placeholder examples, add empty tech_stack to be filled later
-        metadata["tech_stack"] = []
+    # Required by the schema; filled in once the example is implemented
+    metadata["tech_stack"] = []
 
     metadata.update({
         "description": args.description or "TODO: Add description",
@@ -105,6 +102,9 @@ def create_metadata_template(args: argparse.Namespace) -> Dict[str, Any]:
     if args.sprint:
         metadata["sprint"] = args.sprint
 
+    # Bring new examples up to the current schema version
+    migrate(metadata, args.name)
+
     return metadata
 
 
@@ -233,71 +233,102 @@ TODO: Link to related examples
 '''
 
 
-def create_example(args: argparse.Namespace):
-    """Main function to create a new example"""
+# Defaults shared by the CLI flags and manifest entries
+ARG_DEFAULTS = {
+    'title': None,
+    'description': None,
+    'status': 'ready',
+    'difficulty': 'beginner',
+    'time': '5 minutes',
+    'priority': None,
+    'sprint': None,
+    'source': None,
+    'tags': None,
+}
 
-    # Validate category
+
+def validate_example_args(args: argparse.Namespace, examples_dir: Path,
+                          catalog: Optional[ExampleCatalog] = None) -> Optional[str]:
+    """
+    Check an example definition; return an error message or None.
+
+    The metadata.json it would produce is validated against the schema, so
+    manifest entries (which bypass the argparse choices) are held to the
+    same rules as CLI flags. Names must be unique across all categories.
+    """
     if args.category not in CATEGORY_NAMES:
-        print(f"❌ Error: Invalid category '{args.category}'")
-        print(f"   Valid categories: {', '.join(CATEGORY_NAMES.keys())}")
-        return False
+        return f"Invalid category '{args.category}'. Valid categories: {', '.join(CATEGORY_NAMES.keys())}"
 
-    # Validate status
-    valid_statuses = ["ready", "coming_soon", "planned"]
+    valid_statuses = allowed_values('status')
     if args.status not in valid_statuses:
-        print(f"❌ Error: Invalid status '{args.status}'")
-        print(f"   Valid statuses: {', '.join(valid_statuses)}")
-        return False
+        return f"Invalid status '{args.status}'. Valid statuses: {', '.join(valid_statuses)}"
+
+    if not args.name or not all(c.islower() or c.isdigit() or c == '-' for c in args.name):
+        return f"Example name '{args.name}' must be in kebab-case (e.g., route-to-experts)"
+
+    if not args.jtbd:
+        return f"Example '{args.name}' is missing a JTBD statement"
+
+    example_dir = examples_dir / args.category / args.name
+    if example_dir.exists():
+        return f"Example already exists at {example_dir}"
+
+    catalog = catalog if catalog is not None else ExampleCatalog(examples_dir)
+    if args.name in catalog:
+        return f"Example name '{args.name}' is already used by {catalog[args.name].key}"
+
+    try:
+        errors = validate_metadata_document(create_metadata_template(args))
+    except (AttributeError, TypeError, ValueError) as e:
+        return f"Example '{args.name}' has invalid values: {e}"
+    if errors:
+        return f"Example '{args.name}' would get invalid metadata.json: {format_errors(errors)}"
+
+    return None
+
+
+def render_example_files(args: argparse.Namespace, init_content: Optional[str] = None) -> Dict[str, str]:
+    """Render every file of an example, keyed by file name"""
+    return {
+        'metadata.json': json.dumps(create_metadata_template(args), indent=2),
+        'agent.py': create_agent_template(args),
+        '__init__.py': init_content if init_content is not None else create_init_template(),
+        'README.md': create_readme_template(args, CATEGORY_NAMES[args.category]),
+    }
+
+
+def write_example_files(example_dir: Path, files: Dict[str, str]):
+    """Write rendered files into a directory"""
+    example_dir.mkdir(parents=True, exist_ok=True)
+    for file_name, content in files.items():
+        with open(example_dir / file_name, 'w') as f:
+            f.write(content)
+
+
+def create_example(args: argparse.Namespace):
+    """Main function to create a new example"""
 
     # Find project root
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
     examples_dir = project_root / 'examples'
 
+    error = validate_example_args(args, examples_dir)
+    if error:
+        print(f"❌ Error: {error}")
+        return False
+
     # Create example directory path
     category_dir = examples_dir / args.category
     example_dir = category_dir / args.name
 
-    # Check if example already exists
-    if example_dir.exists():
-        print(f"❌ Error: Example already exists at {example_dir}")
-        return False
-
-    # Create category directory if it doesn't exist
-    category_dir.mkdir(parents=True, exist_ok=True)
-
     # Create example directory
     example_dir.mkdir(parents=True, exist_ok=True)
     print(f"📁 Created directory: {example_dir}")
 
-    # Create metadata.json
-    metadata = create_metadata_template(args)
-    metadata_file = example_dir / 'metadata.json'
-    with open(metadata_file, 'w') as f:
-        json.dump(metadata, f, indent=2)
-    print(f"✅ Created metadata.json")
-
-    # Create agent.py
-    agent_content = create_agent_template(args)
-    agent_file = example_dir / 'agent.py'
-    with open(agent_file, 'w') as f:
-        f.write(agent_content)
-    print(f"✅ Created agent.py")
-
-    # Create __init__.py
-    init_content = create_init_template()
-    init_file = example_dir / '__init__.py'
-    with open(init_file, 'w') as f:
-        f.write(init_content)
-    print(f"✅ Created __init__.py")
-
-    # Create README.md
-    category_name = CATEGORY_NAMES[args.category]
-    readme_content = create_readme_template(args, category_name)
-    readme_file = example_dir / 'README.md'
-    with open(readme_file, 'w') as f:
-        f.write(readme_content)
-    print(f"✅ Created README.md")
+    for file_name, content in render_example_files(args).items():
+        write_example_files(example_dir, {file_name: content})
+        print(f"✅ Created {file_name}")
 
     print(f"\n🎉 Successfully created example: {args.name}")
     print(f"   Location: {example_dir}")
@@ -321,6 +352,127 @@ def create_example(args: argparse.Namespace):
     return True
 
 
+def load_manifest(manifest_path: Path) -> List[argparse.Namespace]:
+    """
+    Load example definitions from a YAML or JSON Lines manifest.
+
+    YAML manifests hold a list of entries (or {'examples': [...]}); JSONL
+    manifests hold one entry per line. Entry keys match the CLI flags.
+    """
+    with open(manifest_path, 'r') as f:
+        text = f.read()
+
+    if manifest_path.suffix in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("PyYAML is required for YAML manifests (pip install pyyaml), or use .jsonl")
+        entries = yaml.safe_load(text) or []
+        if isinstance(entries, dict):
+            entries = entries.get('examples', [])
+    else:
+        entries = [json.loads(line) for line in text.splitlines() if line.strip()]
+
+    definitions = []
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Manifest entry {index} must be a mapping")
+        unknown = set(entry) - set(ARG_DEFAULTS) - {'category', 'name', 'jtbd'}
+        if unknown:
+            raise ValueError(f"Manifest entry {index} has unknown keys: {', '.join(sorted(unknown))}")
+        definitions.append(argparse.Namespace(**{**ARG_DEFAULTS, 'category': None, 'name': None, 'jtbd': None, **entry}))
+
+    return definitions
+
+
+def create_examples_from_manifest(manifest_path: Path, jobs: int = 1, regenerate_site: bool = True) -> bool:
+    """
+    Scaffold every example in a manifest, transactionally.
+
+    All examples are validated first, then rendered into a staging directory
+    inside examples/ and moved into place with a rename each. If anything
+    fails, every example created so far is removed again, so either the whole
+    manifest is applied or nothing is. The site index is regenerated once.
+    """
+    script_dir = Path(__file__).parent
+    examples_dir = script_dir.parent / 'examples'
+
+    try:
+        definitions = load_manifest(manifest_path)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: Could not load manifest {manifest_path}: {e}")
+        return False
+
+    if not definitions:
+        print(f"❌ Error: Manifest {manifest_path} has no examples")
+        return False
+
+    # Validate everything before touching the tree
+    catalog = ExampleCatalog(examples_dir)
+    errors = []
+    seen = set()
+    for args in definitions:
+        error = validate_example_args(args, examples_dir, catalog)
+        if error:
+            errors.append(error)
+        if args.name in seen:
+            errors.append(f"Example '{args.name}' appears more than once in the manifest")
+        seen.add(args.name)
+
+    if errors:
+        print(f"❌ Error: Manifest has {len(errors)} problem(s), nothing was created:")
+        for error in errors:
+            print(f"   └─ {error}")
+        return False
+
+    print(f"🏗️  Scaffolding {len(definitions)} examples from {manifest_path}")
+
+    # The __init__.py template doesn't depend on the example, so render it once
+    init_content = create_init_template()
+
+    # Staging lives under examples/ so the final moves are same-filesystem renames.
+    # The '_' prefix keeps validate_examples.py and generate_site.py from treating it as a category.
+    staging_dir = Path(tempfile.mkdtemp(prefix='_scaffold-', dir=examples_dir))
+    created_dirs = []
+
+    try:
+        def stage(args: argparse.Namespace):
+            files = render_example_files(args, init_content)
+            write_example_files(staging_dir / args.category / args.name, files)
+
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            list(executor.map(stage, definitions))
+
+        for args in definitions:
+            category_dir = examples_dir / args.category
+            if not category_dir.exists():
+                category_dir.mkdir(parents=True)
+                created_dirs.append(category_dir)
+
+            example_dir = category_dir / args.name
+            os.rename(staging_dir / args.category / args.name, example_dir)
+            created_dirs.append(example_dir)
+            print(f"  ✅ {args.category}/{args.name} ({args.status})")
+    except Exception as e:
+        # Roll back in reverse so examples are removed before their new categories
+        for created_dir in reversed(created_dirs):
+            shutil.rmtree(created_dir, ignore_errors=True)
+        print(f"❌ Error: Scaffolding failed, rolled back all {len(definitions)} examples: {e}")
+        return False
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    print(f"\n🎉 Successfully created {len(definitions)} examples")
+
+    if regenerate_site:
+        print(f"\n🔄 Regenerating website index...")
+        from generate_site import generate_examples_json
+        return generate_examples_json()
+
+    print(f"\n🔄 Regenerate website: python scripts/generate_site.py")
+    return True
+
+
 def main():
     """Parse arguments and create example"""
     parser = argparse.ArgumentParser(
@@ -337,6 +489,10 @@ Examples:
       --priority "critical" \\
       --sprint 1
 
+  # Scaffold a whole sprint from a manifest (YAML list or JSON Lines,
+  # one entry per example, keys named like the flags below):
+  python scripts/create_example.py --from-manifest sprint3.yaml --jobs 4
+
   # Create a ready-to-implement example:
   python scripts/create_example.py \\
       --category "01-getting-started" \\
@@ -358,26 +514,32 @@ Categories:
         '''
     )
 
-    parser.add_argument('--category', required=True,
+    parser.add_argument('--from-manifest', type=Path,
+                       help='Create every example in a .yaml or .jsonl manifest (all or nothing)')
+    parser.add_argument('--jobs', type=int, default=1,
+                       help='Render manifest examples with N threads (default: 1)')
+    parser.add_argument('--skip-site', action='store_true',
+                       help="Don't regenerate the website index after --from-manifest")
+    parser.add_argument('--category',
                        help='Category folder (e.g., 04-orchestrating-agents)')
-    parser.add_argument('--name', required=True,
+    parser.add_argument('--name',
                        help='Example name (kebab-case, e.g., route-to-experts)')
-    parser.add_argument('--jtbd', required=True,
+    parser.add_argument('--jtbd',
                        help='Job-to-be-Done statement')
     parser.add_argument('--title',
                        help='Display title (defaults to name in Title Case)')
     parser.add_argument('--description',
                        help='Short description of the example')
     parser.add_argument('--status', default='ready',
-                       choices=['ready', 'coming_soon', 'planned'],
+                       choices=allowed_values('status'),
                        help='Example status (default: ready)')
     parser.add_argument('--difficulty', default='beginner',
-                       choices=['beginner', 'intermediate', 'advanced'],
+                       choices=allowed_values('difficulty'),
                        help='Difficulty level (default: beginner)')
     parser.add_argument('--time', default='5 minutes',
                        help='Time to complete (default: 5 minutes)')
     parser.add_argument('--priority',
-                       choices=['critical', 'high', 'medium', 'low'],
+                       choices=allowed_values('priority'),
                        help='Priority for coming_soon examples')
     parser.add_argument('--sprint', type=int,
                        help='Sprint number for coming_soon examples')
@@ -388,6 +550,17 @@ Categories:
 
     args = parser.parse_args()
 
+    if args.from_manifest:
+        if args.jobs < 1:
+            parser.error('--jobs must be at least 1')
+        success = create_examples_from_manifest(args.from_manifest, jobs=args.jobs,
+                                                regenerate_site=not args.skip_site)
+        return 0 if success else 1
+
+    missing = [flag for flag in ('category', 'name', 'jtbd') if not getattr(args, flag)]
+    if missing:
+        parser.error(f"the following arguments are required: {', '.join('--' + flag for flag in missing)}")
+
     # Validate name format (kebab-case)
     if not all(c.islower() or c.isdigit() or c == '-' for c in args.name):
         print("❌ Error: Example name must be in kebab-case (e.g., route-to-experts)")
@@ -4,104 +4,352 @@ Generate examples.json for the website from all example metadata.
 
 This script scans all examples and creates a JSON file that the website
 can use to dynamically display all available examples.
+
+Builds are incremental: a manifest in .cache/site/ remembers the stat
+signature and hash of every metadata.json, so only changed files are
+re-parsed, and outputs whose content is unchanged are not rewritten (which
+keeps static hosting ETags and CDN caches valid).
+
+Besides examples.json, the build writes the data the page loads to
+website/data/: a small index with only the fields needed to render the
+cards and filters, and a ranked search index (see search_index.py). The
+remaining fields (what_youll_learn, requirements, ...) aren't shown on
+the page and stay in examples.json only. Related examples are computed from metadata similarity
+(see related_examples.py) and merged with the hand-maintained `related`
+lists, which are checked against the catalog. Shards are minified, named
+by content hash, listed in data/manifest.json, and precompressed to .gz
+(and .br when the optional `brotli` package is installed).
+
+Usage:
+    python scripts/generate_site.py            # incremental build
+    python scripts/generate_site.py --force    # ignore the manifest
+    python scripts/generate_site.py --watch    # rebuild on metadata edits
 """
 
+import argparse
+import copy
+import gzip
+import hashlib
 import json
 import os
+import time
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 
+from catalog import Example, ExampleCatalog, EXAMPLES_DIR, category_to_name
+from metadata_schema import default_values, format_errors, validate_catalog
+from related_examples import build_related_graph, find_unknown_related, merge_related
+from search_index import build_search_index
 
-def load_example_metadata(example_path: Path) -> Dict[str, Any]:
-    """Load metadata for a single example"""
-    metadata_file = example_path / 'metadata.json'
 
-    if not metadata_file.exists():
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+WEBSITE_DIR = PROJECT_ROOT / 'website'
+DATA_DIR = WEBSITE_DIR / 'data'
+MANIFEST_FILE = PROJECT_ROOT / '.cache' / 'site' / 'manifest.json'
+
+# Fields the page needs to render a card and its filters; everything else
+# is only in examples.json
+INDEX_FIELDS = [
+    'id', 'title', 'jtbd', 'description', 'category_name', 'path', 'language',
+    'difficulty', 'status', 'time_to_complete', 'tags', 'tech_stack',
+]
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def load_example_metadata(example: Example) -> Dict[str, Any]:
+    """Load metadata for a single example"""
+    if not example.has('metadata.json'):
         return None
 
     try:
-        with open(metadata_file, 'r') as f:
-            metadata = json.load(f)
+        # The catalog's parsed copy is shared with other scripts, so enrich a copy
+        metadata = copy.deepcopy(example.metadata)
+
+        # Migration bookkeeping, not catalog data
+        metadata.pop('schema_version', None)
 
         # Add the path information
-        category = example_path.parent.name
+        category = example.category
+        metadata['id'] = example.name
         metadata['category'] = category
         metadata['category_name'] = category_to_name(category)
-        metadata['path'] = f"{category}/{example_path.name}"
-        metadata['github_url'] = f"https://github.com/lavinigam-gcp/adk-by-example/tree/main/examples/{category}/{example_path.name}"
-        metadata['command'] = f"adk web # Select '{example_path.name.replace('-', '_')}'"
-
-        # Ensure tech_stack field exists (even if empty) for consistent schema
-        if 'tech_stack' not in metadata:
-            metadata['tech_stack'] = []
+        metadata['path'] = example.key
+        metadata['github_url'] = f"https://github.com/lavinigam-gcp/adk-by-example/tree/main/examples/{category}/{example.name}"
+        metadata['command'] = f"adk web # Select '{example.name.replace('-', '_')}'"
 
-        # Ensure status field exists (default to 'ready')
-        if 'status' not in metadata:
-            metadata['status'] = 'ready'
-
-        # Ensure language field exists (default to 'python')
-        if 'language' not in metadata:
-            metadata['language'] = 'python'
+        # Fill fields older files may lack with the schema's defaults
+        for field, default in default_values().items():
+            if field not in metadata:
+                metadata[field] = copy.deepcopy(default)
 
         return metadata
     except Exception as e:
-        print(f"Warning: Could not load metadata for {example_path}: {e}")
+        print(f"Warning: Could not load metadata for {example.path}: {e}")
         return None
 
 
-def category_to_name(category: str) -> str:
-    """Convert category folder name to display name"""
-    category_names = {
-        '01-getting-started': 'Getting Started',
-        '02-connecting-llms': 'Connecting to LLMs',
-        '03-adding-capabilities': 'Adding Capabilities',
-        '04-orchestrating-agents': 'Orchestrating Agents',
-        '05-managing-context': 'Managing State & Context',
-        '06-going-production': 'Going to Production',
-        '07-advanced-patterns': 'Advanced Patterns'
+def load_manifest(force: bool = False) -> Dict[str, Any]:
+    """
+    Load the build manifest.
+
+    The manifest is discarded when this script, the catalog or the schema
+    changes, since cached metadata was loaded and enriched (with the
+    schema's defaults) by the previous versions.
+    """
+    digest = hashlib.sha256()
+    for source in (Path(__file__), SCRIPT_DIR / 'catalog.py', SCRIPT_DIR / 'metadata_schema.json'):
+        digest.update(source.read_bytes())
+    generator_hash = digest.hexdigest()
+    empty = {'generator': generator_hash, 'inputs': {}, 'outputs': {}}
+
+    if force or not MANIFEST_FILE.exists():
+        return empty
+
+    try:
+        with open(MANIFEST_FILE, 'r') as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return empty
+
+    if manifest.get('generator') != generator_hash:
+        return empty
+    return manifest
+
+
+def save_manifest(manifest: Dict[str, Any]):
+    """Atomically write the build manifest"""
+    MANIFEST_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = MANIFEST_FILE.with_suffix('.tmp')
+    with open(tmp_file, 'w') as f:
+        json.dump(manifest, f)
+    os.replace(tmp_file, MANIFEST_FILE)
+
+
+def load_example_metadata_cached(example: Example, manifest: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """
+    Load metadata for an example, reusing the manifest entry when the file is unchanged.
+
+    Returns (metadata, reparsed). A matching mtime and size (from the
+    catalog scan) skips reading the file at all; a touched but identical
+    file is detected by its hash.
+    """
+    entry = manifest['inputs'].get(example.key)
+    stat = example.stat('metadata.json')
+    signature = [stat.st_mtime_ns, stat.st_size]
+
+    if entry and entry['stat'] == signature:
+        return entry['metadata'], False
+
+    digest = hashlib.sha256(example.read_bytes('metadata.json')).hexdigest()
+    if entry and entry['sha256'] == digest:
+        entry['stat'] = signature
+        return entry['metadata'], False
+
+    metadata = load_example_metadata(example)
+    if metadata is not None:
+        manifest['inputs'][example.key] = {'stat': signature, 'sha256': digest, 'metadata': metadata}
+    return metadata, True
+
+
+def write_if_changed(output_file: Path, content: str, manifest: Dict[str, Any]) -> bool:
+    """
+    Write an output file only if its content hash changed.
+
+    Returns True if the file was (re)written.
+    """
+    data = content.encode('utf-8')
+    digest = hashlib.sha256(data).hexdigest()
+    entry = manifest['outputs'].get(output_file.name)
+
+    if output_file.exists():
+        stat = output_file.stat()
+        if entry and entry['sha256'] == digest and entry['stat'] == [stat.st_mtime_ns, stat.st_size]:
+            return False
+        # The manifest may be missing or stale; fall back to comparing bytes
+        if stat.st_size == len(data) and hashlib.sha256(output_file.read_bytes()).hexdigest() == digest:
+            manifest['outputs'][output_file.name] = {'sha256': digest, 'stat': [stat.st_mtime_ns, stat.st_size]}
+            return False
+
+    tmp_file = output_file.with_suffix(output_file.suffix + '.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_file, output_file)
+
+    stat = output_file.stat()
+    manifest['outputs'][output_file.name] = {'sha256': digest, 'stat': [stat.st_mtime_ns, stat.st_size]}
+    return True
+
+
+def dump_json(data: Any, pretty: bool = False) -> str:
+    """Serialize output JSON, minified unless pretty output is requested"""
+    if pretty:
+        return json.dumps(data, indent=2)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+
+
+def facet_values(example: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Values an example has for each filterable facet"""
+    tech_stack = example.get('tech_stack', [])
+    return {
+        'category': [example['category_name']],
+        'language': [example.get('language', 'python')],
+        'difficulty': [example.get('difficulty')],
+        'status': [example.get('status', 'ready')],
+        'provider': sorted({tech.get('provider') for tech in tech_stack if tech.get('provider')}),
+        'tech': sorted({tech.get('name') for tech in tech_stack if tech.get('name')}),
     }
-    return category_names.get(category, category.replace('-', ' ').title())
 
 
-def generate_examples_json():
-    """Generate the examples.json file for the website"""
+def build_facets(all_examples: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Precompute facet postings as bitsets over example positions.
+
+    Bit i of a bitset is set when all_examples[i] has that facet value.
+    Bitsets are lists of 32-bit words so the page can combine filters with
+    bitwise OR (within a facet) and AND (across facets) instead of walking
+    every card. Counts are the number of examples per facet value.
 
-    # Find the examples directory
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
-    examples_dir = project_root / 'examples'
-    website_dir = project_root / 'website'
+    Returns:
+        {'size': len(all_examples), 'bitsets': {facet: {value: [word, ...]}},
+         'counts': {facet: {value: count}}}
+    """
+    words = (len(all_examples) + 31) // 32
+    bitsets = {}
 
-    if not examples_dir.exists():
-        print(f"Error: Examples directory not found at {examples_dir}")
-        return False
+    for doc, example in enumerate(all_examples):
+        for facet, values in facet_values(example).items():
+            for value in values:
+                bits = bitsets.setdefault(facet, {}).setdefault(value, [0] * words)
+                bits[doc >> 5] |= 1 << (doc & 31)
+
+    counts = {
+        facet: {value: sum(bin(word).count('1') for word in bits) for value, bits in values.items()}
+        for facet, values in bitsets.items()
+    }
+
+    return {'size': len(all_examples), 'bitsets': bitsets, 'counts': counts}
+
+
+def build_shards(all_examples: List[Dict[str, Any]], examples_by_category: Dict[str, List[str]],
+                 output: Dict[str, Any], related_graph: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Split the catalog into a compact index, a ranked search index and the
+    related-examples graph.
+
+    Returns a mapping of logical artifact name to content.
+    """
+    return {
+        'index': {
+            'version': output['version'],
+            'total_examples': output['total_examples'],
+            'categories': output['categories'],
+            'language_counts': output['language_counts'],
+            'facets': output['facets'],
+            'examples': [{field: example[field] for field in INDEX_FIELDS if field in example}
+                         for example in all_examples],
+            'examples_by_category': examples_by_category,
+        },
+        'search': build_search_index(all_examples),
+        'related': {**related_graph, 'related': output['related']},
+    }
+
+
+def write_hashed_artifacts(artifacts: Dict[str, Any], manifest: Dict[str, Any],
+                           pretty: bool = False) -> Tuple[Dict[str, str], int]:
+    """
+    Write content-hashed, precompressed artifacts to website/data/.
+
+    Hashed files are immutable, so a file that already exists is never
+    rewritten; each compressed sibling is checked on its own, so one that
+    is missing (e.g. after an interrupted build) is written again. Files
+    from previous builds that are no longer referenced are removed.
+    Returns (logical name -> file name, number of files written).
+    """
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    files = {}
+    written = 0
+
+    for name, content in artifacts.items():
+        data = dump_json(content, pretty).encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        file_name = f"{name.replace('/', '-')}.{digest}.json"
+        files[name] = file_name
+
+        encoders = {
+            '': lambda: data,
+            '.gz': lambda: gzip.compress(data, compresslevel=9, mtime=0),
+        }
+        if brotli is not None:
+            encoders['.br'] = lambda: brotli.compress(data, quality=11)
+
+        # Siblings are replaced atomically, so any file that exists is complete
+        missing = {suffix: encode for suffix, encode in encoders.items()
+                   if not (DATA_DIR / f"{file_name}{suffix}").exists()}
+        for suffix, encode in missing.items():
+            tmp_file = DATA_DIR / f"{file_name}{suffix}.tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(encode())
+            os.replace(tmp_file, DATA_DIR / f"{file_name}{suffix}")
+        written += bool(missing)
+
+    # The manifest itself is small and must never be cached by name
+    data_manifest = {'version': 1, 'files': files}
+    written += write_if_changed(DATA_DIR / 'manifest.json', dump_json(data_manifest, pretty), manifest)
+
+    keep = set(files.values())
+    for entry in os.scandir(DATA_DIR):
+        base_name = entry.name.removesuffix('.gz').removesuffix('.br')
+        if base_name != 'manifest.json' and base_name not in keep:
+            os.remove(entry.path)
+
+    return files, written
+
+
+def generate_examples_json(force: bool = False, quiet: bool = False, pretty: bool = False,
+                           catalog: Optional[ExampleCatalog] = None):
+    """
+    Generate the examples.json file for the website.
+
+    Pass the `catalog` another script already loaded (validate_examples.py
+    --generate-site) to reuse its file reads instead of scanning again.
+    """
+    examples_dir = EXAMPLES_DIR
+    website_dir = WEBSITE_DIR
+
+    if catalog is None:
+        if not examples_dir.exists():
+            print(f"Error: Examples directory not found at {examples_dir}")
+            return False
+        catalog = ExampleCatalog(examples_dir)
 
     # Create website directory if it doesn't exist
     website_dir.mkdir(exist_ok=True)
 
+    manifest = load_manifest(force)
+    seen_keys = set()
+    reparsed_count = 0
+
     # Collect all examples
     all_examples = []
     examples_by_category = {}
 
-    # Get all category directories
-    categories = sorted([d for d in examples_dir.iterdir()
-                        if d.is_dir() and not d.name.startswith('_')])
+    for example in catalog:
+        if not example.has('metadata.json'):
+            continue
+        seen_keys.add(example.key)
+        metadata, reparsed = load_example_metadata_cached(example, manifest)
+        reparsed_count += reparsed
+        if metadata:
+            all_examples.append(metadata)
+            examples_by_category.setdefault(metadata['category_name'], []).append(metadata['id'])
 
-    for category_dir in categories:
-        category_name = category_to_name(category_dir.name)
-        examples_by_category[category_name] = []
-
-        # Get all example directories in this category
-        examples = sorted([d for d in category_dir.iterdir() if d.is_dir()])
-
-        for example_dir in examples:
-            metadata = load_example_metadata(example_dir)
-            if metadata:
-                all_examples.append(metadata)
-                examples_by_category[category_name].append(metadata)
-
-    # Remove empty categories
-    examples_by_category = {k: v for k, v in examples_by_category.items() if v}
+    # Forget examples that were deleted or renamed
+    manifest['inputs'] = {key: entry for key, entry in manifest['inputs'].items() if key in seen_keys}
 
     # Calculate language statistics
     language_counts = {}
@@ -109,29 +357,50 @@ def generate_examples_json():
         lang = example.get('language', 'python')
         language_counts[lang] = language_counts.get(lang, 0) + 1
 
-    # Create the output structure
+    # Example ids are used as references, so they must be unique
+    seen_ids = set()
+    for example in all_examples:
+        if example['id'] in seen_ids:
+            print(f"Error: Duplicate example name '{example['id']}' ({example['path']})")
+            return False
+        seen_ids.add(example['id'])
+    examples_by_id = {example['id']: example for example in all_examples}
+
+    # Schema problems don't block the build (validate_examples.py fails them),
+    # but report them all in one pass
+    for path, errors in validate_catalog({example['path']: example for example in all_examples}).items():
+        print(f"Warning: Invalid metadata for {path}: {format_errors(errors)}")
+
+    # Manual related entries must name real examples; computed neighbors fill the rest
+    for example_id, missing in find_unknown_related(all_examples).items():
+        print(f"Warning: {example_id} lists unknown related examples: {', '.join(missing)}")
+    related_graph = build_related_graph(all_examples)
+
+    # Create the output structure. Categories reference examples by id
+    # instead of repeating them.
     output = {
         'version': '1.0',
         'total_examples': len(all_examples),
         'categories': list(examples_by_category.keys()),
         'language_counts': language_counts,
+        'facets': build_facets(all_examples),
         'examples': all_examples,
-        'examples_by_category': examples_by_category
+        'examples_by_category': examples_by_category,
+        'related': merge_related(all_examples, related_graph),
     }
 
     # Write to website directory
     output_file = website_dir / 'examples.json'
-    with open(output_file, 'w') as f:
-        json.dump(output, f, indent=2)
+    written = write_if_changed(output_file, dump_json(output, pretty), manifest)
 
-    print(f"✅ Generated examples.json with {len(all_examples)} examples")
-    print(f"   Categories: {', '.join(examples_by_category.keys())}")
-    print(f"   Languages: {', '.join([f'{lang} ({count})' for lang, count in language_counts.items()])}")
-    print(f"   Output: {output_file}")
+    # Sharded, precompressed copy for the website
+    shard_files, shards_written = write_hashed_artifacts(
+        build_shards(all_examples, examples_by_category, output, related_graph), manifest, pretty)
 
     # Also create a simplified version for the website
     simple_output = {}
-    for category_name, examples in examples_by_category.items():
+    for category_name, example_ids in examples_by_category.items():
+        examples = [examples_by_id[example_id] for example_id in example_ids]
         simple_output[category_name] = [
             {
                 'title': ex['title'],
@@ -145,15 +414,74 @@ def generate_examples_json():
         ]
 
     simple_file = website_dir / 'examples_simple.json'
-    with open(simple_file, 'w') as f:
-        json.dump(simple_output, f, indent=2)
+    written_simple = write_if_changed(simple_file, dump_json(simple_output, pretty), manifest)
+
+    save_manifest(manifest)
+
+    if not quiet:
+        print(f"✅ Generated examples.json with {len(all_examples)} examples")
+        print(f"   Categories: {', '.join(examples_by_category.keys())}")
+        print(f"   Languages: {', '.join([f'{lang} ({count})' for lang, count in language_counts.items()])}")
+        print(f"   Output: {output_file}")
+        index_size = (DATA_DIR / shard_files['index']).stat().st_size
+        gz_size = (DATA_DIR / f"{shard_files['index']}.gz").stat().st_size
+        print(f"   Shards: {len(shard_files)} in {DATA_DIR} (index {index_size / 1024:.1f} KB, "
+              f"{gz_size / 1024:.1f} KB gzipped{'' if brotli else '; install brotli for .br'})")
+    print(f"   Re-parsed: {reparsed_count}/{len(all_examples)} metadata files; "
+          f"rewritten: {', '.join(name for name, changed in [('examples.json', written), ('examples_simple.json', written_simple)] if changed) or 'none'}, "
+          f"{shards_written} data files")
 
     return True
 
 
+def watch(interval: float, pretty: bool = False):
+    """Poll metadata files and rebuild whenever one changes"""
+    def snapshot():
+        snapshot = {}
+        for example in ExampleCatalog(EXAMPLES_DIR):
+            stat = example.stat('metadata.json')
+            if stat:
+                snapshot[example.key] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    print(f"👀 Watching {EXAMPLES_DIR} for metadata changes (every {interval * 1000:.0f} ms, Ctrl+C to stop)")
+    generate_examples_json(pretty=pretty)
+    previous = snapshot()
+
+    try:
+        while True:
+            time.sleep(interval)
+            current = snapshot()
+            if current != previous:
+                changed = sorted(path for path in current.keys() | previous.keys()
+                                 if current.get(path) != previous.get(path))
+                start = time.perf_counter()
+                print(f"\n🔄 {len(changed)} changed: {', '.join(changed)}")
+                generate_examples_json(quiet=True, pretty=pretty)
+                print(f"   Rebuilt in {(time.perf_counter() - start) * 1000:.1f} ms")
+                previous = current
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+
+
 def main():
     """Main entry point"""
-    success = generate_examples_json()
+    parser = argparse.ArgumentParser(description='Generate website/examples.json from example metadata')
+    parser.add_argument('--force', action='store_true',
+                        help='Ignore the build manifest and re-parse everything')
+    parser.add_argument('--pretty', action='store_true',
+                        help='Indent JSON output instead of minifying it')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and rebuild when metadata changes')
+    parser.add_argument('--interval', type=float, default=0.1,
+                        help='Polling interval in seconds for --watch (default: 0.1)')
+    args = parser.parse_args()
+
+    if args.watch:
+        watch(args.interval, pretty=args.pretty)
+        exit(0)
+
+    success = generate_examples_json(force=args.force, pretty=args.pretty)
     exit(0 if success else 1)
 
 
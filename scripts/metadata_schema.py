@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+The metadata.json schema, compiled once into a validator.
+
+metadata_schema.json is the single source of truth for what a metadata.json
+may contain. At import time it is compiled into nested closures that walk a
+document and collect every error with its JSON path
+(`$.tech_stack[2].provider`) instead of stopping at the first one.
+
+This is not faster than the hand-written checks it replaced (see
+--benchmark): it trades a fraction of a millisecond per catalog for full
+error reports and one place to change the rules.
+
+Supports the subset of JSON Schema the file uses: type, enum, required,
+properties, items, minLength, minimum, default and local $ref.
+
+Usage:
+    python scripts/metadata_schema.py               # validate the whole catalog
+    python scripts/metadata_schema.py --benchmark   # vs. the old hand-written checks
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Any, List, Tuple
+
+from catalog import Example, ExampleCatalog
+
+
+SCHEMA_FILE = Path(__file__).parent / 'metadata_schema.json'
+
+# JSON Schema type names → Python types (bool is excluded from the numeric types below)
+JSON_TYPES = {
+    'object': dict,
+    'array': list,
+    'string': str,
+    'integer': int,
+    'number': (int, float),
+    'boolean': bool,
+    'null': type(None),
+}
+
+Error = Tuple[str, str]
+Validator = Callable[[Any, str, List[Error]], None]
+
+
+def _resolve(schema: Dict[str, Any], root: Dict[str, Any]) -> Dict[str, Any]:
+    """Follow a local `#/...` $ref"""
+    while '$ref' in schema:
+        node = root
+        for part in schema['$ref'].lstrip('#/').split('/'):
+            node = node[part]
+        schema = node
+    return schema
+
+
+def _compile(schema: Dict[str, Any], root: Dict[str, Any]) -> Validator:
+    """Compile one schema node into a validator(value, path, errors) closure"""
+    schema = _resolve(schema, root)
+    checks: List[Validator] = []
+
+    if 'type' in schema:
+        type_name = schema['type']
+        expected = JSON_TYPES[type_name]
+
+        def check_type(value, path, errors):
+            if not isinstance(value, expected) or (isinstance(value, bool) and type_name in ('integer', 'number')):
+                errors.append((path, f"expected {type_name}, got {type(value).__name__}"))
+                return False
+            return True
+        checks.append(check_type)
+
+    if 'enum' in schema:
+        allowed = schema['enum']
+        allowed_set = set(allowed)
+        allowed_text = ', '.join(allowed)
+
+        def check_enum(value, path, errors):
+            if not isinstance(value, str) or value not in allowed_set:
+                errors.append((path, f"{value!r} is not one of {allowed_text}"))
+                return False
+            return True
+        checks.append(check_enum)
+
+    if 'minLength' in schema:
+        min_length = schema['minLength']
+
+        def check_min_length(value, path, errors):
+            if isinstance(value, str) and len(value) < min_length:
+                errors.append((path, f"must be at least {min_length} characters"))
+            return True
+        checks.append(check_min_length)
+
+    if 'minimum' in schema:
+        minimum = schema['minimum']
+
+        def check_minimum(value, path, errors):
+            if isinstance(value, (int, float)) and not isinstance(value, bool) and value < minimum:
+                errors.append((path, f"must be >= {minimum}"))
+            return True
+        checks.append(check_minimum)
+
+    if 'required' in schema:
+        required = schema['required']
+
+        def check_required(value, path, errors):
+            if isinstance(value, dict):
+                for field in required:
+                    if field not in value:
+                        errors.append((path, f"missing required field '{field}'"))
+            return True
+        checks.append(check_required)
+
+    if 'properties' in schema:
+        properties = {name: _compile(sub, root) for name, sub in schema['properties'].items()}
+
+        def check_properties(value, path, errors):
+            if isinstance(value, dict):
+                for name, validate in properties.items():
+                    if name in value:
+                        validate(value[name], f"{path}.{name}", errors)
+            return True
+        checks.append(check_properties)
+
+    if 'items' in schema:
+        validate_item = _compile(schema['items'], root)
+
+        def check_items(value, path, errors):
+            if isinstance(value, list):
+                for index, item in enumerate(value):
+                    validate_item(item, f"{path}[{index}]", errors)
+            return True
+        checks.append(check_items)
+
+    def validate(value, path, errors):
+        # A failed type or enum check makes the remaining checks meaningless
+        for check in checks:
+            if check(value, path, errors) is False:
+                return
+    return validate
+
+
+def compile_schema(schema: Dict[str, Any]) -> Callable[[Any], List[Error]]:
+    """
+    Compile a JSON Schema into a function returning every error.
+
+    Returns:
+        validate(document) -> [(json_path, message), ...], empty if valid
+    """
+    validate = _compile(schema, schema)
+
+    def validate_document(document: Any) -> List[Error]:
+        errors: List[Error] = []
+        validate(document, '$', errors)
+        return errors
+    return validate_document
+
+
+def load_schema() -> Dict[str, Any]:
+    """Load the metadata.json schema"""
+    with open(SCHEMA_FILE, 'r') as f:
+        return json.load(f)
+
+
+METADATA_SCHEMA = load_schema()
+validate_metadata_document = compile_schema(METADATA_SCHEMA)
+
+
+def allowed_values(*path: str) -> List[str]:
+    """
+    Enum of a metadata property, following nested objects and arrays.
+
+    allowed_values('status') → ['ready', 'coming_soon', 'planned']
+    allowed_values('tech_stack', 'provider') → ['adk', 'gcp', 'third', 'oss']
+    """
+    node = METADATA_SCHEMA
+    for name in path:
+        node = _resolve(node, METADATA_SCHEMA)
+        if 'items' in node:
+            node = _resolve(node['items'], METADATA_SCHEMA)
+        node = node['properties'][name]
+    return list(_resolve(node, METADATA_SCHEMA)['enum'])
+
+
+def default_values() -> Dict[str, Any]:
+    """Top-level properties with a default, for filling gaps in older files"""
+    return {
+        name: prop['default']
+        for name, prop in METADATA_SCHEMA['properties'].items()
+        if 'default' in prop
+    }
+
+
+def format_errors(errors: List[Error]) -> str:
+    """One line per error: `$.path: message`"""
+    return '; '.join(f"{path}: {message}" for path, message in errors)
+
+
+def validate_catalog(documents: Dict[str, Any]) -> Dict[str, List[Error]]:
+    """Validate many metadata documents in one pass; returns only the invalid ones"""
+    results = {}
+    for key, document in documents.items():
+        errors = validate_metadata_document(document)
+        if errors:
+            results[key] = errors
+    return results
+
+
+def load_catalog_documents(examples_dir: Path) -> Dict[str, Any]:
+    """Parse every metadata.json under examples/, keyed by category/name"""
+    return {example.key: example.metadata for example in ExampleCatalog(examples_dir)
+            if example.has('metadata.json')}
+
+
+def legacy_validate_metadata(example_path: Path) -> Tuple[bool, str]:
+    """The hand-written validate_metadata() validate_examples.py used before the schema, for benchmarking"""
+    with open(example_path / 'metadata.json', 'r') as f:
+        metadata = json.load(f)
+
+    required_fields = ['title', 'jtbd', 'language', 'description', 'difficulty', 'tags', 'tech_stack']
+    missing_fields = [field for field in required_fields if field not in metadata]
+    if missing_fields:
+        return False, f"Metadata missing fields: {', '.join(missing_fields)}"
+
+    valid_languages = ['python', 'go', 'typescript', 'java']
+    if metadata.get('language') not in valid_languages:
+        return False, f"Invalid language: {metadata.get('language')}. Valid: {', '.join(valid_languages)}"
+    if metadata.get('difficulty') not in ['beginner', 'intermediate', 'advanced']:
+        return False, f"Invalid difficulty: {metadata.get('difficulty')}"
+
+    tech_stack = metadata.get('tech_stack', [])
+    if not isinstance(tech_stack, list):
+        return False, "tech_stack must be an array"
+    valid_providers = ['adk', 'gcp', 'third', 'oss']
+    for idx, tech in enumerate(tech_stack):
+        if not isinstance(tech, dict):
+            return False, f"tech_stack[{idx}] must be an object"
+        for tech_field in ['name', 'provider', 'icon', 'description']:
+            if tech_field not in tech:
+                return False, f"tech_stack[{idx}] missing '{tech_field}'"
+        if tech.get('provider') not in valid_providers:
+            return False, (f"tech_stack[{idx}] has invalid provider '{tech.get('provider')}'. "
+                           f"Valid: {', '.join(valid_providers)}")
+
+    if 'status' in metadata:
+        valid_statuses = ['ready', 'coming_soon', 'planned']
+        if metadata.get('status') not in valid_statuses:
+            return False, f"Invalid status: {metadata.get('status')}. Valid: {', '.join(valid_statuses)}"
+
+    tech_count = len(tech_stack)
+    status = metadata.get('status', 'ready')
+    return True, f"Metadata valid (lang: {metadata['language']}, tech_stack: {tech_count}, status: {status})"
+
+
+def benchmark(examples_dir: Path, repeat: int):
+    """Time validating the catalog with the old hand-written checks and with the schema"""
+    from validate_examples import validate_metadata
+
+    documents = load_catalog_documents(examples_dir)
+    example_paths = [examples_dir / key for key in documents]
+
+    def timed(func) -> float:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        return (time.perf_counter() - start) / repeat * 1000
+
+    # Each call reads and parses every metadata.json, like a validate_examples.py run
+    legacy_ms = timed(lambda: [legacy_validate_metadata(path) for path in example_paths])
+    # A fresh Example per call, so its memoized metadata is not reused
+    schema_ms = timed(lambda: [validate_metadata(Example(path)) for path in example_paths])
+    # Checks alone, on already parsed documents
+    schema_only_ms = timed(lambda: validate_catalog(documents))
+
+    start = time.perf_counter()
+    compile_schema(load_schema())
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    print(f"Catalog: {len(documents)} metadata files, {repeat} repetitions\n")
+    print(f"{'Validation pass':<52} {'ms/catalog':>10}")
+    print("-" * 64)
+    print(f"{'Before: hand-written checks (read+parse, 1st error)':<52} {legacy_ms:>10.3f}")
+    print(f"{'After: schema validator (read+parse, all errors)':<52} {schema_ms:>10.3f}")
+    print(f"{'Schema validator alone (parsed documents)':<52} {schema_only_ms:>10.3f}")
+    print(f"\nSchema compile (once per process): {compile_ms:.3f} ms")
+    print(f"The schema costs {schema_ms - legacy_ms:+.3f} ms per catalog in exchange for every error "
+          f"with its JSON path and a single definition of the rules.")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Validate every metadata.json against the schema')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Compare catalog validation time with the old hand-written checks')
+    parser.add_argument('--repeat', type=int, default=200,
+                        help='Benchmark repetitions (default: 200)')
+    args = parser.parse_args()
+
+    examples_dir = Path(__file__).parent.parent / 'examples'
+
+    if args.benchmark:
+        benchmark(examples_dir, args.repeat)
+        return 0
+
+    documents = load_catalog_documents(examples_dir)
+    invalid = validate_catalog(documents)
+
+    for key, errors in invalid.items():
+        print(f"❌ {key}")
+        for path, message in errors:
+            print(f"   └─ {path}: {message}")
+
+    if invalid:
+        print(f"\n{len(invalid)} of {len(documents)} metadata files invalid")
+        return 1
+
+    print(f"✅ All {len(documents)} metadata files match {SCHEMA_FILE.name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,69 @@
 #!/usr/bin/env python3
 """
-Populate tech_stack fields for all coming_soon examples based on ADK documentation.
+Apply versioned migrations to every example's metadata.json.
+
+Migrations are registered in order with @migration(version). Each file
+records the last version applied in `schema_version`, so a file is only
+handed the migrations newer than that. The tree is scanned once by
+ExampleCatalog (see catalog.py), whose name index gives each migration the
+example it is running on; changed files are written in parallel via a temp file
+and rename so a crash never leaves a half-written metadata.json.
+
+Usage:
+    python scripts/migrate_metadata.py              # apply pending migrations
+    python scripts/migrate_metadata.py --dry-run    # show a diff, write nothing
+    python scripts/migrate_metadata.py --list       # list registered migrations
 """
+
+import argparse
+import difflib
 import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable, Dict, Any, List, Tuple
+
+from catalog import ExampleCatalog, EXAMPLES_DIR
+
+
+@dataclass
+class Migration:
+    """A registered metadata migration"""
+    version: int
+    name: str
+    description: str
+    apply: Callable[[Dict[str, Any], str], bool]
+
+
+# Registered migrations, in version order
+MIGRATIONS: List[Migration] = []
+
+
+def migration(version: int):
+    """
+    Register a migration function.
+
+    The function receives (metadata, example_name), mutates metadata in place
+    and returns True if it changed anything. Versions must be registered in
+    increasing order and are never reused once released.
+    """
+    def register(func: Callable[[Dict[str, Any], str], bool]):
+        if MIGRATIONS and version <= MIGRATIONS[-1].version:
+            raise ValueError(f"Migration {func.__name__} has version {version}, "
+                             f"expected > {MIGRATIONS[-1].version}")
+        MIGRATIONS.append(Migration(version, func.__name__, (func.__doc__ or '').strip(), func))
+        return func
+    return register
+
+
+def latest_schema_version() -> int:
+    """Schema version of a fully migrated metadata.json"""
+    return MIGRATIONS[-1].version if MIGRATIONS else 0
+
 
 # Tech stack definitions based on ADK documentation
 TECH_STACKS = {
@@ -124,50 +184,176 @@ TECH_STACKS = {
     ],
 }
 
+@migration(1)
+def add_language(metadata: Dict[str, Any], example_name: str) -> bool:
+    """Add "language": "python" after the jtbd field"""
+    if 'language' in metadata:
+        return False
 
-def update_metadata(example_name: str, tech_stack: list):
-    """Update metadata.json with tech_stack"""
-    examples_dir = Path(__file__).parent.parent / "examples"
+    # Rebuild the dict so the field lands in the documented position
+    reordered = {}
+    for key, value in metadata.items():
+        reordered[key] = value
+        if key == 'jtbd':
+            reordered['language'] = 'python'
+    reordered.setdefault('language', 'python')
+
+    metadata.clear()
+    metadata.update(reordered)
+    return True
 
-    # Find the metadata.json file for this example
-    metadata_files = list(examples_dir.glob(f"*/{example_name}/metadata.json"))
 
-    if not metadata_files:
-        print(f"❌ Could not find metadata for {example_name}")
+@migration(2)
+def populate_tech_stacks(metadata: Dict[str, Any], example_name: str) -> bool:
+    """Fill an empty tech_stack from TECH_STACKS"""
+    if metadata.get('tech_stack') or example_name not in TECH_STACKS:
         return False
+    metadata['tech_stack'] = TECH_STACKS[example_name]
+    return True
 
-    metadata_file = metadata_files[0]
 
-    with open(metadata_file, 'r') as f:
-        metadata = json.load(f)
+def migrate(metadata: Dict[str, Any], example_name: str,
+            timings: Dict[str, List[float]] = None) -> List[str]:
+    """
+    Apply every pending migration to a metadata dict in place.
 
-    # Update tech_stack
-    metadata['tech_stack'] = tech_stack
+    Returns the names of the migrations that changed something. If `timings`
+    is given, time spent and touched count are accumulated per migration as
+    {name: [seconds, touched]}.
+    """
+    current = metadata.get('schema_version', 0)
+    applied = []
 
-    with open(metadata_file, 'w') as f:
-        json.dump(metadata, f, indent=2)
+    for step in MIGRATIONS:
+        if step.version <= current:
+            continue
+        start = time.perf_counter()
+        changed = step.apply(metadata, example_name)
+        if timings is not None:
+            stats = timings.setdefault(step.name, [0.0, 0])
+            stats[0] += time.perf_counter() - start
+            stats[1] += int(changed)
+        if changed:
+            applied.append(step.name)
 
-    print(f"✅ Updated {example_name}")
-    return True
+    if current < latest_schema_version():
+        metadata['schema_version'] = latest_schema_version()
+    return applied
+
+
+def index_metadata_files(catalog: ExampleCatalog) -> Dict[str, Path]:
+    """Map each example name to its metadata.json"""
+    return {
+        name: example.path / 'metadata.json'
+        for name, example in catalog.by_name.items()
+        if example.has('metadata.json')
+    }
+
+
+def dump_metadata(metadata: Dict[str, Any]) -> str:
+    """Serialize metadata the way every metadata.json in the repo is formatted"""
+    return json.dumps(metadata, indent=2, ensure_ascii=False) + '\n'
+
+
+def write_atomic(path: Path, content: str):
+    """Write a file via a temp file in the same directory and a rename"""
+    fd, tmp_path = tempfile.mkstemp(prefix=f'.{path.name}.', suffix='.tmp', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def plan_migrations(catalog: ExampleCatalog, index: Dict[str, Path],
+                    timings: Dict[str, List[float]]) -> List[Tuple[str, Path, str, str, List[str]]]:
+    """
+    Run pending migrations in memory.
+
+    Returns (example_name, path, old_text, new_text, applied) for every file
+    whose content would change.
+    """
+    changes = []
+    latest = latest_schema_version()
+
+    for example_name, path in index.items():
+        old_text = catalog[example_name].read_text('metadata.json')
+        metadata = json.loads(old_text)
+
+        # Already at the latest version: nothing to run
+        if metadata.get('schema_version', 0) >= latest:
+            continue
+
+        applied = migrate(metadata, example_name, timings)
+        new_text = dump_metadata(metadata)
+        if new_text != old_text:
+            changes.append((example_name, path, old_text, new_text, applied))
+
+    return changes
 
 
 def main():
-    print("🚀 Populating tech_stack fields based on ADK documentation...\n")
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Apply versioned migrations to example metadata.json files')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Print a unified diff of every change without writing')
+    parser.add_argument('--list', action='store_true',
+                        help='List registered migrations and exit')
+    parser.add_argument('--jobs', '-j', type=int, default=8,
+                        help='Parallel writers (default: 8)')
+    args = parser.parse_args()
+
+    if args.list:
+        for step in MIGRATIONS:
+            print(f"  {step.version:>3}  {step.name:<24} {step.description}")
+        return 0
+
+    start = time.perf_counter()
+    catalog = ExampleCatalog(EXAMPLES_DIR)
+    index = index_metadata_files(catalog)
+    scan_ms = (time.perf_counter() - start) * 1000
+
+    print(f"🔎 Indexed {len(index)} metadata files in {scan_ms:.1f} ms "
+          f"(schema version {latest_schema_version()})\n")
+
+    timings = {}
+    try:
+        changes = plan_migrations(catalog, index, timings)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"❌ Error: {e}")
+        return 1
+
+    if args.dry_run:
+        for example_name, path, old_text, new_text, applied in changes:
+            relative = path.relative_to(EXAMPLES_DIR.parent)
+            sys.stdout.writelines(difflib.unified_diff(
+                old_text.splitlines(keepends=True), new_text.splitlines(keepends=True),
+                fromfile=f"a/{relative}", tofile=f"b/{relative}"))
+    else:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+            list(executor.map(lambda change: write_atomic(change[1], change[3]), changes))
+        write_ms = (time.perf_counter() - start) * 1000
+
+        for example_name, path, _, _, applied in changes:
+            print(f"  ✓ {example_name} ({', '.join(applied) or 'schema_version'})")
 
-    updated = 0
-    failed = 0
+    print(f"\n📊 Migrations:")
+    for step in MIGRATIONS:
+        seconds, touched = timings.get(step.name, [0.0, 0])
+        print(f"   {step.version:>3} {step.name:<24} touched {touched:>3}  {seconds * 1000:7.2f} ms")
 
-    for example_name, tech_stack in TECH_STACKS.items():
-        if update_metadata(example_name, tech_stack):
-            updated += 1
-        else:
-            failed += 1
+    verb = "Would update" if args.dry_run else "Updated"
+    print(f"\n✅ {verb} {len(changes)} of {len(index)} files")
+    if not args.dry_run:
+        print(f"   Write time: {write_ms:.1f} ms")
+        if changes:
+            print(f"\nNext: Run 'python scripts/generate_site.py' to regenerate the website")
 
-    print(f"\n📊 Summary:")
-    print(f"   ✅ Updated: {updated}")
-    print(f"   ❌ Failed: {failed}")
-    print(f"\nNext: Run 'python scripts/generate_site.py' to regenerate the website")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Profile import time and memory of every example package.
+
+Each example is imported twice, the same way `adk web` loads it, each time
+in a fresh interpreter: once under `-X importtime` for wall time and the
+per-dependency breakdown, and once with tracemalloc for peak memory.
+tracemalloc hooks every allocation and slows the import down several
+times, so it never runs while time is measured. The script prints a table
+sorted by wall time, can save a JSON report, and compares against a stored
+baseline to catch an example that suddenly drags in a heavy dependency.
+
+Usage:
+    python scripts/profile_imports.py                      # table only
+    python scripts/profile_imports.py --report             # + scripts/import_profile_report.json
+    python scripts/profile_imports.py --update-baseline    # store scripts/import_baseline.json
+    python scripts/profile_imports.py --check              # fail on regressions vs. baseline
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from catalog import ExampleCatalog
+from validate_examples import Colors, print_colored
+
+
+SCRIPT_DIR = Path(__file__).parent
+DEFAULT_BASELINE = SCRIPT_DIR / 'import_baseline.json'
+DEFAULT_REPORT = SCRIPT_DIR / 'import_profile_report.json'
+
+# Markers written to stderr around the import so -X importtime lines from
+# interpreter startup are not attributed to the example
+START_MARKER = '--- profile_imports: start ---'
+END_MARKER = '--- profile_imports: end ---'
+
+# Code run in the child interpreter. Prints one JSON line on stdout.
+# argv: sys.path entry, module name, and 'time' or 'memory'
+CHILD_CODE = f'''
+import importlib, json, resource, sys, time, tracemalloc
+sys.path.insert(0, sys.argv[1])
+measure_memory = sys.argv[3] == 'memory'
+if measure_memory:
+    tracemalloc.start()
+sys.stderr.write({START_MARKER!r} + "\\n"); sys.stderr.flush()
+start = time.perf_counter()
+error = None
+try:
+    importlib.import_module(sys.argv[2])
+except BaseException as e:
+    error = f"{{type(e).__name__}}: {{e}}"
+wall = time.perf_counter() - start
+sys.stderr.write({END_MARKER!r} + "\\n"); sys.stderr.flush()
+if measure_memory:
+    result = {{"peak_kb": tracemalloc.get_traced_memory()[1] / 1024}}
+else:
+    result = {{"wall_ms": wall * 1000,
+              "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}}
+result["error"] = error
+print(json.dumps(result))
+'''
+
+
+def parse_importtime(stderr: str, example_name: str) -> Dict[str, float]:
+    """
+    Sum cumulative import time (ms) per top-level package the example imports.
+
+    Only imports between the start/end markers are counted. The example's
+    own modules are walked through, and each module they import directly is
+    attributed to its top-level package with its cumulative time, so nested
+    modules are not counted twice.
+    """
+    # -X importtime prints a module after everything it imports, indented
+    # by two spaces per level: collect each level's entries until their
+    # parent line shows up
+    pending: Dict[int, List[Tuple[str, float, list]]] = {}
+    roots = []
+    recording = False
+
+    for line in stderr.splitlines():
+        if line == START_MARKER:
+            recording = True
+            continue
+        if line == END_MARKER:
+            break
+        if not recording or not line.startswith('import time:'):
+            continue
+
+        try:
+            _, cumulative, module = line[len('import time:'):].split('|')
+            cumulative_us = int(cumulative)
+        except ValueError:
+            # Header line ("self [us] | cumulative | imported package")
+            continue
+
+        depth = (len(module) - len(module.lstrip(' '))) // 2
+        node = (module.strip(), cumulative_us / 1000, pending.pop(depth + 1, []))
+        (roots if depth == 0 else pending.setdefault(depth, [])).append(node)
+
+    totals = {}
+    stack = list(roots)
+    while stack:
+        module, cumulative_ms, children = stack.pop()
+        if module == example_name or module.startswith(example_name + '.'):
+            stack.extend(children)
+            continue
+        package = module.split('.')[0]
+        totals[package] = totals.get(package, 0.0) + cumulative_ms
+
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def run_child(example_path: Path, mode: str) -> Tuple[Optional[Dict[str, Any]], str]:
+    """
+    Import the example in a fresh interpreter.
+
+    Returns (the child's JSON result or None if it crashed, its stderr).
+    """
+    flags = ['-X', 'importtime'] if mode == 'time' else []
+    proc = subprocess.run(
+        [sys.executable, *flags, '-c', CHILD_CODE, str(example_path.parent), example_path.name, mode],
+        capture_output=True, text=True, cwd=example_path.parent,
+    )
+    try:
+        return json.loads(proc.stdout.strip().splitlines()[-1]), proc.stderr
+    except (IndexError, json.JSONDecodeError):
+        return None, f"Profiler child exited with code {proc.returncode}"
+
+
+def profile_example(example_path: Path) -> Dict[str, Any]:
+    """Profile one example package: a timed import, then a separate one for memory"""
+    profile = {
+        'name': example_path.name,
+        'category': example_path.parent.name,
+        'wall_ms': None,
+        'peak_kb': None,
+        'max_rss_kb': None,
+        'dependencies_ms': {},
+        'error': None,
+    }
+
+    timing, stderr = run_child(example_path, 'time')
+    if timing is None:
+        profile['error'] = stderr
+        return profile
+    profile.update(timing)
+    profile['dependencies_ms'] = parse_importtime(stderr, example_path.name)
+
+    memory, stderr = run_child(example_path, 'memory')
+    if memory is None:
+        profile['error'] = profile['error'] or stderr
+    else:
+        profile['peak_kb'] = memory['peak_kb']
+
+    return profile
+
+
+def find_regressions(profiles: List[Dict[str, Any]], baseline: Dict[str, Any],
+                     threshold: float, min_ms: float) -> List[str]:
+    """Compare profiles to a baseline and describe every regression found"""
+    regressions = []
+
+    for profile in profiles:
+        key = f"{profile['category']}/{profile['name']}"
+        previous = baseline.get(key)
+        if previous is None or profile['wall_ms'] is None or previous.get('wall_ms') is None:
+            continue
+
+        delta_ms = profile['wall_ms'] - previous['wall_ms']
+        if delta_ms > min_ms and profile['wall_ms'] > previous['wall_ms'] * (1 + threshold):
+            regressions.append(f"{key}: import time {previous['wall_ms']:.0f} ms → {profile['wall_ms']:.0f} ms")
+
+        if previous.get('peak_kb') and (profile['peak_kb'] or 0) > previous['peak_kb'] * (1 + threshold):
+            regressions.append(f"{key}: peak memory {previous['peak_kb']:.0f} KB → {profile['peak_kb']:.0f} KB")
+
+        new_dependencies = set(profile['dependencies_ms']) - set(previous.get('dependencies_ms', {}))
+        heavy = sorted(dep for dep in new_dependencies if profile['dependencies_ms'][dep] > min_ms)
+        if heavy:
+            regressions.append(f"{key}: new heavy dependencies: {', '.join(heavy)}")
+
+    return regressions
+
+
+def print_table(profiles: List[Dict[str, Any]], top_dependencies: int = 3):
+    """Print profiles sorted by wall time, slowest first"""
+    print(f"\n{'Example':<45} {'Wall ms':>9} {'Peak KB':>9} {'RSS KB':>9}  Top dependencies")
+    print("-" * 110)
+
+    for profile in sorted(profiles, key=lambda p: p['wall_ms'] or 0, reverse=True):
+        name = f"{profile['category']}/{profile['name']}"
+        if profile['wall_ms'] is None:
+            print_colored(f"{name:<45} {'-':>9} {'-':>9} {'-':>9}  {profile['error']}", Colors.RED)
+            continue
+
+        top = ', '.join(f"{dep} {ms:.0f}ms" for dep, ms in list(profile['dependencies_ms'].items())[:top_dependencies])
+        peak = f"{profile['peak_kb']:.0f}" if profile['peak_kb'] is not None else '-'
+        line = f"{name:<45} {profile['wall_ms']:>9.1f} {peak:>9} {profile['max_rss_kb']:>9}  {top}"
+        if profile['error']:
+            print_colored(f"{line}  ⚠️  {profile['error']}", Colors.YELLOW)
+        else:
+            print(line)
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Profile import time and memory of every example')
+    parser.add_argument('--examples', nargs='+',
+                        help='Only profile these example names')
+    parser.add_argument('--report', action='store_true',
+                        help=f'Write the JSON report to {DEFAULT_REPORT.name}')
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE,
+                        help=f'Baseline file (default: scripts/{DEFAULT_BASELINE.name})')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='Store this run as the new baseline')
+    parser.add_argument('--check', action='store_true',
+                        help='Exit with an error if any example regressed against the baseline')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Relative increase counted as a regression (default: 0.25)')
+    parser.add_argument('--min-ms', type=float, default=50.0,
+                        help='Ignore import time changes smaller than this (default: 50)')
+    args = parser.parse_args()
+
+    example_paths = [
+        example.path
+        for example in ExampleCatalog()
+        if example.has('__init__.py')
+        and (not args.examples or example.name in args.examples)
+    ]
+
+    if not example_paths:
+        print_colored("❌ No examples to profile", Colors.RED)
+        return 1
+
+    print_colored(f"⏱️  Profiling imports for {len(example_paths)} examples", Colors.BOLD)
+
+    profiles = []
+    for example_path in example_paths:
+        profiles.append(profile_example(example_path))
+        print(f"  {example_path.parent.name}/{example_path.name}", flush=True)
+
+    print_table(profiles)
+
+    if args.report:
+        with open(DEFAULT_REPORT, 'w') as f:
+            json.dump(profiles, f, indent=2)
+        print(f"\nReport saved to: {DEFAULT_REPORT}")
+
+    exit_code = 0
+    if args.baseline.exists() and not args.update_baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+
+        regressions = find_regressions(profiles, baseline, args.threshold, args.min_ms)
+        if regressions:
+            print_colored(f"\n⚠️  {len(regressions)} import regressions vs. {args.baseline.name}:", Colors.YELLOW)
+            for regression in regressions:
+                print(f"   └─ {regression}")
+            if args.check:
+                exit_code = 1
+        else:
+            print_colored(f"\n✅ No regressions vs. {args.baseline.name}", Colors.GREEN)
+    elif args.check:
+        print_colored(f"\n⚠️  No baseline at {args.baseline}; run with --update-baseline first", Colors.YELLOW)
+
+    if args.update_baseline:
+        baseline = {f"{p['category']}/{p['name']}": p for p in profiles}
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2)
+        print(f"\nBaseline saved to: {args.baseline}")
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
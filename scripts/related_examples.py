@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Compute a related-examples graph from metadata.
+
+Each example becomes a sparse TF-IDF vector over its tags, tech stack names
+and JTBD tokens, L2-normalized, so a dot product is the cosine similarity.
+Similarities come from the sparse product X·Xᵀ, computed by walking each
+feature's postings list, which only touches pairs that share a feature.
+Pairing a list costs O(df²), so only features with at most MAX_POSTINGS
+examples are paired: they find each example's candidates, and common
+features only add their share to candidates found that way. Work per
+example is then bounded by its feature count times MAX_POSTINGS, which
+keeps the graph linear in catalog size. Pairs that share nothing but
+common, low-IDF features are not suggested. Features carried by most of
+the catalog (e.g. "LLM Agent") are dropped from the vectors altogether.
+generate_site.py keeps the top-k neighbors per example and checks the
+hand-maintained `related` lists against the real catalog.
+
+Usage:
+    python scripts/related_examples.py                  # neighbors per example
+    python scripts/related_examples.py --benchmark 5000 # synthetic catalog
+"""
+
+import argparse
+import heapq
+import math
+import random
+import sys
+import time
+from typing import Dict, Any, List, Tuple
+
+from search_index import tokenize
+
+
+GRAPH_VERSION = 1
+
+# Relative weight of each feature family in an example's vector
+FEATURE_WEIGHTS = {
+    'tag': 2.0,
+    'tech': 1.5,
+    'jtbd': 1.0,
+}
+
+# Neighbors kept per example
+TOP_K = 4
+
+# Pairs less similar than this are not worth suggesting
+MIN_SIMILARITY = 0.1
+
+# Features present in more than this fraction of examples carry no signal,
+# so they are dropped
+MAX_DOCUMENT_FRACTION = 0.5
+
+# Features in more examples than this are too common to find candidate
+# pairs with (pairing a postings list is quadratic in its length)
+MAX_POSTINGS = 100
+
+
+def example_features(example: Dict[str, Any]) -> Dict[str, float]:
+    """Weighted feature counts of one example"""
+    features = {}
+
+    def add(feature: str, weight: float):
+        features[feature] = features.get(feature, 0.0) + weight
+
+    for tag in example.get('tags', []):
+        add(f"tag:{tag.lower()}", FEATURE_WEIGHTS['tag'])
+    for tech in example.get('tech_stack', []):
+        add(f"tech:{tech.get('name', '').lower()}", FEATURE_WEIGHTS['tech'])
+    for token in tokenize(example.get('jtbd', '')):
+        add(f"jtbd:{token}", FEATURE_WEIGHTS['jtbd'])
+
+    return features
+
+
+def build_vectors(examples: List[Dict[str, Any]]) -> Tuple[List[Dict[str, float]], Dict[str, List[Tuple[int, float]]]]:
+    """
+    L2-normalized TF-IDF vectors and the postings lists of their features.
+
+    Returns (vectors, postings) where postings maps feature → [(doc, weight), ...].
+    """
+    raw = [example_features(example) for example in examples]
+    doc_count = len(raw)
+
+    document_frequency = {}
+    for features in raw:
+        for feature in features:
+            document_frequency[feature] = document_frequency.get(feature, 0) + 1
+
+    max_df = max(2, int(doc_count * MAX_DOCUMENT_FRACTION))
+    vectors = []
+    postings = {}
+
+    for doc, features in enumerate(raw):
+        vector = {}
+        for feature, weight in features.items():
+            df = document_frequency[feature]
+            # A feature only one example has can't link it to anything
+            if df < 2 or df > max_df:
+                continue
+            vector[feature] = weight * math.log(doc_count / df)
+
+        norm = math.sqrt(sum(value * value for value in vector.values()))
+        if norm:
+            vector = {feature: value / norm for feature, value in vector.items()}
+            for feature, value in vector.items():
+                postings.setdefault(feature, []).append((doc, value))
+        vectors.append(vector)
+
+    return vectors, postings
+
+
+def build_related_graph(examples: List[Dict[str, Any]], k: int = TOP_K,
+                        min_similarity: float = MIN_SIMILARITY) -> Dict[str, Any]:
+    """
+    Top-k most similar examples for every example.
+
+    Returns:
+        {
+            'version': GRAPH_VERSION,
+            'k': k,
+            'neighbors': {example id: [[neighbor id, cosine], ...]},  # best first
+        }
+    """
+    vectors, postings = build_vectors(examples)
+    ids = [example['id'] for example in examples]
+
+    # Sparse X·Xᵀ over the selective features: every pair that shares one
+    scores: List[Dict[int, float]] = [{} for _ in examples]
+    common = set()
+    for feature, entries in postings.items():
+        if len(entries) > MAX_POSTINGS:
+            common.add(feature)
+            continue
+        for doc, weight in entries:
+            row = scores[doc]
+            for other, other_weight in entries:
+                if other != doc:
+                    row[other] = row.get(other, 0.0) + weight * other_weight
+
+    # Common features complete the cosine of the candidates found above
+    if common:
+        for doc, row in enumerate(scores):
+            shared = [(feature, weight) for feature, weight in vectors[doc].items() if feature in common]
+            if not shared:
+                continue
+            for other in row:
+                other_vector = vectors[other]
+                for feature, weight in shared:
+                    other_weight = other_vector.get(feature)
+                    if other_weight:
+                        row[other] += weight * other_weight
+
+    neighbors = {}
+    for doc, row in enumerate(scores):
+        best = heapq.nlargest(k, ((score, ids[other]) for other, score in row.items()
+                                  if score >= min_similarity),
+                              key=lambda item: (item[0], item[1]))
+        neighbors[ids[doc]] = [[other_id, round(score, 3)] for score, other_id in best]
+
+    return {'version': GRAPH_VERSION, 'k': k, 'neighbors': neighbors}
+
+
+def find_unknown_related(examples: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+    """Manual `related` entries that don't name an example in the catalog"""
+    known = {example['id'] for example in examples}
+    unknown = {}
+    for example in examples:
+        missing = [name for name in example.get('related', []) if name not in known]
+        if missing:
+            unknown[example['id']] = missing
+    return unknown
+
+
+def merge_related(examples: List[Dict[str, Any]], graph: Dict[str, Any]) -> Dict[str, List[str]]:
+    """
+    Final related list per example: valid manual entries first, then the
+    computed neighbors, without duplicates, at most graph['k'] long unless
+    more were listed by hand.
+    """
+    known = {example['id'] for example in examples}
+    related = {}
+
+    for example in examples:
+        chosen = [name for name in dict.fromkeys(example.get('related', []))
+                  if name in known and name != example['id']]
+        for neighbor_id, _ in graph['neighbors'].get(example['id'], []):
+            if len(chosen) >= graph['k']:
+                break
+            if neighbor_id not in chosen:
+                chosen.append(neighbor_id)
+        related[example['id']] = chosen
+
+    return related
+
+
+def synthetic_catalog(size: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """A random catalog with realistic feature counts, for benchmarking"""
+    rng = random.Random(seed)
+    # A few broad tags, like the catalog's categories, grow with the catalog
+    categories = [f"category-{i}" for i in range(5)]
+    tags = [f"tag-{i}" for i in range(max(50, size // 10))]
+    techs = [f"Tech {i}" for i in range(max(30, size // 20))]
+    words = [f"word{i}" for i in range(max(200, size // 2))]
+
+    return [
+        {
+            'id': f"example-{i}",
+            'tags': rng.sample(tags, 4) + [rng.choice(categories)],
+            'tech_stack': [{'name': name} for name in rng.sample(techs, 3)] + [{'name': 'LLM Agent'}],
+            'jtbd': 'When I build agents, I need ' + ' '.join(rng.sample(words, 6)),
+        }
+        for i in range(size)
+    ]
+
+
+def main():
+    """Print the related graph for the catalog, or benchmark a synthetic one"""
+    parser = argparse.ArgumentParser(description='Compute related examples from metadata similarity')
+    parser.add_argument('--k', type=int, default=TOP_K,
+                        help=f'Neighbors per example (default: {TOP_K})')
+    parser.add_argument('--benchmark', type=int, metavar='N',
+                        help='Time graph construction on a synthetic catalog of N examples')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        for size in sorted({args.benchmark // 4, args.benchmark // 2, args.benchmark}):
+            examples = synthetic_catalog(size)
+            start = time.perf_counter()
+            build_related_graph(examples, args.k)
+            print(f"{size:>7} examples: {(time.perf_counter() - start) * 1000:8.1f} ms")
+        return 0
+
+    from search_index import load_catalog_examples
+
+    examples = load_catalog_examples()
+    graph = build_related_graph(examples, args.k)
+
+    for example_id, neighbors in graph['neighbors'].items():
+        print(f"{example_id}")
+        for neighbor_id, score in neighbors:
+            print(f"   {score:5.3f}  {neighbor_id}")
+
+    for example_id, missing in find_unknown_related(examples).items():
+        print(f"⚠️  {example_id}: unknown related {', '.join(missing)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Build a ranked inverted search index for the website.
+
+Terms are tokenized and lightly stemmed from each example's title, JTBD,
+description, tags and tech stack names, and scored with BM25F (per-field
+weights, length-normalized). generate_site.py ships the result as a data
+shard; index.html mirrors tokenize()/stem()/query_index() so lookups cost
+O(query terms) instead of a substring scan over every card.
+
+Usage:
+    python scripts/search_index.py "search google"     # ranked results
+    python scripts/search_index.py --benchmark         # vs. substring search
+"""
+
+import argparse
+import math
+import re
+import sys
+import time
+from bisect import bisect_left
+from typing import Dict, Any, List, Tuple
+
+
+INDEX_VERSION = 1
+
+# Relative importance of each field when scoring
+FIELD_WEIGHTS = {
+    'title': 3.0,
+    'jtbd': 2.5,
+    'tags': 2.0,
+    'tech': 1.5,
+    'description': 1.0,
+}
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Words that appear in nearly every JTBD statement or query and carry no signal
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'can', 'do', 'for', 'from',
+    'how', 'i', 'i\'m', 'im', 'in', 'into', 'is', 'it', 'its', 'my', 'need', 'of',
+    'on', 'or', 'so', 'that', 'the', 'this', 'to', 'want', 'when', 'with', 'you',
+    'your',
+}
+
+# Maximum number of vocabulary terms the last query word expands to as a prefix
+MAX_PREFIX_EXPANSIONS = 20
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def stem(word: str) -> str:
+    """
+    Strip common English suffixes.
+
+    Deliberately tiny so index.html can mirror it exactly; it only has to map
+    a query and the indexed text to the same stem, not produce real words.
+    """
+    if len(word) > 4 and word.endswith('ies'):
+        word = word[:-3] + 'y'
+    elif len(word) > 4 and word.endswith(('sses', 'shes', 'ches', 'xes', 'zes')):
+        word = word[:-2]
+    elif len(word) > 3 and word.endswith('s') and not word.endswith(('ss', 'us')):
+        word = word[:-1]
+
+    if len(word) > 4 and word.endswith('ing'):
+        word = word[:-3]
+    elif len(word) > 4 and word.endswith('ied'):
+        word = word[:-3] + 'y'
+    elif len(word) > 4 and word.endswith('ed'):
+        word = word[:-2]
+
+    if len(word) > 2 and word.endswith('e'):
+        word = word[:-1]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, split on non-alphanumerics, drop stopwords and stem"""
+    return [stem(token) for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+def example_fields(example: Dict[str, Any]) -> Dict[str, str]:
+    """Text of each searchable field of an example"""
+    return {
+        'title': example.get('title', ''),
+        'jtbd': example.get('jtbd', ''),
+        'tags': ' '.join(example.get('tags', [])),
+        'tech': ' '.join(tech.get('name', '') for tech in example.get('tech_stack', [])),
+        'description': example.get('description', ''),
+    }
+
+
+def build_search_index(examples: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build a BM25F inverted index over a list of example metadata dicts.
+
+    Returns:
+        {
+            'version': INDEX_VERSION,
+            'docs': [example id, ...],
+            'terms': {term: [doc, score, doc, score, ...]},  # flattened postings
+        }
+
+    Scores are precomputed per (term, doc) and rounded, so a query only has
+    to sum the postings of its terms.
+    """
+    weighted_tfs = []
+    doc_lengths = []
+
+    for example in examples:
+        tf = {}
+        length = 0.0
+        for field, text in example_fields(example).items():
+            weight = FIELD_WEIGHTS[field]
+            for term in tokenize(text):
+                tf[term] = tf.get(term, 0.0) + weight
+                length += weight
+        weighted_tfs.append(tf)
+        doc_lengths.append(length)
+
+    doc_count = len(examples)
+    avg_length = (sum(doc_lengths) / doc_count) if doc_count else 0.0
+
+    document_frequency = {}
+    for tf in weighted_tfs:
+        for term in tf:
+            document_frequency[term] = document_frequency.get(term, 0) + 1
+
+    terms = {}
+    for doc, tf in enumerate(weighted_tfs):
+        norm = K1 * (1 - B + B * doc_lengths[doc] / avg_length) if avg_length else K1
+        for term, weight in tf.items():
+            df = document_frequency[term]
+            idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+            score = idf * weight * (K1 + 1) / (weight + norm)
+            terms.setdefault(term, []).extend([doc, round(score, 3)])
+
+    return {
+        'version': INDEX_VERSION,
+        'docs': [example['id'] for example in examples],
+        'terms': dict(sorted(terms.items())),
+    }
+
+
+def query_index(index: Dict[str, Any], query: str, vocabulary: List[str] = None) -> List[Tuple[str, float]]:
+    """
+    Rank examples for a query, best first.
+
+    Every query term must match (AND). The last term also matches as a prefix
+    so results update sensibly while the user is still typing. Pass a sorted
+    `vocabulary` (sorted(index['terms'])) to avoid re-sorting per query.
+    """
+    query_terms = tokenize(query)
+    if not query_terms:
+        return []
+
+    if vocabulary is None:
+        vocabulary = list(index['terms'])
+    terms = index['terms']
+
+    scores = None
+    for position, term in enumerate(query_terms):
+        matched = [term] if term in terms else []
+
+        if position == len(query_terms) - 1:
+            start = bisect_left(vocabulary, term)
+            for candidate in vocabulary[start:start + MAX_PREFIX_EXPANSIONS]:
+                if not candidate.startswith(term):
+                    break
+                if candidate != term:
+                    matched.append(candidate)
+
+        term_scores = {}
+        for candidate in matched:
+            postings = terms[candidate]
+            for i in range(0, len(postings), 2):
+                doc = postings[i]
+                term_scores[doc] = max(term_scores.get(doc, 0.0), postings[i + 1])
+
+        if scores is None:
+            scores = term_scores
+        else:
+            scores = {doc: score + term_scores[doc] for doc, score in scores.items() if doc in term_scores}
+        if not scores:
+            return []
+
+    docs = index['docs']
+    return sorted(((docs[doc], score) for doc, score in scores.items()), key=lambda item: (-item[1], item[0]))
+
+
+def substring_search(examples: List[Dict[str, Any]], query: str) -> List[str]:
+    """The website's previous search: a case-insensitive substring scan of every card"""
+    clean_query = re.sub(r"^(i want to|i need to|i'm trying to|how do i|how to)\s+", '',
+                         query.lower().strip())
+    if not clean_query:
+        return []
+
+    matches = []
+    for example in examples:
+        haystacks = [
+            example.get('jtbd', '').lower(),
+            example.get('title', '').lower(),
+            example.get('description', '').lower(),
+            ' '.join(example.get('tags', [])).lower(),
+        ]
+        if any(clean_query in haystack for haystack in haystacks):
+            matches.append(example['id'])
+    return matches
+
+
+BENCHMARK_QUERIES = [
+    'search google', 'deploy', 'i need to deploy my agent', 'multiple agents', 'parallel',
+    'memory', 'structured output', 'claude', 'streaming responses', 'bigquery', 'yaml',
+    'error handling', 'mcp', 'firestore', 'how to configure model temperature',
+]
+
+
+def benchmark(examples: List[Dict[str, Any]], repeat: int):
+    """Compare indexed queries against the substring scan and print the results"""
+    start = time.perf_counter()
+    index = build_search_index(examples)
+    build_ms = (time.perf_counter() - start) * 1000
+    vocabulary = list(index['terms'])
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for query in BENCHMARK_QUERIES:
+            query_index(index, query, vocabulary)
+    indexed_us = (time.perf_counter() - start) / (repeat * len(BENCHMARK_QUERIES)) * 1e6
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for query in BENCHMARK_QUERIES:
+            substring_search(examples, query)
+    substring_us = (time.perf_counter() - start) / (repeat * len(BENCHMARK_QUERIES)) * 1e6
+
+    print(f"Indexed {len(examples)} examples, {len(index['terms'])} terms in {build_ms:.1f} ms\n")
+    print(f"{'Query':<38} {'Substring':>9} {'Indexed':>8}  Top hit")
+    print("-" * 80)
+    for query in BENCHMARK_QUERIES:
+        ranked = query_index(index, query, vocabulary)
+        top = ranked[0][0] if ranked else '-'
+        print(f"{query:<38} {len(substring_search(examples, query)):>9} {len(ranked):>8}  {top}")
+
+    print(f"\nPer query: substring {substring_us:.1f} µs, indexed {indexed_us:.1f} µs "
+          f"({substring_us / indexed_us:.1f}x)")
+
+
+def load_catalog_examples() -> List[Dict[str, Any]]:
+    """Load every example's metadata the same way generate_site.py does"""
+    from catalog import ExampleCatalog
+    from generate_site import load_example_metadata
+
+    examples = []
+    for example in ExampleCatalog():
+        metadata = load_example_metadata(example)
+        if metadata:
+            examples.append(metadata)
+    return examples
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Query or benchmark the website search index')
+    parser.add_argument('query', nargs='?', help='Query to run against the index')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Compare indexed search with the old substring search')
+    parser.add_argument('--repeat', type=int, default=200,
+                        help='Benchmark iterations per query (default: 200)')
+    args = parser.parse_args()
+
+    examples = load_catalog_examples()
+
+    if args.benchmark:
+        benchmark(examples, args.repeat)
+        return 0
+
+    if not args.query:
+        parser.error('a query or --benchmark is required')
+
+    for example_id, score in query_index(build_search_index(examples), args.query):
+        print(f"{score:7.3f}  {example_id}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,18 +4,40 @@ Validate all ADK by Example examples.
 
 This script checks that all examples:
 1. Have the required files (agent.py, __init__.py, README.md)
-2. Can be imported without errors
+2. Parse cleanly (agent.py is analyzed statically, never imported)
 3. Define a root_agent
 4. Have valid metadata.json
 5. Use approved models (gemini-2.5-flash or gemini-2.5-pro)
+
+Usage:
+    python scripts/validate_examples.py            # serial
+    python scripts/validate_examples.py --jobs 8   # 8 worker threads
+    python scripts/validate_examples.py --report-format junit --report-file results.xml
+    python scripts/validate_examples.py --generate-site   # then build the website data
 """
 
 import os
 import sys
 import json
-import importlib.util
+import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Optional, Callable
+
+from agent_analysis import model_agents
+from catalog import Example, ExampleCatalog, EXAMPLES_DIR
+from metadata_schema import validate_metadata_document, format_errors
+
+
+# Bump when a check changes in a way that should invalidate cached results.
+# The validator's own source is also part of the cache key, so this is only
+# needed for behavior changes that live outside this file.
+VALIDATOR_VERSION = '2'
+
+# Persistent cache of validation results, keyed by example content
+CACHE_DIR = Path(__file__).parent.parent / '.cache' / 'validate'
 
 
 class Colors:
@@ -33,11 +55,11 @@ def print_colored(text: str, color: str = Colors.ENDC):
     print(f"{color}{text}{Colors.ENDC}")
 
 
-def validate_structure(example_path: Path) -> Tuple[bool, str]:
+def validate_structure(example: Example) -> Tuple[bool, str]:
     """Check if example has required files"""
     # Check for either agent.py OR root_agent.yaml (for YAML configs)
-    has_agent = (example_path / 'agent.py').exists()
-    has_yaml = (example_path / 'root_agent.yaml').exists()
+    has_agent = example.has('agent.py')
+    has_yaml = example.has('root_agent.yaml')
 
     if not has_agent and not has_yaml:
         return False, "Missing agent.py or root_agent.yaml"
@@ -47,7 +69,7 @@ def validate_structure(example_path: Path) -> Tuple[bool, str]:
     missing_files = []
 
     for file in required_files:
-        if not (example_path / file).exists():
+        if not example.has(file):
             missing_files.append(file)
 
     if missing_files:
@@ -56,70 +78,18 @@ def validate_structure(example_path: Path) -> Tuple[bool, str]:
     return True, "Structure OK"
 
 
-def validate_metadata(example_path: Path) -> Tuple[bool, str]:
-    """Validate metadata.json content"""
-    metadata_file = example_path / 'metadata.json'
-
+def validate_metadata(example: Example) -> Tuple[bool, str]:
+    """Validate metadata.json content against metadata_schema.json"""
     try:
-        with open(metadata_file, 'r') as f:
-            metadata = json.load(f)
-
-        required_fields = ['title', 'jtbd', 'language', 'description', 'difficulty', 'tags', 'tech_stack']
-        missing_fields = []
-
-        for field in required_fields:
-            if field not in metadata:
-                missing_fields.append(field)
-
-        if missing_fields:
-            return False, f"Metadata missing fields: {', '.join(missing_fields)}"
-
-        # Validate language
-        valid_languages = ['python', 'go', 'typescript', 'java']
-        if metadata.get('language') not in valid_languages:
-            return False, f"Invalid language: {metadata.get('language')}. Valid: {', '.join(valid_languages)}"
-
-        # Validate difficulty level
-        valid_difficulties = ['beginner', 'intermediate', 'advanced']
-        if metadata.get('difficulty') not in valid_difficulties:
-            return False, f"Invalid difficulty: {metadata.get('difficulty')}"
-
-        # Validate tech_stack structure
-        tech_stack = metadata.get('tech_stack', [])
-        if not isinstance(tech_stack, list):
-            return False, "tech_stack must be an array"
-
-        # Validate each tech_stack item
-        valid_providers = ['adk', 'gcp', 'third', 'oss']
-        for idx, tech in enumerate(tech_stack):
-            if not isinstance(tech, dict):
-                return False, f"tech_stack[{idx}] must be an object"
-
-            # Check required fields in each tech item
-            tech_required = ['name', 'provider', 'icon', 'description']
-            for tech_field in tech_required:
-                if tech_field not in tech:
-                    return False, f"tech_stack[{idx}] missing '{tech_field}'"
-
-            # Validate provider code
-            if tech.get('provider') not in valid_providers:
-                return False, f"tech_stack[{idx}] has invalid provider '{tech.get('provider')}'. Valid: {', '.join(valid_providers)}"
-
-        # Validate status if present (for coming_soon/planned examples)
-        if 'status' in metadata:
-            valid_statuses = ['ready', 'coming_soon', 'planned']
-            if metadata.get('status') not in valid_statuses:
-                return False, f"Invalid status: {metadata.get('status')}. Valid: {', '.join(valid_statuses)}"
-
-            # If status is coming_soon, recommend priority and sprint
-            if metadata.get('status') in ['coming_soon', 'planned']:
-                if 'priority' not in metadata or 'sprint' not in metadata:
-                    # This is a warning, not a failure
-                    pass
-
-        tech_count = len(tech_stack)
+        metadata = example.metadata
+
+        errors = validate_metadata_document(metadata)
+        if errors:
+            return False, f"Metadata invalid: {format_errors(errors)}"
+
+        tech_count = len(metadata['tech_stack'])
         status = metadata.get('status', 'ready')
-        language = metadata.get('language', 'unknown')
+        language = metadata['language']
         return True, f"Metadata valid (lang: {language}, tech_stack: {tech_count}, status: {status})"
 
     except json.JSONDecodeError as e:
@@ -128,20 +98,16 @@ def validate_metadata(example_path: Path) -> Tuple[bool, str]:
         return False, f"Error reading metadata: {e}"
 
 
-def validate_agent_code(example_path: Path) -> Tuple[bool, str]:
+def validate_agent_code(example: Example) -> Tuple[bool, str]:
     """Validate the agent.py or root_agent.yaml file"""
-    agent_file = example_path / 'agent.py'
-    yaml_file = example_path / 'root_agent.yaml'
-
     # Check if this is a YAML-based agent
-    if yaml_file.exists() and not agent_file.exists():
+    if example.has('root_agent.yaml') and not example.has('agent.py'):
         # Validate YAML config
         try:
             # Try to import yaml, but if it's not available (CI environment), do basic validation
             try:
                 import yaml
-                with open(yaml_file, 'r') as f:
-                    config = yaml.safe_load(f)
+                config = yaml.safe_load(example.read_text('root_agent.yaml'))
 
                 # Check required fields
                 if 'name' not in config:
@@ -157,8 +123,7 @@ def validate_agent_code(example_path: Path) -> Tuple[bool, str]:
                 return True, f"YAML config valid (model: {config.get('model')})"
             except ImportError:
                 # If yaml module not available (CI), do basic text validation
-                with open(yaml_file, 'r') as f:
-                    content = f.read()
+                content = example.read_text('root_agent.yaml')
 
                 # Basic checks without parsing
                 if 'name:' not in content:
@@ -175,94 +140,48 @@ def validate_agent_code(example_path: Path) -> Tuple[bool, str]:
         except Exception as e:
             return False, f"Error validating YAML: {e}"
 
-    # Check if we're running in CI environment
-    is_ci = os.environ.get('CI') == 'true' or os.environ.get('GITHUB_ACTIONS') == 'true'
-
     try:
-        # Read the agent.py file
-        with open(agent_file, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-
-        # Check for root_agent definition
-        if 'root_agent' not in content:
-            return False, "No 'root_agent' defined"
-
-        # Check for correct model usage
-        approved_models = ['gemini-2.5-flash', 'gemini-2.5-pro']
-        model_found = False
-        model_used = None
-
-        for model in approved_models:
-            if f'model="{model}"' in content or f"model='{model}'" in content:
-                model_found = True
-                model_used = model
-                break
-
-        # Special cases for alternative models (only in specific examples)
-        alt_model_examples = ['use-claude', 'use-vertex-ai', 'local-ollama', 'use-openai']
-        example_name = example_path.name
-
-        if example_name in alt_model_examples:
-            # These examples are allowed to use alternative models
-            model_found = True
-            model_used = "alternative (allowed)"
-        elif not model_found:
-            # Check if it's using an unapproved model
-            if 'model=' in content:
-                # Extract the model name for reporting
-                import re
-                match = re.search(r'model=["\']([^"\']+)["\']', content)
-                if match:
-                    wrong_model = match.group(1)
-                    return False, f"Using unapproved model: {wrong_model}. Use gemini-2.5-flash or gemini-2.5-pro"
-                else:
-                    return False, "Model specified but couldn't determine which one"
-            else:
-                return False, "No model specified"
+        analysis = example.agent_analysis
+    except SyntaxError as e:
+        return False, f"Syntax error in agent.py (line {e.lineno}): {e.msg}"
+    except Exception as e:
+        return False, f"Error validating agent: {e}"
 
-        # In CI environments, skip import validation since google-adk won't be installed
-        if is_ci:
-            # Just check the code structure without importing
-            return True, f"Code structure valid (CI mode, model: {model_used})"
+    # Check for root_agent definition
+    if not analysis['root_agent_bound']:
+        return False, "No 'root_agent' defined"
 
-        # Try to import and validate (only in local environments)
-        spec = importlib.util.spec_from_file_location("agent", agent_file)
-        if spec is None:
-            return False, "Could not load agent module"
+    if not analysis['agents']:
+        return False, "No agents constructed in agent.py"
 
-        module = importlib.util.module_from_spec(spec)
+    # Special cases for alternative models (only in specific examples)
+    alt_model_examples = ['use-claude', 'use-vertex-ai', 'local-ollama', 'use-openai']
+    if example.name in alt_model_examples:
+        return True, f"Agent valid ({len(analysis['agents'])} agents, model: alternative (allowed))"
 
-        try:
-            spec.loader.exec_module(module)
-        except ImportError as e:
-            # This is expected if google.adk is not installed
-            # Check for various forms of the import error
-            error_str = str(e).lower()
-            if "google" in error_str or "adk" in error_str:
-                # This is expected in CI environments where google-adk isn't installed
-                return True, f"Code structure valid (model: {model_used})"
-            else:
-                return False, f"Import error: {e}"
-        except Exception as e:
-            return False, f"Error loading agent: {e}"
+    # Check for correct model usage on every agent that talks to a model
+    approved_models = ['gemini-2.5-flash', 'gemini-2.5-pro']
+    models_used = []
+    for agent in model_agents(analysis):
+        if 'model' not in agent:
+            continue
+        label = agent.get('name') or agent['variable'] or f"line {agent['line']}"
+        if agent['model'] not in approved_models:
+            return False, (f"Agent '{label}' using unapproved model: {agent['model']}. "
+                           f"Use gemini-2.5-flash or gemini-2.5-pro")
+        models_used.append(agent['model'])
 
-        # Check if root_agent exists and is the right type
-        if not hasattr(module, 'root_agent'):
-            return False, "root_agent not found after import"
+    if not models_used:
+        return False, "No model specified"
 
-        return True, f"Agent valid (model: {model_used})"
+    model_used = ', '.join(sorted(set(models_used)))
+    return True, f"Agent valid ({len(analysis['agents'])} agents, model: {model_used})"
 
-    except Exception as e:
-        return False, f"Error validating agent: {e}"
 
-
-def validate_readme(example_path: Path) -> Tuple[bool, str]:
+def validate_readme(example: Example) -> Tuple[bool, str]:
     """Validate README.md content"""
-    readme_file = example_path / 'README.md'
-
     try:
-        with open(readme_file, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        content = example.readme
 
         # Check for essential sections (be flexible with emojis and encoding)
         required_sections = ['Quick Start', 'The Problem', 'The Solution']
@@ -289,25 +208,20 @@ def validate_readme(example_path: Path) -> Tuple[bool, str]:
         return False, f"Error reading README: {e}"
 
 
-def validate_example(example_path: Path) -> Dict[str, Any]:
+def validate_example(example: Example) -> Dict[str, Any]:
     """Run all validations for a single example"""
+    start = time.perf_counter()
     results = {
-        'name': example_path.name,
-        'path': str(example_path),
+        'name': example.name,
+        'category': example.category,
+        'path': str(example.path),
         'passed': True,
+        'cached': False,
         'checks': {}
     }
 
     # Check if this is a coming_soon example
-    metadata_file = example_path / 'metadata.json'
-    is_coming_soon = False
-    if metadata_file.exists():
-        try:
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
-                is_coming_soon = metadata.get('status') == 'coming_soon'
-        except:
-            pass
+    is_coming_soon = example.status == 'coming_soon'
 
     # Run all validation checks
     checks = [
@@ -321,75 +235,299 @@ def validate_example(example_path: Path) -> Dict[str, Any]:
         checks.append(('readme', validate_readme))
 
     for check_name, check_func in checks:
-        passed, message = check_func(example_path)
+        check_start = time.perf_counter()
+        passed, message = check_func(example)
         results['checks'][check_name] = {
             'passed': passed,
-            'message': message
+            'message': message,
+            'duration_ms': round((time.perf_counter() - check_start) * 1000, 3)
         }
         if not passed:
             results['passed'] = False
 
+    results['duration_ms'] = round((time.perf_counter() - start) * 1000, 3)
     return results
 
 
+class JsonlReportWriter:
+    """Write one JSON line per example, flushed as soon as it's validated"""
+
+    def __init__(self, report_file: Path):
+        self.file = open(report_file, 'w', encoding='utf-8')
+
+    def write(self, results: Dict[str, Any]):
+        self.file.write(json.dumps(results, ensure_ascii=False) + '\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class JUnitReportWriter:
+    """
+    Write JUnit XML incrementally: one <testsuite> per example, one
+    <testcase> per check with its duration. Everything written before an
+    interruption stays readable; only the closing tag is missing.
+    """
+
+    def __init__(self, report_file: Path):
+        self.file = open(report_file, 'w', encoding='utf-8')
+        self.file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        self.file.write('<testsuites name="validate_examples">\n')
+        self.file.flush()
+
+    def write(self, results: Dict[str, Any]):
+        from xml.sax.saxutils import quoteattr
+
+        checks = results['checks']
+        failures = sum(1 for check in checks.values() if not check['passed'])
+        suite_name = f"{results.get('category', '')}/{results['name']}"
+
+        lines = [
+            f'  <testsuite name={quoteattr(suite_name)} tests="{len(checks)}" failures="{failures}" '
+            f'time="{results.get("duration_ms", 0) / 1000:.6f}">'
+        ]
+        for check_name, check in checks.items():
+            case = (f'    <testcase classname={quoteattr(suite_name)} name={quoteattr(check_name)} '
+                    f'time="{check.get("duration_ms", 0) / 1000:.6f}"')
+            if check['passed']:
+                lines.append(case + '/>')
+            else:
+                lines.append(case + '>')
+                lines.append(f'      <failure message={quoteattr(check["message"])}/>')
+                lines.append('    </testcase>')
+        lines.append('  </testsuite>')
+
+        self.file.write('\n'.join(lines) + '\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.write('</testsuites>\n')
+        self.file.close()
+
+
+REPORT_WRITERS = {
+    'jsonl': (JsonlReportWriter, 'validation_report.jsonl'),
+    'junit': (JUnitReportWriter, 'validation_report.xml'),
+}
+
+
+@lru_cache(maxsize=None)
+def validator_digest() -> bytes:
+    """Hash of the validator version, this script and the modules its checks use (read once per run)"""
+    digest = hashlib.sha256()
+    digest.update(f"v{VALIDATOR_VERSION}\0".encode())
+    digest.update(Path(__file__).read_bytes())
+    for dependency in ('agent_analysis.py', 'catalog.py', 'metadata_schema.py', 'metadata_schema.json'):
+        digest.update((Path(__file__).parent / dependency).read_bytes())
+    return digest.digest()
+
+
+def compute_cache_key(example: Example) -> str:
+    """
+    Hash an example directory's files together with the validator digest.
+
+    Any edit to a file in the example (or to this script or the modules
+    its checks use) yields a new key, so stale results are never served.
+    """
+    digest = hashlib.sha256(validator_digest())
+
+    # The catalog memoizes these reads, so the checks reuse them on a miss
+    for file_name in example.files:
+        digest.update(file_name.encode() + b'\0')
+        digest.update(example.read_bytes(file_name))
+        digest.update(b'\0')
+
+    return digest.hexdigest()
+
+
+def load_cached_result(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Load a cached validation result, or None on a miss"""
+    cache_file = CACHE_DIR / f"{cache_key}.json"
+    try:
+        with open(cache_file, 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def store_cached_result(cache_key: str, results: Dict[str, Any]):
+    """Atomically write a validation result to the cache"""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_file = CACHE_DIR / f"{cache_key}.json"
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_file, 'w') as f:
+        json.dump(results, f)
+    os.replace(tmp_file, cache_file)
+
+
+def print_example_result(results: Dict[str, Any], verbose: bool = False):
+    """Print the pass/fail line and check details for one example"""
+    if results['passed']:
+        print_colored(f"  ✅ {results['name']}", Colors.GREEN)
+    else:
+        print_colored(f"  ❌ {results['name']}", Colors.RED)
+
+    # Show details for failed checks
+    for check_name, check_result in results['checks'].items():
+        if not check_result['passed'] or verbose:
+            print(f"     └─ {check_name}: {check_result['message']}")
+
+
+def validate_examples_parallel(examples: List[Example], jobs: int,
+                               on_result: Optional[Callable[[Dict[str, Any]], None]] = None
+                               ) -> Dict[str, Dict[str, Any]]:
+    """
+    Validate examples in a thread pool, streaming results as they finish.
+
+    `on_result` is called with each example's results in completion order.
+    Results are keyed by Example.key.
+
+    The checks only read files and parse agent.py statically, never
+    importing it, so threads are enough. They share the catalog's file
+    reads and start instantly, where worker processes cost more to spawn
+    than the checks themselves.
+    """
+    results_by_key = {}
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(validate_example, example): example for example in examples}
+
+        for done, future in enumerate(as_completed(futures), start=1):
+            example = futures[future]
+            try:
+                results = future.result()
+            except Exception as e:
+                # A failing check must not take the whole run down
+                results = {
+                    'name': example.name,
+                    'category': example.category,
+                    'path': str(example.path),
+                    'passed': False,
+                    'cached': False,
+                    'checks': {'worker': {'passed': False, 'message': f"Validation worker failed: {e}"}}
+                }
+            results_by_key[example.key] = results
+            if on_result:
+                on_result(results)
+
+            icon = '✅' if results['passed'] else '❌'
+            print(f"  [{done}/{len(examples)}] {icon} {example.key}", flush=True)
+
+    return results_by_key
+
+
 def main():
     """Main validation function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Validate all ADK by Example examples')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Show messages for passing checks too')
+    parser.add_argument('--report', action='store_true',
+                        help='Write a report to scripts/ (validation_report.json by default)')
+    parser.add_argument('--report-format', choices=['json', 'jsonl', 'junit'],
+                        help='Report format; jsonl and junit are streamed per example (implies --report)')
+    parser.add_argument('--report-file', type=Path,
+                        help='Report path (default: scripts/validation_report.<ext>)')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Validate examples in N worker threads (default: 1, serial)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Ignore and do not update the .cache/validate result cache')
+    parser.add_argument('--generate-site', action='store_true',
+                        help='If everything passes, regenerate the website data from the same file reads')
+    args = parser.parse_args()
+
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+
     print_colored("\n" + "="*60, Colors.BOLD)
     print_colored("ADK by Example - Validation Script", Colors.BOLD)
     print_colored("="*60 + "\n", Colors.BOLD)
 
     # Find examples directory
     script_dir = Path(__file__).parent
-    examples_dir = script_dir.parent / 'examples'
 
-    if not examples_dir.exists():
-        print_colored(f"❌ Examples directory not found: {examples_dir}", Colors.RED)
+    if not EXAMPLES_DIR.exists():
+        print_colored(f"❌ Examples directory not found: {EXAMPLES_DIR}", Colors.RED)
         sys.exit(1)
 
-    # Collect all examples
-    all_examples = []
-    categories = sorted([d for d in examples_dir.iterdir() if d.is_dir() and not d.name.startswith('_')])
-
-    for category in categories:
-        examples = sorted([d for d in category.iterdir() if d.is_dir()])
-        all_examples.extend(examples)
+    # Scan all examples once; file contents are read on demand and shared
+    catalog = ExampleCatalog(EXAMPLES_DIR)
 
-    if not all_examples:
+    if not len(catalog):
         print_colored("❌ No examples found!", Colors.RED)
         sys.exit(1)
 
-    print(f"Found {len(all_examples)} examples in {len(categories)} categories\n")
+    print(f"Found {len(catalog)} examples in {len(catalog.categories)} categories\n")
+
+    # Streaming report formats write each example as soon as its results are known
+    report_format = args.report_format or ('json' if args.report else None)
+    report_file = None
+    report_writer = None
+    if report_format:
+        default_name = REPORT_WRITERS[report_format][1] if report_format in REPORT_WRITERS else 'validation_report.json'
+        report_file = args.report_file or script_dir / default_name
+    if report_format in REPORT_WRITERS:
+        report_writer = REPORT_WRITERS[report_format][0](report_file)
+
+    reported = set()
+
+    def report_result(results: Dict[str, Any]):
+        if report_writer and results['path'] not in reported:
+            reported.add(results['path'])
+            report_writer.write(results)
+
+    # Serve unchanged examples from the cache; only dirty ones are re-checked
+    results_by_key = {}
+    cache_keys = {}
+    if not args.no_cache:
+        for example in catalog:
+            lookup_start = time.perf_counter()
+            cache_keys[example.key] = compute_cache_key(example)
+            cached = load_cached_result(cache_keys[example.key])
+            if cached is not None:
+                # Report what this run spent, not the timings of the run that filled the cache
+                for check_result in cached['checks'].values():
+                    check_result.pop('duration_ms', None)
+                cached['path'] = str(example.path)
+                cached['cached'] = True
+                cached['duration_ms'] = round((time.perf_counter() - lookup_start) * 1000, 3)
+                results_by_key[example.key] = cached
+                report_result(cached)
+
+    cache_hits = len(results_by_key)
+    pending = [example for example in catalog if example.key not in results_by_key]
+    pending_keys = {example.key for example in pending}
+
+    # In parallel mode, validate everything up front and print grouped results afterwards
+    if args.jobs > 1 and pending:
+        print_colored(f"⚡ Validating {len(pending)} examples with {args.jobs} workers", Colors.BLUE)
+        results_by_key.update(validate_examples_parallel(pending, args.jobs, on_result=report_result))
 
     # Validate each example
     all_results = []
     passed_count = 0
     failed_count = 0
 
-    for category in categories:
-        print_colored(f"\n📁 Category: {category.name}", Colors.BLUE)
+    for category, examples in catalog.by_category.items():
+        print_colored(f"\n📁 Category: {category}", Colors.BLUE)
         print("-" * 40)
 
-        examples = sorted([d for d in category.iterdir() if d.is_dir()])
-
-        for example_path in examples:
-            results = validate_example(example_path)
+        for example in examples:
+            results = results_by_key.get(example.key) or validate_example(example)
             all_results.append(results)
+            report_result(results)
+
+            if example.key in cache_keys and example.key in pending_keys:
+                store_cached_result(cache_keys[example.key], results)
 
-            # Print results
+            print_example_result(results, verbose=args.verbose)
             if results['passed']:
-                print_colored(f"  ✅ {results['name']}", Colors.GREEN)
                 passed_count += 1
             else:
-                print_colored(f"  ❌ {results['name']}", Colors.RED)
                 failed_count += 1
 
-            # Show details for failed checks
-            for check_name, check_result in results['checks'].items():
-                if not check_result['passed']:
-                    print(f"     └─ {check_name}: {check_result['message']}")
-                elif '--verbose' in sys.argv:
-                    print(f"     └─ {check_name}: {check_result['message']}")
-
     # Summary
     print_colored("\n" + "="*60, Colors.BOLD)
     print_colored("Validation Summary", Colors.BOLD)
@@ -405,19 +543,44 @@ def main():
 
     print(f"\nPass Rate: {pass_rate:.1f}%")
 
-    if failed_count > 0:
-        print_colored("\n⚠️  Some examples have issues. Please fix them before committing.", Colors.YELLOW)
-        sys.exit(1)
+    if args.no_cache:
+        print("Cache: disabled")
     else:
-        print_colored("\n🎉 All examples validated successfully!", Colors.GREEN)
+        print(f"Cache: {cache_hits} hits, {len(pending)} misses")
+
+    # Time spent per check across freshly validated examples, slowest first
+    check_totals = {}
+    for results in all_results:
+        if results['cached']:
+            continue
+        for check_name, check_result in results['checks'].items():
+            check_totals[check_name] = check_totals.get(check_name, 0.0) + check_result.get('duration_ms', 0.0)
+    if check_totals:
+        timings = sorted(check_totals.items(), key=lambda item: item[1], reverse=True)
+        print("Check time: " + ", ".join(f"{name} {ms:.1f}ms" for name, ms in timings))
 
     # Optional: Generate report file
-    if '--report' in sys.argv:
-        report_file = script_dir / 'validation_report.json'
+    if report_writer:
+        report_writer.close()
+    elif report_file:
         with open(report_file, 'w') as f:
             json.dump(all_results, f, indent=2)
+    if report_file:
         print(f"\nReport saved to: {report_file}")
 
+    if failed_count > 0:
+        print_colored("\n⚠️  Some examples have issues. Please fix them before committing.", Colors.YELLOW)
+        sys.exit(1)
+    else:
+        print_colored("\n🎉 All examples validated successfully!", Colors.GREEN)
+
+    if args.generate_site:
+        from generate_site import generate_examples_json
+
+        print_colored("\n🔄 Regenerating website data", Colors.BLUE)
+        if not generate_examples_json(catalog=catalog):
+            sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file